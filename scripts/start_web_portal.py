@@ -23,6 +23,7 @@ def main():
     parser.add_argument('--host', default='0.0.0.0', help='Host to bind to (default: 0.0.0.0)')
     parser.add_argument('--port', type=int, default=8080, help='Port to bind to (default: 8080)')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
+    parser.add_argument('--threads', type=int, default=8, help='Number of server worker threads (default: 8)')
     parser.add_argument('--config', default='config/skyguard.yaml', help='Configuration file path')
     parser.add_argument('--install-deps', action='store_true', help='Install web dependencies')
     
@@ -64,7 +65,7 @@ def main():
     
     try:
         portal = SkyGuardWebPortal(args.config)
-        portal.run(host=args.host, port=args.port, debug=args.debug)
+        portal.run(host=args.host, port=args.port, debug=args.debug, threads=args.threads)
     except KeyboardInterrupt:
         print("\n🛑 Web portal stopped by user")
     except Exception as e:
@@ -153,6 +153,7 @@ def process_video(
     save_crops: bool = False,
     save_segmented_images: bool = False,
     save_snapshots: bool = False,
+    batch_size: int = 8,
 ) -> dict:
     cap = cv2.VideoCapture(str(video_path))
     if not cap.isOpened():
@@ -196,100 +197,106 @@ def process_video(
     try:
         frame_idx = 0
         while True:
-            ok, frame = cap.read()
-            if not ok:
+            # Read a batch of frames so the model runs once per batch
+            frames = []
+            while len(frames) < batch_size:
+                ok, frame = cap.read()
+                if not ok:
+                    break
+                frames.append(frame)
+            if not frames:
                 break
-            stats["frames"] += 1
-            frame_idx += 1
 
-            dets = detector.detect(frame)
-            
-            # Filter to only high-confidence detections (>= 0.50) for species classification
-            # Only these will be sent to species classification
-            high_conf_dets_for_species = [
-                d for d in (dets or [])
-                if float(d.get("confidence", 0.0)) >= 0.50
-            ]
+            for frame, dets in zip(frames, detector.detect_batch(frames)):
+                stats["frames"] += 1
+                frame_idx += 1
+                
+                # Filter to only high-confidence detections (>= 0.50) for species classification
+                # Only these will be sent to species classification
+                high_conf_dets_for_species = [
+                    d for d in (dets or [])
+                    if float(d.get("confidence", 0.0)) >= 0.50
+                ]
             
-            # Filter to only detections with species confidence >= 0.60
-            # Only save segmented images if species is identified with >= 0.60 confidence
-            dets_with_species = [
-                d for d in high_conf_dets_for_species
-                if d.get("species") is not None 
-                and d.get("species_confidence") is not None
-                and float(d.get("species_confidence", 0.0)) >= 0.60
-            ]
+                # Filter to only detections with species confidence >= 0.60
+                # Only save segmented images if species is identified with >= 0.60 confidence
+                dets_with_species = [
+                    d for d in high_conf_dets_for_species
+                    if d.get("species") is not None 
+                    and d.get("species_confidence") is not None
+                    and float(d.get("species_confidence", 0.0)) >= 0.60
+                ]
             
-            # Track all detections for stats (using 0.80 threshold for stats)
-            high_conf_dets = [
-                d for d in (dets or [])
-                if float(d.get("confidence", 0.0)) >= 0.80
-            ]
-            if high_conf_dets:
-                stats["detections"] += 1
-                stats["max_confidence"] = max(
-                    stats["max_confidence"],
-                    max(float(d.get("confidence", 0.0)) for d in high_conf_dets),
-                )
-
-            # Save detailed detection records and optional crops
-            if (save_json or save_crops) and dets:
-                for i, d in enumerate(dets):
-                    rec = {
-                        "frame": frame_idx,
-                        "bbox": d.get("bbox"),
-                        "confidence": float(d.get("confidence", 0.0)),
-                        "class_name": d.get("class_name"),
-                        "class_id": d.get("class_id"),
-                        "species": d.get("species"),
-                        "species_confidence": d.get("species_confidence"),
-                        "polygon": d.get("polygon"),
-                    }
-                    if save_json:
-                        detections_log.append(rec)
-                    if save_crops and rec["bbox"] and len(rec["bbox"]) == 4:
-                        x1, y1, x2, y2 = map(int, rec["bbox"])
-                        x1 = max(0, x1); y1 = max(0, y1)
-                        x2 = min(width - 1, x2); y2 = min(height - 1, y2)
-                        if x2 > x1 and y2 > y1:
-                            crop = frame[y1:y2, x1:x2]
-                            crop_name = f"{frame_idx:06d}_{i}_{rec['class_name'] or 'bird'}_{rec['confidence']:.2f}.jpg"
-                            cv2.imwrite(str(crops_root / crop_name), crop)
+                # Track all detections for stats (using 0.80 threshold for stats)
+                high_conf_dets = [
+                    d for d in (dets or [])
+                    if float(d.get("confidence", 0.0)) >= 0.80
+                ]
+                if high_conf_dets:
+                    stats["detections"] += 1
+                    stats["max_confidence"] = max(
+                        stats["max_confidence"],
+                        max(float(d.get("confidence", 0.0)) for d in high_conf_dets),
+                    )
+
+                # Save detailed detection records and optional crops
+                if (save_json or save_crops) and dets:
+                    for i, d in enumerate(dets):
+                        rec = {
+                            "frame": frame_idx,
+                            "bbox": d.get("bbox"),
+                            "confidence": float(d.get("confidence", 0.0)),
+                            "class_name": d.get("class_name"),
+                            "class_id": d.get("class_id"),
+                            "species": d.get("species"),
+                            "species_confidence": d.get("species_confidence"),
+                            "polygon": d.get("polygon"),
+                        }
+                        if save_json:
+                            detections_log.append(rec)
+                        if save_crops and rec["bbox"] and len(rec["bbox"]) == 4:
+                            x1, y1, x2, y2 = map(int, rec["bbox"])
+                            x1 = max(0, x1); y1 = max(0, y1)
+                            x2 = min(width - 1, x2); y2 = min(height - 1, y2)
+                            if x2 > x1 and y2 > y1:
+                                crop = frame[y1:y2, x1:x2]
+                                crop_name = f"{frame_idx:06d}_{i}_{rec['class_name'] or 'bird'}_{rec['confidence']:.2f}.jpg"
+                                cv2.imwrite(str(crops_root / crop_name), crop)
             
-            # Save segmented images ONLY for detections with:
-            # - Bird confidence >= 0.50 (already filtered above)
-            # - Species confidence >= 0.60
-            # - Species name present
-            if save_segmented_images and dets_with_species:
-                segmented_frame = draw_segmented_frame(frame.copy(), dets_with_species)
+                # Save segmented images ONLY for detections with:
+                # - Bird confidence >= 0.50 (already filtered above)
+                # - Species confidence >= 0.60
+                # - Species name present
+                if save_segmented_images and dets_with_species:
+                    segmented_frame = draw_segmented_frame(frame.copy(), dets_with_species)
                 
-                # Build filename with species name
-                # If multiple detections, use the first one's species
-                if len(dets_with_species) == 1:
-                    det = dets_with_species[0]
-                    species = det.get("species")
-                    species_conf = float(det.get("species_confidence", 0.0))
-                    # Sanitize species name for filename (replace spaces/special chars)
-                    species_safe = species.replace(" ", "_").replace("/", "_").replace("(", "").replace(")", "").replace(",", "")
-                    segmented_name = f"{frame_idx:06d}_{species_safe}_{species_conf:.2f}_segmented.jpg"
-                else:
-                    # Multiple detections - use first species
-                    det = dets_with_species[0]
-                    species = det.get("species")
-                    species_conf = float(det.get("species_confidence", 0.0))
-                    species_safe = species.replace(" ", "_").replace("/", "_").replace("(", "").replace(")", "").replace(",", "")
-                    segmented_name = f"{frame_idx:06d}_{species_safe}_{species_conf:.2f}_multi_segmented.jpg"
+                    # Build filename with species name
+                    # If multiple detections, use the first one's species
+                    if len(dets_with_species) == 1:
+                        det = dets_with_species[0]
+                        species = det.get("species")
+                        species_conf = float(det.get("species_confidence", 0.0))
+                        # Sanitize species name for filename (replace spaces/special chars)
+                        species_safe = species.replace(" ", "_").replace("/", "_").replace("(", "").replace(")", "").replace(",", "")
+                        segmented_name = f"{frame_idx:06d}_{species_safe}_{species_conf:.2f}_segmented.jpg"
+                    else:
+                        # Multiple detections - use first species
+                        det = dets_with_species[0]
+                        species = det.get("species")
+                        species_conf = float(det.get("species_confidence", 0.0))
+                        species_safe = species.replace(" ", "_").replace("/", "_").replace("(", "").replace(")", "").replace(",", "")
+                        segmented_name = f"{frame_idx:06d}_{species_safe}_{species_conf:.2f}_multi_segmented.jpg"
                 
-                cv2.imwrite(str(segmented_root / segmented_name), segmented_frame)
+                    cv2.imwrite(str(segmented_root / segmented_name), segmented_frame)
 
-            # Save full frame snapshots when detections are found
-            if save_snapshots and dets:
-                snapshot_name = f"{frame_idx:06d}_snapshot.jpg"
-                cv2.imwrite(str(snapshots_root / snapshot_name), frame)
+                # Save full frame snapshots when detections are found
+                if save_snapshots and dets:
+                    snapshot_name = f"{frame_idx:06d}_snapshot.jpg"
+                    cv2.imwrite(str(snapshots_root / snapshot_name), frame)
 
-            if writer is not None:
-                annotated = annotate_frame(frame.copy(), dets)
-                writer.write(annotated)
+                if writer is not None:
+                    annotated = annotate_frame(frame.copy(), dets)
+                    writer.write(annotated)
     finally:
         stats["duration_s"] = round(time.time() - start, 3)
         cap.release()
@@ -382,6 +389,12 @@ def main():
         type=str,
         help="Classifier input size as WxH (e.g., 224x224)",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=8,
+        help="Frames per detector call",
+    )
     args = parser.parse_args()
 
     input_dir = Path(args.input_dir)
@@ -448,6 +461,7 @@ def main():
             save_crops=args.save_crops,
             save_segmented_images=args.save_segmented_images,
             save_snapshots=args.save_snapshots,
+            batch_size=max(1, args.batch_size),
         )
         all_stats.append(stats)
         print(
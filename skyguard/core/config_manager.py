@@ -4,22 +4,184 @@ Configuration Manager for SkyGuard System
 Handles loading and managing configuration settings from YAML files.
 """
 
+import copy
+import hashlib
+import json
+import os
+import stat
+import threading
 import yaml
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+# orjson is optional: it reads and writes the parse cache faster, and the
+# stdlib json module handles the same files without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# libyaml's C parser/emitter is several times faster than the pure-Python
+# implementation; fall back to it when PyYAML was built without libyaml
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# Parsed configs keyed by absolute path -> ((st_mtime_ns, st_size, st_ino), config).
+# Atomic editor saves (write + os.replace) change the inode, so they are caught too.
+_CACHE: Dict[str, Tuple[Tuple[int, int, int], Any]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+# Parse caches live under data/, not next to the YAML, and hold plain JSON
+# so that reading one can never execute code. Only managers created with
+# disk_cache=True (the web portal) write them.
+_PARSE_CACHE_DIR = Path(__file__).parent.parent.parent / 'data' / 'config_cache'
+
+
+def _parse_cache_path(path: Path) -> Path:
+    """Get the on-disk parse cache for a YAML file.
+    
+    The name carries a hash of the absolute path, so same-named files in
+    different directories get separate caches.
+    """
+    digest = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()[:16]
+    return _PARSE_CACHE_DIR / f"{path.name}.{digest}.json"
+
+
+def _read_parse_cache(path: Path, signature: Tuple[int, int, int]) -> Any:
+    """Read a JSON parse of a YAML file written by an earlier process.
+    
+    Args:
+        path: Path to the YAML file
+        signature: Current ``(st_mtime_ns, st_size, st_ino)`` of the YAML file
+        
+    Returns:
+        The cached document, or None if there is no cache for this version
+    """
+    try:
+        with open(_parse_cache_path(path), 'rb') as file:
+            data = file.read()
+        cached = orjson.loads(data) if orjson is not None else json.loads(data)
+        cached_signature, document = cached['signature'], cached['document']
+    except Exception:
+        # Missing, unreadable or corrupt cache: fall back to parsing the YAML
+        return None
+    return document if tuple(cached_signature) == signature else None
+
+
+def _write_parse_cache(path: Path, signature: Tuple[int, int, int], document: Any, mode: int) -> None:
+    """Store a YAML parse as JSON so the next process can skip parsing.
+    
+    Best effort: a read-only data directory just means no disk cache.
+    Documents that do not survive a JSON round trip unchanged (dates,
+    non-string keys, NaN) are not cached. The config holds credentials
+    (SMTP passwords, webhook URLs), so the cache file gets the YAML file's
+    permission bits rather than the umask default.
+    
+    Args:
+        path: Path to the YAML file
+        signature: ``(st_mtime_ns, st_size, st_ino)`` of the parsed version
+        document: Parsed YAML document
+        mode: Permission bits of the YAML file
+    """
+    payload = {'signature': list(signature), 'document': document}
+    try:
+        if orjson is not None:
+            data = orjson.dumps(payload)
+            restored = orjson.loads(data)
+        else:
+            data = json.dumps(payload).encode('utf-8')
+            restored = json.loads(data)
+    except (TypeError, ValueError):
+        return
+    if restored['document'] != document:
+        return
+    
+    cache_path = _parse_cache_path(path)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        with os.fdopen(fd, 'wb') as file:
+            file.write(data)
+        # os.open only applies the mode to new files; a leftover tmp file
+        # keeps its old bits, so set them explicitly
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _remember_saved_yaml(path: Path, st: os.stat_result, document: Any, disk_cache: bool = False) -> None:
+    """Seed the parse caches with a document that was just written to disk.
+    
+    Saves the next load (e.g. the portal's reload after ``/api/config``)
+    from parsing back YAML we produced ourselves.
+    
+    Args:
+        path: Path to the YAML file
+        st: ``os.fstat`` of the written file, taken before it was closed
+        document: The document that was dumped
+        disk_cache: Also write the JSON parse cache under ``data/config_cache``
+    """
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    document = copy.deepcopy(document)
+    with _CACHE_LOCK:
+        _CACHE[os.path.abspath(path)] = (signature, document)
+    if disk_cache:
+        _write_parse_cache(path, signature, document, stat.S_IMODE(st.st_mode))
+
+
+def _load_yaml_cached(path: Path, disk_cache: bool = False) -> Any:
+    """Load a YAML file, reusing the previous parse while the file is unchanged.
+    
+    Parses are cached in memory and, with ``disk_cache``, as JSON under
+    ``data/config_cache`` so that a restarted process can skip YAML parsing
+    too. Both caches are keyed on the file's stat signature.
+    
+    Args:
+        path: Path to the YAML file
+        disk_cache: Read and write the JSON parse cache
+        
+    Returns:
+        A private deep copy of the parsed document, safe for callers to mutate
+    """
+    st = os.stat(path)
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    key = os.path.abspath(path)
+    with _CACHE_LOCK:
+        entry = _CACHE.get(key)
+        if entry is None or entry[0] != signature:
+            document = _read_parse_cache(path, signature) if disk_cache else None
+            if document is None:
+                with open(path, 'r') as file:
+                    document = yaml.load(file, Loader=SafeLoader)
+                if disk_cache:
+                    _write_parse_cache(path, signature, document, stat.S_IMODE(st.st_mode))
+            entry = (signature, document)
+            _CACHE[key] = entry
+    return copy.deepcopy(entry[1])
 
 
 class ConfigManager:
     """Manages configuration settings for the SkyGuard system."""
     
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, disk_cache: bool = False):
         """Initialize the configuration manager.
         
         Args:
             config_path: Path to the configuration file
+            disk_cache: Keep a JSON parse cache under ``data/config_cache`` so
+                a restarted process skips YAML parsing (used by the web portal)
         """
         self.config_path = Path(config_path)
+        self.disk_cache = disk_cache
         self.config = {}
         self.logger = logging.getLogger(__name__)
         
@@ -35,8 +197,7 @@ class ConfigManager:
                 self._create_default_config()
                 return self.config
                 
-            with open(self.config_path, 'r') as file:
-                self.config = yaml.safe_load(file)
+            self.config = _load_yaml_cached(self.config_path, self.disk_cache)
                 
             self.logger.info(f"Configuration loaded from {self.config_path}")
             return self.config
@@ -81,7 +242,11 @@ class ConfigManager:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
             
             with open(self.config_path, 'w') as file:
-                yaml.dump(self.config, file, default_flow_style=False, indent=2)
+                yaml.dump(self.config, file, Dumper=SafeDumper, default_flow_style=False, indent=2)
+                file.flush()
+                # Stat our own file handle so a concurrent writer can't be mistaken for us
+                written = os.fstat(file.fileno())
+            _remember_saved_yaml(self.config_path, written, self.config, self.disk_cache)
                 
             self.logger.info(f"Configuration saved to {self.config_path}")
             return True
@@ -196,6 +361,7 @@ class ConfigManager:
                 'file': 'logs/skyguard.log',
                 'max_size_mb': 10,
                 'backup_count': 5,
+                'flush_interval_ms': 250,
             },
             'hardware': {
                 'platform': 'auto',  # 'auto', 'raspberry_pi', 'desktop'
@@ -31,6 +31,8 @@ except ImportError as e:
         ) from e
     raise
 
+from skyguard.utils.drawing import blend_polygon
+
 # Try to import PyTorch and YOLO, but don't fail if not available
 PYTORCH_AVAILABLE = False
 torch = None
@@ -360,6 +362,8 @@ class BirdSegmentationDetector:
         """
         try:
             import yaml
+            # libyaml-backed when available; dataset_info.yaml lists every species
+            from skyguard.core.config_manager import SafeLoader
             base = Path(__file__).resolve()
             # Project root is two levels up: SkyGuard/skyguard/core -> SkyGuard/
             project_root = base.parents[2]
@@ -422,7 +426,7 @@ class BirdSegmentationDetector:
                 if dataset_path.exists():
                     try:
                         with open(dataset_path, 'r', encoding='utf-8') as f:
-                            dataset_info = yaml.safe_load(f)
+                            dataset_info = yaml.load(f, Loader=SafeLoader)
                         
                         # Get class list from dataset info
                         classes = dataset_info.get('classes', [])
@@ -571,10 +575,27 @@ class BirdSegmentationDetector:
         Returns:
             List of detection dictionaries
         """
+        return self.detect_batch([frame])[0]
+    
+    def detect_batch(self, frames: List[np.ndarray]) -> List[List[Dict[str, Any]]]:
+        """Detect birds in several frames with a single model call.
+        
+        Ultralytics stacks the frames into one batch, so tools that process
+        recorded footage pay the per-call overhead once per batch instead of
+        once per frame.
+        
+        Args:
+            frames: Input frames as numpy arrays
+            
+        Returns:
+            One list of detection dictionaries per frame, in input order
+        """
+        if not frames:
+            return []
         try:
             if self.model is None:
                 self.logger.warning("Model not loaded")
-                return []
+                return [[] for _ in frames]
             
             # Log segmentation model execution
             inference_start = time.time()
@@ -585,7 +606,7 @@ class BirdSegmentationDetector:
             # Use verbose=False to suppress Ultralytics stdout, we'll log via Python logging
             # Specify device for inference (YOLO will use it automatically if CUDA is available)
             results = self.model(
-                frame,
+                list(frames),
                 conf=self.confidence_threshold,
                 iou=self.nms_threshold,
                 device=self.device,  # Use detected/configured device
@@ -596,200 +617,220 @@ class BirdSegmentationDetector:
             if self.detection_log_level in ['standard', 'detailed']:
                 self.logger.info(
                     f"⏱️  [SEG] Inference completed | "
+                    f"frames={len(frames)} | "
                     f"time={inference_time:.1f}ms"
                 )
                 # Ensure output is flushed immediately (important for Raspberry Pi)
                 sys.stdout.flush()
             
-            detections = []
-            for result in results:
-                boxes = result.boxes
-                masks = getattr(result, 'masks', None)
-                names = getattr(result, 'names', None)
-                num_instances = (
-                    int(boxes.shape[0])
-                    if (boxes is not None and hasattr(boxes, 'shape'))
-                    else 0
+            batch = [
+                self._result_detections(result, frame)
+                for result, frame in zip(results, frames)
+            ]
+            
+            # Update statistics
+            found = sum(len(detections) for detections in batch)
+            if found:
+                self.detection_count += found
+                self.last_detection_time = time.time()
+            
+            return batch
+            
+        except Exception as e:
+            self.logger.error(f"Error during detection: {e}")
+            return [[] for _ in frames]
+    
+    def _result_detections(self, result: Any, frame: np.ndarray) -> List[Dict[str, Any]]:
+        """Convert one frame's model result into detection dictionaries.
+        
+        Keeps bird instances only and runs the species classifier on
+        confident ones.
+        
+        Args:
+            result: Ultralytics result for ``frame``
+            frame: The frame the result was computed from
+            
+        Returns:
+            List of detection dictionaries
+        """
+        detections = []
+        boxes = result.boxes
+        masks = getattr(result, 'masks', None)
+        names = getattr(result, 'names', None)
+        num_instances = (
+            int(boxes.shape[0])
+            if (boxes is not None and hasattr(boxes, 'shape'))
+            else 0
+        )
+        
+        if boxes is None or num_instances == 0:
+            if self.detection_log_level in ['standard', 'detailed']:
+                self.logger.info("🔍 [SEG] No detections found in frame")
+            return detections
+        
+        # Log detection count
+        if self.detection_log_level in ['standard', 'detailed']:
+            self.logger.info(
+                f"📊 [SEG] Found {num_instances} detection(s) in frame"
+            )
+        
+        # Prepare mask polygons if available
+        polygons_list = []
+        if (
+            masks is not None
+            and getattr(masks, 'xy', None) is not None
+        ):
+            # list of per-instance arrays of polygon points
+            polygons_list = masks.xy
+        else:
+            polygons_list = [None] * num_instances
+        
+        for idx in range(num_instances):
+            box = boxes[idx]
+            # Extract detection information
+            x1, y1, x2, y2 = box.xyxy[0].detach().cpu().numpy()
+            has_conf = getattr(box, 'conf', None) is not None
+            confidence = (
+                float(box.conf[0].detach().cpu().numpy())
+                if has_conf else 0.0
+            )
+            has_cls = getattr(box, 'cls', None) is not None
+            class_id = (
+                int(box.cls[0].detach().cpu().numpy())
+                if has_cls else -1
+            )
+            class_name = None
+            if names is not None and class_id in names:
+                class_name = names[class_id]
+            
+            # Filter for bird class; prefer class name check, fallback to COCO id 14
+            is_bird = False
+            if class_name is not None:
+                is_bird = 'bird' in str(class_name).lower()
+            elif class_id == 14:
+                is_bird = True
+            
+            if not is_bird:
+                continue
+            
+            # Log all bird detections (any confidence level)
+            if self.detection_log_level in ['standard', 'detailed']:
+                self.logger.info(
+                    f"🐦 [DETECT] Bird found | "
+                    f"conf={confidence:.3f} | "
+                    f"bbox=[{int(x1)},{int(y1)},{int(x2)},{int(y2)}] | "
+                    f"area={int(max(0, (x2 - x1)) * max(0, (y2 - y1)))} | "
+                    f"class={class_name or 'bird'}"
                 )
-                
-                if boxes is None or num_instances == 0:
-                    if self.detection_log_level in ['standard', 'detailed']:
-                        self.logger.info("🔍 [SEG] No detections found in frame")
-                    continue
-                
-                # Log detection count
+                # Ensure output is flushed immediately (important for Raspberry Pi)
+                sys.stdout.flush()
+            
+            polygon = polygons_list[idx]
+            polygon_points = None
+            if polygon is not None and len(polygon) > 0:
+                # Use the largest polygon path
+                pts = (
+                    max(polygon, key=lambda arr: arr.shape[0])
+                    if isinstance(polygon, list)
+                    else polygon
+                )
+                polygon_points = pts.astype(np.int32).tolist()
+            
+            # Optional species classification
+            # Only run species classification for high-confidence detections (>= 0.20)
+            species_name = None
+            species_conf = None
+            species_candidates = []
+            
+            # Check if species classification should run
+            species_model_available = (self._species_predict_fn is not None or self.species_model is not None)
+            confidence_high_enough = confidence >= 0.20
+            
+            # Log diagnostic info if species model is available but not running
+            if species_model_available and not confidence_high_enough:
                 if self.detection_log_level in ['standard', 'detailed']:
-                    self.logger.info(
-                        f"📊 [SEG] Found {num_instances} detection(s) in frame"
+                    self.logger.debug(
+                        f"⏭️  [SPECIES] Skipped (low confidence) | "
+                        f"detection_conf={confidence:.3f} | "
+                        f"required>=0.20"
                     )
-                
-                # Prepare mask polygons if available
-                polygons_list = []
-                if (
-                    masks is not None
-                    and getattr(masks, 'xy', None) is not None
-                ):
-                    # list of per-instance arrays of polygon points
-                    polygons_list = masks.xy
-                else:
-                    polygons_list = [None] * num_instances
-                
-                for idx in range(num_instances):
-                    box = boxes[idx]
-                    # Extract detection information
-                    x1, y1, x2, y2 = box.xyxy[0].detach().cpu().numpy()
-                    has_conf = getattr(box, 'conf', None) is not None
-                    confidence = (
-                        float(box.conf[0].detach().cpu().numpy())
-                        if has_conf else 0.0
+            elif not species_model_available:
+                if self.detection_log_level in ['standard', 'detailed']:
+                    self.logger.debug(
+                        f"⏭️  [SPECIES] Skipped (model not loaded) | "
+                        f"detection_conf={confidence:.3f}"
                     )
-                    has_cls = getattr(box, 'cls', None) is not None
-                    class_id = (
-                        int(box.cls[0].detach().cpu().numpy())
-                        if has_cls else -1
+            
+            if confidence_high_enough and species_model_available:
+                # Log that species classification is running
+                if self.detection_log_level in ['standard', 'detailed']:
+                    self.logger.info(
+                        f"🔬 [SPECIES] Running species classifier | "
+                        f"detection_conf={confidence:.3f} | "
+                        f"threshold={self.species_confidence_threshold:.3f}"
                     )
-                    class_name = None
-                    if names is not None and class_id in names:
-                        class_name = names[class_id]
-                    
-                    # Filter for bird class; prefer class name check, fallback to COCO id 14
-                    is_bird = False
-                    if class_name is not None:
-                        is_bird = 'bird' in str(class_name).lower()
-                    elif class_id == 14:
-                        is_bird = True
-                    
-                    if not is_bird:
-                        continue
-                    
-                    # Log all bird detections (any confidence level)
-                    if self.detection_log_level in ['standard', 'detailed']:
-                        self.logger.info(
-                            f"🐦 [DETECT] Bird found | "
-                            f"conf={confidence:.3f} | "
-                            f"bbox=[{int(x1)},{int(y1)},{int(x2)},{int(y2)}] | "
-                            f"area={int(max(0, (x2 - x1)) * max(0, (y2 - y1)))} | "
-                            f"class={class_name or 'bird'}"
-                        )
-                        # Ensure output is flushed immediately (important for Raspberry Pi)
-                        sys.stdout.flush()
-                    
-                    polygon = polygons_list[idx]
-                    polygon_points = None
-                    if polygon is not None and len(polygon) > 0:
-                        # Use the largest polygon path
-                        pts = (
-                            max(polygon, key=lambda arr: arr.shape[0])
-                            if isinstance(polygon, list)
-                            else polygon
-                        )
-                        polygon_points = pts.astype(np.int32).tolist()
-                    
-                    # Optional species classification
-                    # Only run species classification for high-confidence detections (>= 0.20)
-                    species_name = None
-                    species_conf = None
-                    species_candidates = []
-                    
-                    # Check if species classification should run
-                    species_model_available = (self._species_predict_fn is not None or self.species_model is not None)
-                    confidence_high_enough = confidence >= 0.20
-                    
-                    # Log diagnostic info if species model is available but not running
-                    if species_model_available and not confidence_high_enough:
-                        if self.detection_log_level in ['standard', 'detailed']:
-                            self.logger.debug(
-                                f"⏭️  [SPECIES] Skipped (low confidence) | "
-                                f"detection_conf={confidence:.3f} | "
-                                f"required>=0.20"
-                            )
-                    elif not species_model_available:
+                try:
+                    crop = self._extract_crop(
+                        frame, polygon_points, x1, y1, x2, y2
+                    )
+                    if crop is not None:
                         if self.detection_log_level in ['standard', 'detailed']:
                             self.logger.debug(
-                                f"⏭️  [SPECIES] Skipped (model not loaded) | "
-                                f"detection_conf={confidence:.3f}"
+                                f"🔬 [SPECIES] Crop extracted | "
+                                f"size={crop.shape if hasattr(crop, 'shape') else 'unknown'}"
                             )
-                    
-                    if confidence_high_enough and species_model_available:
-                        # Log that species classification is running
+                        species_name, species_conf, species_candidates = self._classify_species(crop)
+                        # Log species classification results
                         if self.detection_log_level in ['standard', 'detailed']:
-                            self.logger.info(
-                                f"🔬 [SPECIES] Running species classifier | "
-                                f"detection_conf={confidence:.3f} | "
-                                f"threshold={self.species_confidence_threshold:.3f}"
-                            )
-                        try:
-                            crop = self._extract_crop(
-                                frame, polygon_points, x1, y1, x2, y2
-                            )
-                            if crop is not None:
-                                if self.detection_log_level in ['standard', 'detailed']:
-                                    self.logger.debug(
-                                        f"🔬 [SPECIES] Crop extracted | "
-                                        f"size={crop.shape if hasattr(crop, 'shape') else 'unknown'}"
-                                    )
-                                species_name, species_conf, species_candidates = self._classify_species(crop)
-                                # Log species classification results
-                                if self.detection_log_level in ['standard', 'detailed']:
-                                    if species_name:
-                                        self.logger.info(
-                                            f"✅ [SPECIES] Identified | "
-                                            f"species={species_name} | "
-                                            f"confidence={species_conf:.3f} | "
-                                            f"detection_conf={confidence:.3f}"
-                                        )
-                                    else:
-                                        self.logger.info(
-                                            f"❌ [SPECIES] No species above threshold | "
-                                            f"detection_conf={confidence:.3f} | "
-                                            f"threshold={self.species_confidence_threshold:.3f}"
-                                        )
-                                    # Log all candidate species if detailed logging
-                                    if self.detection_log_level == 'detailed' and species_candidates:
-                                        candidates_str = ", ".join(
-                                            f"{name}={conf:.3f}" 
-                                            for name, conf in species_candidates[:5]  # Top 5
-                                        )
-                                        self.logger.info(
-                                            f"📊 [SPECIES] Top candidates | {candidates_str}"
-                                        )
+                            if species_name:
+                                self.logger.info(
+                                    f"✅ [SPECIES] Identified | "
+                                    f"species={species_name} | "
+                                    f"confidence={species_conf:.3f} | "
+                                    f"detection_conf={confidence:.3f}"
+                                )
                             else:
-                                if self.detection_log_level in ['standard', 'detailed']:
-                                    self.logger.warning(
-                                        f"⚠️  [SPECIES] Crop extraction failed | "
-                                        f"detection_conf={confidence:.3f}"
-                                    )
-                        except Exception as ce:
+                                self.logger.info(
+                                    f"❌ [SPECIES] No species above threshold | "
+                                    f"detection_conf={confidence:.3f} | "
+                                    f"threshold={self.species_confidence_threshold:.3f}"
+                                )
+                            # Log all candidate species if detailed logging
+                            if self.detection_log_level == 'detailed' and species_candidates:
+                                candidates_str = ", ".join(
+                                    f"{name}={conf:.3f}" 
+                                    for name, conf in species_candidates[:5]  # Top 5
+                                )
+                                self.logger.info(
+                                    f"📊 [SPECIES] Top candidates | {candidates_str}"
+                                )
+                    else:
+                        if self.detection_log_level in ['standard', 'detailed']:
                             self.logger.warning(
-                                f"⚠️  [SPECIES] Classification error | {ce}"
+                                f"⚠️  [SPECIES] Crop extraction failed | "
+                                f"detection_conf={confidence:.3f}"
                             )
-                    detection = {
-                        'bbox': [int(x1), int(y1), int(x2), int(y2)],
-                        'confidence': float(confidence),
-                        'class_id': class_id,
-                        'class_name': class_name or 'bird',
-                        'timestamp': time.time(),
-                        'center': [int((x1 + x2) / 2), int((y1 + y2) / 2)],
-                        'area': int(max(0, (x2 - x1)) * max(0, (y2 - y1))),
-                        'polygon': polygon_points,  # list of [x,y]
-                        'species': species_name,
-                        'species_confidence': (
-                            float(species_conf) if species_conf is not None
-                            else None
-                        ),
-                    }
-                    detections.append(detection)
-            
-            # Update statistics
-            if detections:
-                self.detection_count += len(detections)
-                self.last_detection_time = time.time()
-            
-            return detections
-            
-        except Exception as e:
-            self.logger.error(f"Error during detection: {e}")
-            return []
+                except Exception as ce:
+                    self.logger.warning(
+                        f"⚠️  [SPECIES] Classification error | {ce}"
+                    )
+            detection = {
+                'bbox': [int(x1), int(y1), int(x2), int(y2)],
+                'confidence': float(confidence),
+                'class_id': class_id,
+                'class_name': class_name or 'bird',
+                'timestamp': time.time(),
+                'center': [int((x1 + x2) / 2), int((y1 + y2) / 2)],
+                'area': int(max(0, (x2 - x1)) * max(0, (y2 - y1))),
+                'polygon': polygon_points,  # list of [x,y]
+                'species': species_name,
+                'species_confidence': (
+                    float(species_conf) if species_conf is not None
+                    else None
+                ),
+            }
+            detections.append(detection)
+        return detections
 
     def _extract_crop(
         self,
@@ -980,20 +1021,10 @@ class BirdSegmentationDetector:
                 class_name = detection['class_name']
                 polygon = detection.get('polygon')
                 
-                # Draw segmentation mask if available
+                # Draw segmentation mask if available, blending only its
+                # bounding box rather than the whole frame per detection
                 if polygon is not None:
-                    overlay = annotated_frame.copy()
-                    pts = np.array(polygon, dtype=np.int32)
-                    cv2.fillPoly(overlay, [pts], color=(0, 255, 0))
-                    # Alpha blend mask
-                    alpha = 0.3
-                    annotated_frame = cv2.addWeighted(
-                        overlay,
-                        alpha,
-                        annotated_frame,
-                        1 - alpha,
-                        0,
-                    )
+                    blend_polygon(annotated_frame, polygon, (0, 255, 0), 0.3)
                 
                 # Draw bounding box (optional for context)
                 cv2.rectangle(
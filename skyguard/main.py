@@ -6,13 +6,14 @@ This is the main entry point for the SkyGuard raptor alert system.
 It initializes all components and runs the main detection loop.
 """
 
+import os
 import sys
 import logging
 import signal
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent
@@ -26,6 +27,10 @@ from skyguard.core.alert_system import AlertSystem
 from skyguard.storage.event_logger import EventLogger
 from skyguard.utils.logger import setup_logging
 
+# Written while the detection loop runs so the web portal can check liveness
+# with a single file read instead of scanning the process table
+PID_FILE = Path("data/skyguard.pid")
+
 
 class SkyGuardSystem:
     """Main SkyGuard system coordinator."""
@@ -147,23 +152,25 @@ class SkyGuardSystem:
         self.running = True
         self.logger.info("Starting SkyGuard detection loop...")
         
-        # Perform warmup detections for faster startup
-        self._perform_warmup_detections()
-        
-        # Start snapshot service for web portal
-        if self.camera_manager:
-            self.snapshot_service.start(self.camera_manager)
-        
-        # Track last cleanup to run retention periodically (e.g., every 10 minutes)
-        last_cleanup_ts = time.time()
-        
-        # Track config file modification time for dynamic reloading
-        import os
-        config_path = self.config_manager.config_path
-        last_config_mtime = os.path.getmtime(config_path) if os.path.exists(config_path) else 0
-        config_check_counter = 0  # Check config every N iterations
-
         try:
+            # Inside the try so the finally removes it if startup fails
+            self._write_pid_file()
+            
+            # Perform warmup detections for faster startup
+            self._perform_warmup_detections()
+            
+            # Start snapshot service for web portal
+            if self.camera_manager:
+                self.snapshot_service.start(self.camera_manager)
+            
+            # Track last cleanup to run retention periodically (e.g., every 10 minutes)
+            last_cleanup_ts = time.time()
+            
+            # Track config file modification time for dynamic reloading
+            config_path = self.config_manager.config_path
+            last_config_mtime = os.path.getmtime(config_path) if os.path.exists(config_path) else 0
+            config_check_counter = 0  # Check config every N iterations
+            
             while self.running:
                 # Check for config file changes periodically (every 10 iterations)
                 config_check_counter += 1
@@ -196,9 +203,9 @@ class SkyGuardSystem:
                     self.logger.info(f"Found {len(detections)} detections, max confidence: {max(d['confidence'] for d in detections):.3f}")
                 
                 # Process detections using detector's current threshold (supports dynamic updates)
-                for detection in detections:
-                    if detection['confidence'] > self.detector.confidence_threshold:
-                        self._handle_raptor_detection(detection, frame)
+                threats = [d for d in detections if d['confidence'] > self.detector.confidence_threshold]
+                if threats:
+                    self._handle_raptor_detections(threats, frame)
                 
                 # Sleep between detection cycles
                 time.sleep(self.config['system']['detection_interval'])
@@ -222,38 +229,57 @@ class SkyGuardSystem:
             # Stop snapshot service
             self.snapshot_service.stop()
             self.shutdown()
+            self._remove_pid_file()
             
         return True
     
-    def _handle_raptor_detection(self, detection: dict, frame) -> None:
-        """Handle a detected raptor threat.
+    def _handle_raptor_detections(self, detections: List[dict], frame) -> None:
+        """Handle the raptor threats detected in one frame.
 
-        Logs the detection to the database, retrieves the saved image path,
-        injects it into the detection dict so email alerts can attach it, then
-        fires all enabled alert channels.
+        Logs the detections to the database in one transaction, retrieves
+        each saved image path, injects it into the detection dict so email
+        alerts can attach it, then fires all enabled alert channels.
         """
-        self.logger.warning(
-            f"Raptor detected! Confidence: {detection['confidence']:.2f}"
-        )
+        for detection in detections:
+            self.logger.warning(
+                f"Raptor detected! Confidence: {detection['confidence']:.2f}"
+            )
 
-        # Log the event — returns the DB row ID (or None on failure)
-        detection_id: Optional[int] = self.event_logger.log_detection(detection, frame)
+        # Log the events — returns the DB row IDs (None on failure)
+        detection_ids: List[Optional[int]] = self.event_logger.log_detections(detections, frame)
 
-        # Inject the saved image path so _send_email_alert can attach it
-        if detection_id is not None:
-            try:
-                saved_record = self.event_logger.get_detection_by_id(detection_id)
-                if saved_record and saved_record.get('image_path'):
-                    detection['image_path'] = saved_record['image_path']
-            except Exception as e:
-                self.logger.debug(
-                    f"Could not retrieve saved image path for detection {detection_id}: {e}"
-                )
+        for detection, detection_id in zip(detections, detection_ids):
+            # Inject the saved image path so _send_email_alert can attach it
+            if detection_id is not None:
+                try:
+                    saved_record = self.event_logger.get_detection_by_id(detection_id)
+                    if saved_record and saved_record.get('image_path'):
+                        detection['image_path'] = saved_record['image_path']
+                except Exception as e:
+                    self.logger.debug(
+                        f"Could not retrieve saved image path for detection {detection_id}: {e}"
+                    )
 
-        # Send alerts on all enabled channels
-        self.alert_system.send_raptor_alert(detection, detection_id=detection_id)
+            # Send alerts on all enabled channels
+            self.alert_system.send_raptor_alert(detection, detection_id=detection_id)
     
     
+    def _write_pid_file(self) -> None:
+        """Record this process's PID for the web portal's status check."""
+        try:
+            PID_FILE.parent.mkdir(parents=True, exist_ok=True)
+            PID_FILE.write_text(str(os.getpid()))
+        except OSError as e:
+            self.logger.warning(f"Could not write PID file {PID_FILE}: {e}")
+    
+    def _remove_pid_file(self) -> None:
+        """Remove the PID file on clean exit if it still belongs to this process."""
+        try:
+            if PID_FILE.read_text().strip() == str(os.getpid()):
+                PID_FILE.unlink()
+        except (OSError, ValueError):
+            pass
+    
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals."""
         self.logger.info(f"Received signal {signum}, shutting down...")
@@ -8,12 +8,15 @@ import sqlite3
 import json
 import logging
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 import cv2
 import numpy as np
 
+from skyguard.utils.drawing import blend_polygon
+
 
 class EventLogger:
     """Logs and stores detection events and system data.
@@ -64,6 +67,22 @@ class EventLogger:
         )
         
         self.connection = None
+        # Bumped after every commit that inserts or deletes detections
+        self._detection_writes = 0
+        # Last PRAGMA data_version read as (time.monotonic(), value), reused
+        # for _data_version_ttl seconds
+        self._data_version: Optional[Tuple[float, int]] = None
+        self._data_version_ttl = 0.5
+        # Running result of get_detection_counts: (starts, max id, row total, counts)
+        self._window_counts: Optional[Tuple[Tuple[float, ...], Optional[int], int, Tuple[int, ...]]] = None
+        # LRU of get_detection_by_id results, valid while detections_version() is unchanged
+        self._detection_cache: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._detection_cache_version: Optional[Tuple[int, int]] = None
+        self._detection_cache_size = 1024
+        # Unfiltered COUNT(*) result, valid while detections_version() is unchanged
+        self._total_count: Optional[Tuple[Tuple[int, int], int]] = None
+        # get_status_summary result, valid while detections_version() is unchanged
+        self._status_summary: Optional[Tuple[Tuple[int, int], int, Optional[Dict[str, Any]]]] = None
         
     def initialize(self) -> bool:
         """Initialize the event logger and database.
@@ -86,6 +105,27 @@ class EventLogger:
             self.logger.error(f"Failed to initialize event logger: {e}")
             return False
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a tuned SQLite connection to the event database.
+
+        WAL lets the web portal's readers run alongside detection writes, and
+        with WAL ``synchronous=NORMAL`` only fsyncs at checkpoints while still
+        never corrupting the database (a power cut can lose the last commits).
+
+        Returns:
+            Open connection, usable from multiple threads
+        """
+        # Allow the same connection to be used across Flask request threads
+        connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute('PRAGMA temp_store=MEMORY')
+        connection.execute('PRAGMA mmap_size=268435456')  # 256 MB
+        # Negative means KiB: a ~20 MB page cache keeps the detections indexes
+        # resident across dashboard polls (the default is ~2 MB)
+        connection.execute('PRAGMA cache_size=-20000')
+        return connection
+
     def _ensure_connection(self) -> bool:
         """Ensure an active SQLite connection exists.
 
@@ -96,8 +136,7 @@ class EventLogger:
             if self.connection is None:
                 # Ensure database directory exists
                 self.db_path.parent.mkdir(parents=True, exist_ok=True)
-                self.connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
-                self.connection.execute('PRAGMA journal_mode=WAL')
+                self.connection = self._connect()
                 return True
             # Simple probe to validate connection
             try:
@@ -108,8 +147,7 @@ class EventLogger:
             except Exception:
                 # Reconnect on failure
                 self.connection.close()
-                self.connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
-                self.connection.execute('PRAGMA journal_mode=WAL')
+                self.connection = self._connect()
                 return True
         except Exception as e:
             self.logger.error(f"Failed to ensure DB connection to {self.db_path}: {e}")
@@ -124,11 +162,7 @@ class EventLogger:
             # Ensure database directory exists
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Allow the same connection to be used across Flask request threads
-            # Use WAL mode for better concurrency
-            self.connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
-            # Enable WAL mode for better concurrent access
-            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection = self._connect()
             cursor = self.connection.cursor()
             
             # Create detections table
@@ -192,7 +226,8 @@ class EventLogger:
                 )
             ''')
 
-            # Create indexes for better performance
+            # Create indexes for better performance. The timestamp index turns
+            # the dashboard's today/week/month counts into range searches.
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_detections_timestamp ON detections(timestamp)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_detections_class ON detections(class_name)')
             try:
@@ -228,76 +263,116 @@ class EventLogger:
             The ``lastrowid`` (integer primary key) of the inserted record on
             success, or ``None`` on failure.
         """
+        return self.log_detections([detection], frame)[0]
+
+    def log_detections(self, detections: List[Dict[str, Any]],
+                       frame: Optional[np.ndarray] = None) -> List[Optional[int]]:
+        """Log several detections from the same frame in one transaction.
+
+        All rows are committed together, so a frame with many detections
+        costs one commit (and WAL sync) instead of one per detection, and
+        readers see the whole frame's detections at once.
+
+        Args:
+            detections: Detection information dictionaries
+            frame: Optional frame the detections were found in
+
+        Returns:
+            The row id of each inserted record, in order, or ``None`` for
+            every detection if the batch could not be written.
+        """
+        if not detections:
+            return []
         try:
             if self.connection is None:
                 self.logger.error("Database not initialized")
-                return None
+                return [None] * len(detections)
             
-            # Save frame if provided
-            image_path = None
-            segmented_image_path = None
-            if frame is not None:
-                image_path = self._save_detection_image(frame, detection)
-                
-                # Save segmented image if species is detected
-                species = detection.get('species')
-                species_conf = detection.get('species_confidence')
-                if species and species_conf is not None and float(species_conf) >= 0.6:
-                    segmented_image_path = self._save_segmented_image(frame, detection)
+            rows = [self._detection_params(detection, frame) for detection in detections]
             
-            # Insert detection record - prefer detection-provided timestamp
             cursor = self.connection.cursor()
-            # Use detector's timestamp if present and valid; otherwise, fallback to now
+            inserted_ids: List[Optional[int]] = []
             try:
-                provided_ts = float(detection.get('timestamp')) if detection.get('timestamp') is not None else None
-            except (TypeError, ValueError):
-                provided_ts = None
-            current_time = provided_ts if provided_ts is not None else time.time()
-            
-            species_name = detection.get('species')
-            species_confidence = detection.get('species_confidence')
-            if species_confidence is not None:
-                try:
-                    species_confidence = float(species_confidence)
-                except (TypeError, ValueError):
-                    species_confidence = None
-            
-            cursor.execute('''
-                INSERT INTO detections (
-                    timestamp, class_name, confidence, bbox_x1, bbox_y1, bbox_x2, bbox_y2,
-                    center_x, center_y, area, image_path, species_name, species_confidence,
-                    segmented_image_path, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                current_time,  # Store detector's timestamp when available
-                detection['class_name'],
-                detection['confidence'],
-                detection['bbox'][0],
-                detection['bbox'][1],
-                detection['bbox'][2],
-                detection['bbox'][3],
-                detection['center'][0],
-                detection['center'][1],
-                detection['area'],
-                image_path,
-                species_name,
-                species_confidence,
-                segmented_image_path,
-                json.dumps(detection.get('metadata', {}))
-            ))
-            
-            self.connection.commit()
-            inserted_id: int = cursor.lastrowid
+                for row in rows:
+                    cursor.execute('''
+                        INSERT INTO detections (
+                            timestamp, class_name, confidence, bbox_x1, bbox_y1, bbox_x2, bbox_y2,
+                            center_x, center_y, area, image_path, species_name, species_confidence,
+                            segmented_image_path, metadata
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', row)
+                    inserted_ids.append(cursor.lastrowid)
+                self.connection.commit()
+            except Exception:
+                self.connection.rollback()
+                raise
+            self._detection_writes += 1
 
-            self.logger.debug(
-                f"Detection logged: {detection['class_name']} "
-                f"(confidence: {detection['confidence']:.2f}, id={inserted_id})"
-            )
-            return inserted_id
+            for detection, inserted_id in zip(detections, inserted_ids):
+                self.logger.debug(
+                    f"Detection logged: {detection['class_name']} "
+                    f"(confidence: {detection['confidence']:.2f}, id={inserted_id})"
+                )
+            return inserted_ids
 
         except Exception as e:
             self.logger.error(f"Failed to log detection: {e}", exc_info=True)
-            return None
+            return [None] * len(detections)
+    
+    def _detection_params(self, detection: Dict[str, Any], frame: Optional[np.ndarray]) -> tuple:
+        """Save a detection's images and build its ``detections`` row values.
+
+        Args:
+            detection: Detection information dictionary
+            frame: Optional frame to save
+
+        Returns:
+            Parameters for the detections INSERT, in column order
+        """
+        # Save frame if provided
+        image_path = None
+        segmented_image_path = None
+        if frame is not None:
+            image_path = self._save_detection_image(frame, detection)
+            
+            # Save segmented image if species is detected
+            species = detection.get('species')
+            species_conf = detection.get('species_confidence')
+            if species and species_conf is not None and float(species_conf) >= 0.6:
+                segmented_image_path = self._save_segmented_image(frame, detection)
+        
+        # Use detector's timestamp if present and valid; otherwise, fallback to now
+        try:
+            provided_ts = float(detection.get('timestamp')) if detection.get('timestamp') is not None else None
+        except (TypeError, ValueError):
+            provided_ts = None
+        current_time = provided_ts if provided_ts is not None else time.time()
+        
+        species_name = detection.get('species')
+        species_confidence = detection.get('species_confidence')
+        if species_confidence is not None:
+            try:
+                species_confidence = float(species_confidence)
+            except (TypeError, ValueError):
+                species_confidence = None
+        
+        return (
+            current_time,  # Store detector's timestamp when available
+            detection['class_name'],
+            detection['confidence'],
+            detection['bbox'][0],
+            detection['bbox'][1],
+            detection['bbox'][2],
+            detection['bbox'][3],
+            detection['center'][0],
+            detection['center'][1],
+            detection['area'],
+            image_path,
+            species_name,
+            species_confidence,
+            segmented_image_path,
+            json.dumps(detection.get('metadata', {}))
+        )
     
     def _save_detection_image(self, frame: np.ndarray, detection: Dict[str, Any]) -> str:
         """Save detection image to disk.
@@ -448,19 +523,8 @@ class EventLogger:
             
             # Draw segmentation mask if available
             if polygon is not None and len(polygon) > 0:
-                overlay = annotated_frame.copy()
-                pts = np.array(polygon, dtype=np.int32)
-                # Use green color for segmentation mask
-                cv2.fillPoly(overlay, [pts], color=(0, 255, 0))
-                # Alpha blend mask for transparency
-                alpha = 0.3
-                annotated_frame = cv2.addWeighted(
-                    overlay,
-                    alpha,
-                    annotated_frame,
-                    1 - alpha,
-                    0,
-                )
+                # Green, 30% opaque; only the polygon's bounding box is blended
+                blend_polygon(annotated_frame, polygon, (0, 255, 0), 0.3)
             
             # Draw bounding box
             if bbox and len(bbox) == 4:
@@ -684,6 +748,10 @@ class EventLogger:
                         class_name: Optional[str] = None, species_name: Optional[str] = None) -> int:
         """Count detection records from database.
         
+        SQLite has no stored row count, so ``COUNT(*)`` walks a whole index.
+        The unfiltered total is therefore kept until ``detections_version()``
+        moves; filtered counts are always queried.
+        
         Args:
             start_time: Start timestamp filter
             end_time: End timestamp filter
@@ -697,6 +765,12 @@ class EventLogger:
             if not self._ensure_connection():
                 return 0
             
+            unfiltered = start_time is None and end_time is None and class_name is None and species_name is None
+            if unfiltered:
+                version = self.detections_version()
+                if self._total_count is not None and self._total_count[0] == version:
+                    return self._total_count[1]
+            
             cursor = self.connection.cursor()
             
             # Build query
@@ -721,15 +795,241 @@ class EventLogger:
             
             cursor.execute(query, params)
             result = cursor.fetchone()
-            return result[0] if result else 0
+            count = result[0] if result else 0
+            if unfiltered:
+                self._total_count = (version, count)
+            return count
             
         except Exception as e:
             self.logger.error(f"Failed to count detections: {e}")
             return 0
     
+    def detections_version(self) -> Tuple[int, int]:
+        """Get a token that changes whenever the detections table may have changed.
+        
+        Combines SQLite's ``PRAGMA data_version``, which moves when another
+        connection (e.g. the main detection process) commits, with a counter
+        of this instance's own detection writes, which the pragma ignores.
+        The pragma is read at most once per ``_data_version_ttl`` seconds, so
+        commits from other connections are seen within that delay; this
+        instance's own writes move the token immediately.
+        
+        Returns:
+            Opaque tuple; compare for equality only
+        """
+        now = time.monotonic()
+        memo = self._data_version
+        if memo is not None and now - memo[0] < self._data_version_ttl:
+            return (memo[1], self._detection_writes)
+        try:
+            if self._ensure_connection():
+                version = self.connection.execute('PRAGMA data_version').fetchone()[0]
+                self._data_version = (now, version)
+                return (version, self._detection_writes)
+        except Exception as e:
+            self.logger.debug(f"Failed to read data_version: {e}")
+        # Unknown state: a fresh token forces callers to re-query
+        self._detection_writes += 1
+        return (-1, self._detection_writes)
+    
+    def count_detections_since(self, since: float) -> int:
+        """Count detections at or after a timestamp.
+        
+        Resolved by a range scan of ``idx_detections_timestamp`` rather than
+        by reading detection rows.
+        
+        Args:
+            since: Unix timestamp of the start of the window
+            
+        Returns:
+            Number of detections with ``timestamp >= since``
+        """
+        return self.count_detections(start_time=since)
+    
+    def get_detection_counts(self, *starts: float) -> Tuple[int, ...]:
+        """Count detections since each of several timestamps.
+        
+        The previous result is kept as running counters, together with the
+        table's max id and row total. When the windows only moved forward and
+        the total grew by exactly the rows written since (so no previously
+        counted row was deleted, whatever its id or timestamp), the counters
+        are updated from those new rows (an ``id`` range) and the rows that
+        slid out of each window (a short ``idx_detections_timestamp`` range)
+        instead of recounting the whole window. Otherwise every count is
+        recomputed with one conditional-sum query.
+        
+        Args:
+            *starts: Unix timestamps of the window starts
+            
+        Returns:
+            Tuple of counts, one per start, in the order given
+        """
+        if not starts:
+            return ()
+        try:
+            if not self._ensure_connection():
+                return (0,) * len(starts)
+            
+            cursor = self.connection.cursor()
+            sums = ", ".join("COALESCE(SUM(timestamp >= ?), 0)" for _ in starts)
+            # Cached per detections_version(); MAX(id) is an O(log N) rowid lookup
+            total = self.count_detections()
+            max_id = cursor.execute('SELECT MAX(id) FROM detections').fetchone()[0]
+            
+            result = None
+            prev = self._window_counts
+            if (prev is not None and len(prev[0]) == len(starts)
+                    and all(new >= old for old, new in zip(prev[0], starts))):
+                prev_starts, prev_max, prev_total, prev_counts = prev
+                # Ids are AUTOINCREMENT, so rows above prev_max are exactly the
+                # ones written since. Retention deletes by timestamp, which can
+                # hit any id (rows logged before an NTP sync carry old
+                # timestamps but high ids); any such delete shows up as a
+                # total below prev_total + added.
+                if max_id == prev_max:
+                    added, new_counts = 0, [0] * len(starts)
+                else:
+                    cursor.execute(
+                        f"SELECT COUNT(*), {sums} FROM detections WHERE id > ? AND id <= ?",
+                        (*starts, prev_max or 0, max_id or 0),
+                    )
+                    added, *new_counts = cursor.fetchone()
+                if prev_total + added == total:
+                    counts = list(prev_counts)
+                    for i, (old, new) in enumerate(zip(prev_starts, starts)):
+                        if new > old:
+                            cursor.execute(
+                                'SELECT COUNT(*) FROM detections WHERE timestamp >= ? AND timestamp < ? AND id <= ?',
+                                (old, new, prev_max or 0),
+                            )
+                            counts[i] -= cursor.fetchone()[0]
+                    result = tuple(c + n for c, n in zip(counts, new_counts))
+            if result is None:
+                cursor.execute(
+                    f"SELECT {sums} FROM detections WHERE timestamp >= ?",
+                    (*starts, min(starts)),
+                )
+                result = tuple(cursor.fetchone())
+            
+            self._window_counts = (starts, max_id, total, result)
+            return result
+            
+        except Exception as e:
+            self._window_counts = None
+            self.logger.error(f"Failed to count detections: {e}")
+            return (0,) * len(starts)
+    
+    def _select_detections(self, columns: str, start_time: Optional[float], end_time: Optional[float],
+                           class_name: Optional[str], species_name: Optional[str],
+                           limit: int, offset: int, before_id: Optional[int]) -> List[tuple]:
+        """Run a filtered, paginated SELECT over the detections table.
+        
+        Args:
+            columns: SQL column list to select
+            start_time: Start timestamp filter
+            end_time: End timestamp filter
+            class_name: Class name filter
+            species_name: Species name filter
+            limit: Maximum number of rows to return
+            offset: Number of rows to skip; ignored when before_id is given
+            before_id: Keyset cursor (see ``get_detections``)
+            
+        Returns:
+            Raw result rows
+        """
+        cursor = self.connection.cursor()
+        
+        # Build query
+        query = f"SELECT {columns} FROM detections WHERE 1=1"
+        params = []
+        
+        if start_time is not None:
+            query += " AND timestamp >= ?"
+            params.append(start_time)
+        
+        if end_time is not None:
+            query += " AND timestamp <= ?"
+            params.append(end_time)
+        
+        if class_name is not None:
+            query += " AND class_name = ?"
+            params.append(class_name)
+        
+        if species_name is not None:
+            query += " AND species_name = ?"
+            params.append(species_name)
+        
+        if before_id is not None:
+            # Resume after the cursor row in (timestamp, id) order, so cursor
+            # pages continue the first page even when ids and timestamps
+            # disagree. A cursor row that has since been deleted falls back
+            # to the id alone.
+            cursor.execute("SELECT timestamp FROM detections WHERE id = ?", (before_id,))
+            row = cursor.fetchone()
+            if row is not None:
+                query += " AND (timestamp, id) < (?, ?)"
+                params.extend((row[0], before_id))
+            else:
+                query += " AND id < ?"
+                params.append(before_id)
+            offset = 0
+        
+        query += " ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?"
+        params.append(limit)
+        params.append(offset)
+        
+        cursor.execute(query, params)
+        return cursor.fetchall()
+    
+    def get_detection_summaries(self, class_name: Optional[str] = None, species_name: Optional[str] = None,
+                                limit: int = 50, offset: int = 0,
+                                before_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get detection records shaped for the web API.
+        
+        Selects only the listed columns (no metadata JSON to decode) and
+        builds the response dict directly from each row, using the web key
+        names (``class``, ``species``).
+        
+        Args:
+            class_name: Class name filter
+            species_name: Species name filter
+            limit: Maximum number of records to return
+            offset: Number of records to skip; ignored when before_id is given
+            before_id: Keyset cursor (see ``get_detections``)
+            
+        Returns:
+            List of detection summaries, newest first
+        """
+        try:
+            if not self._ensure_connection():
+                return []
+            
+            rows = self._select_detections(
+                'id, timestamp, confidence, class_name, bbox_x1, bbox_y1, bbox_x2, bbox_y2, '
+                'image_path, species_name, species_confidence, segmented_image_path',
+                None, None, class_name, species_name, limit, offset, before_id)
+            return [
+                {
+                    'id': row[0],
+                    'timestamp': row[1],
+                    'confidence': row[2],
+                    'class': row[3],
+                    'bbox': [row[4], row[5], row[6], row[7]],
+                    'image_path': row[8],
+                    'species': row[9],
+                    'species_confidence': row[10],
+                    'segmented_image_path': row[11],
+                }
+                for row in rows
+            ]
+        except Exception as e:
+            self.logger.error(f"Failed to get detection summaries: {e}")
+            return []
+    
     def get_detections(self, start_time: Optional[float] = None, end_time: Optional[float] = None, 
                      class_name: Optional[str] = None, species_name: Optional[str] = None,
-                     limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+                     limit: int = 100, offset: int = 0,
+                     before_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get detection records from database.
         
         Args:
@@ -738,7 +1038,12 @@ class EventLogger:
             class_name: Class name filter
             species_name: Species name filter
             limit: Maximum number of records to return
-            offset: Number of records to skip (for pagination)
+            offset: Number of records to skip (for pagination); ignored when
+                before_id is given
+            before_id: Keyset cursor, the id of the last record of the
+                previous page. Only records after it in (timestamp, id) order
+                are returned, so each page is an O(limit) index range scan
+                instead of skipping offset rows
             
         Returns:
             List of detection records
@@ -747,60 +1052,96 @@ class EventLogger:
             if not self._ensure_connection():
                 return []
             
-            cursor = self.connection.cursor()
-            
-            # Build query
-            query = "SELECT * FROM detections WHERE 1=1"
-            params = []
+            rows = self._select_detections('*', start_time, end_time, class_name, species_name,
+                                           limit, offset, before_id)
             
-            if start_time is not None:
-                query += " AND timestamp >= ?"
-                params.append(start_time)
+            # Convert to dictionaries
+            return [self._detection_from_row(row) for row in rows]
             
-            if end_time is not None:
-                query += " AND timestamp <= ?"
-                params.append(end_time)
+        except Exception as e:
+            self.logger.error(f"Failed to get detections: {e}")
+            return []
+    
+    # Newest detections first (same order as get_detections), bounded;
+    # shared by the recent-window aggregates
+    _RECENT_DETECTIONS_CTE = (
+        'WITH recent AS (SELECT confidence, species_name, species_confidence '
+        'FROM detections ORDER BY timestamp DESC LIMIT ?) '
+    )
+    
+    def get_confidence_aggregates(self, limit: int = 100) -> Dict[str, Any]:
+        """Aggregate detection confidence over the most recent detections.
+        
+        Zero confidences are ignored, as they mark detections without a score.
+        
+        Args:
+            limit: Number of most recent detections to consider
             
-            if class_name is not None:
-                query += " AND class_name = ?"
-                params.append(class_name)
+        Returns:
+            Dictionary with ``detections`` (rows considered) and ``avg``,
+            ``min``, ``max`` and ``count`` over the non-zero confidences
+            (``avg``/``min``/``max`` are None when ``count`` is 0)
+        """
+        try:
+            if not self._ensure_connection():
+                return {'detections': 0, 'avg': None, 'min': None, 'max': None, 'count': 0}
             
-            if species_name is not None:
-                query += " AND species_name = ?"
-                params.append(species_name)
+            cursor = self.connection.cursor()
+            cursor.execute(
+                self._RECENT_DETECTIONS_CTE +
+                'SELECT COUNT(*), AVG(NULLIF(confidence, 0)), MIN(NULLIF(confidence, 0)), '
+                'MAX(NULLIF(confidence, 0)), COUNT(NULLIF(confidence, 0)) FROM recent',
+                (limit,),
+            )
+            detections, avg, low, high, count = cursor.fetchone()
+            return {'detections': detections, 'avg': avg, 'min': low, 'max': high, 'count': count}
             
-            query += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
-            params.append(limit)
-            params.append(offset)
+        except Exception as e:
+            self.logger.error(f"Failed to aggregate detection confidence: {e}")
+            return {'detections': 0, 'avg': None, 'min': None, 'max': None, 'count': 0}
+    
+    def get_species_breakdown(self, limit: int = 100) -> Dict[str, Any]:
+        """Summarize species classification over the most recent detections.
+        
+        Args:
+            limit: Number of most recent detections to consider
             
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
+        Returns:
+            Dictionary with ``total_classifications`` (detections with a
+            species confidence), ``successful_identifications`` (detections
+            with a species name) and ``species_breakdown`` mapping each species
+            to its ``count`` and ``avg_confidence``
+        """
+        stats: Dict[str, Any] = {
+            'total_classifications': 0,
+            'successful_identifications': 0,
+            'species_breakdown': {}
+        }
+        try:
+            if not self._ensure_connection():
+                return stats
             
-            # Convert to dictionaries
-            detections = []
-            for row in rows:
-                # Handle both old and new schema (with/without species columns)
-                detection = {
-                    'id': row[0],
-                    'timestamp': row[1],
-                    'class_name': row[2],
-                    'confidence': row[3],
-                    'bbox': [row[4], row[5], row[6], row[7]],
-                    'center': [row[8], row[9]],
-                    'area': row[10],
-                    'image_path': row[11] if len(row) > 11 else None,
-                    'species_name': row[12] if len(row) > 12 else None,
-                    'species_confidence': row[13] if len(row) > 13 else None,
-                    'segmented_image_path': row[14] if len(row) > 14 else None,
-                    'metadata': json.loads(row[15]) if len(row) > 15 and row[15] else {}
+            cursor = self.connection.cursor()
+            cursor.execute(
+                self._RECENT_DETECTIONS_CTE +
+                "SELECT species_name, COUNT(*), AVG(NULLIF(species_confidence, 0)), "
+                "COUNT(NULLIF(species_confidence, 0)) FROM recent GROUP BY species_name",
+                (limit,),
+            )
+            for species_name, count, avg_confidence, classified in cursor.fetchall():
+                stats['total_classifications'] += classified
+                if not species_name:
+                    continue
+                stats['successful_identifications'] += count
+                stats['species_breakdown'][species_name] = {
+                    'count': count,
+                    'avg_confidence': avg_confidence or 0.0
                 }
-                detections.append(detection)
-            
-            return detections
+            return stats
             
         except Exception as e:
-            self.logger.error(f"Failed to get detections: {e}")
-            return []
+            self.logger.error(f"Failed to get species breakdown: {e}")
+            return stats
     
     def get_species_stats(self, days: Optional[int] = None) -> Dict[str, Any]:
         """Get species detection statistics.
@@ -1010,6 +1351,7 @@ class EventLogger:
             deleted_deliveries = cursor.rowcount
 
             self.connection.commit()
+            self._detection_writes += 1
 
             self.logger.info(
                 f"Cleaned up {deleted_detections} old detections, "
@@ -1022,16 +1364,57 @@ class EventLogger:
             self.logger.error(f"Failed to cleanup old data: {e}")
             return False
 
+    @staticmethod
+    def _detection_from_row(row: tuple) -> Dict[str, Any]:
+        """Convert a ``SELECT * FROM detections`` row to a detection record.
+
+        Args:
+            row: Row tuple in table column order.
+
+        Returns:
+            Detection record dictionary.
+        """
+        # Handle both old and new schema (with/without species columns)
+        return {
+            'id': row[0],
+            'timestamp': row[1],
+            'class_name': row[2],
+            'confidence': row[3],
+            'bbox': [row[4], row[5], row[6], row[7]],
+            'center': [row[8], row[9]],
+            'area': row[10],
+            'image_path': row[11] if len(row) > 11 else None,
+            'species_name': row[12] if len(row) > 12 else None,
+            'species_confidence': row[13] if len(row) > 13 else None,
+            'segmented_image_path': row[14] if len(row) > 14 else None,
+            'metadata': json.loads(row[15]) if len(row) > 15 and row[15] else {},
+        }
+    
     def get_detection_by_id(self, detection_id: int) -> Optional[Dict[str, Any]]:
         """Get a single detection by its identifier.
 
+        Rows are never updated after insert, so found records are kept in a
+        small LRU. It is dropped whenever ``detections_version()`` moves,
+        which covers retention deletes by this or another process. A hit
+        while the version memo is fresh touches no SQL at all. Misses are
+        not cached because the id may be written later.
+
         Args:
             detection_id: The database primary key of the detection.
 
         Returns:
-            A detection record dictionary if found, otherwise None.
+            A copy of the detection record dictionary if found, otherwise None
         """
         try:
+            version = self.detections_version()
+            if version != self._detection_cache_version:
+                self._detection_cache.clear()
+                self._detection_cache_version = version
+            cached = self._detection_cache.get(detection_id)
+            if cached is not None:
+                self._detection_cache.move_to_end(detection_id)
+                return dict(cached)
+
             if not self._ensure_connection():
                 return None
 
@@ -1041,25 +1424,83 @@ class EventLogger:
             if row is None:
                 return None
 
-            # Handle both old and new schema (with/without species columns)
-            return {
-                'id': row[0],
-                'timestamp': row[1],
-                'class_name': row[2],
-                'confidence': row[3],
-                'bbox': [row[4], row[5], row[6], row[7]],
-                'center': [row[8], row[9]],
-                'area': row[10],
-                'image_path': row[11] if len(row) > 11 else None,
-                'species_name': row[12] if len(row) > 12 else None,
-                'species_confidence': row[13] if len(row) > 13 else None,
-                'segmented_image_path': row[14] if len(row) > 14 else None,
-                'metadata': json.loads(row[15]) if len(row) > 15 and row[15] else {},
-            }
+            record = self._detection_from_row(row)
+            self._detection_cache[detection_id] = record
+            if len(self._detection_cache) > self._detection_cache_size:
+                self._detection_cache.popitem(last=False)
+            return dict(record)
         except Exception as e:
             self.logger.error(f"Failed to get detection by id {detection_id}: {e}")
             return None
     
+    def get_latest_detection(self) -> Optional[Dict[str, Any]]:
+        """Get the most recently inserted detection.
+
+        Reads the last row of the primary-key B-tree, so the cost does not
+        grow with the table and no sort is needed.
+
+        Returns:
+            The newest detection record dictionary, or None if there are none.
+        """
+        try:
+            if not self._ensure_connection():
+                return None
+
+            cursor = self.connection.cursor()
+            cursor.execute('SELECT * FROM detections ORDER BY id DESC LIMIT 1')
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            return self._detection_from_row(row)
+        except Exception as e:
+            self.logger.error(f"Failed to get latest detection: {e}")
+            return None
+    
+    def get_status_summary(self) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Get the detection total and the newest detection for a status poll.
+        
+        Both come from one statement: a scalar ``COUNT(*)`` subquery left
+        joined to the last row of the primary-key B-tree, so an empty table
+        still yields a row. The result is kept until ``detections_version()``
+        moves and also primes the ``count_detections()`` total.
+        
+        Returns:
+            Tuple of (total detections, newest detection in the web API shape
+            with ``id``, ``timestamp``, ``confidence``, ``class`` and ``bbox``,
+            or None if there are none). The dictionary may be shared with
+            later callers; do not mutate it.
+        """
+        try:
+            if not self._ensure_connection():
+                return 0, None
+            
+            version = self.detections_version()
+            if self._status_summary is not None and self._status_summary[0] == version:
+                return self._status_summary[1], self._status_summary[2]
+            
+            row = self.connection.execute(
+                'SELECT (SELECT COUNT(*) FROM detections), latest.* '
+                'FROM (SELECT 1) LEFT JOIN ('
+                'SELECT id, timestamp, confidence, class_name, bbox_x1, bbox_y1, bbox_x2, bbox_y2 '
+                'FROM detections ORDER BY id DESC LIMIT 1) AS latest'
+            ).fetchone()
+            total = row[0]
+            latest = None
+            if row[1] is not None:
+                latest = {
+                    'id': row[1],
+                    'timestamp': row[2],
+                    'confidence': row[3],
+                    'class': row[4],
+                    'bbox': [row[5], row[6], row[7], row[8]],
+                }
+            self._status_summary = (version, total, latest)
+            self._total_count = (version, total)
+            return total, latest
+        except Exception as e:
+            self.logger.error(f"Failed to get status summary: {e}")
+            return 0, None
+    
     def cleanup(self) -> None:
         """Clean up resources."""
         try:
@@ -0,0 +1,44 @@
+"""
+Frame Drawing Helpers for SkyGuard System
+
+Annotation primitives shared by the detector overlay and the saved
+detection images.
+"""
+
+from typing import Sequence, Tuple
+
+import cv2
+import numpy as np
+
+
+def blend_polygon(
+    frame: np.ndarray,
+    polygon: Sequence[Sequence[float]],
+    color: Tuple[int, int, int],
+    alpha: float,
+) -> None:
+    """Alpha-blend a filled polygon into ``frame`` in place.
+
+    Only the polygon's bounding rectangle is copied and blended. Pixels
+    outside the polygon blend with themselves and keep their value, so the
+    result matches a full-frame ``addWeighted`` at a fraction of the cost.
+
+    Args:
+        frame: BGR image to draw on
+        polygon: Polygon vertices in frame coordinates
+        color: Fill color
+        alpha: Opacity of the fill, 0.0-1.0
+    """
+    pts = np.asarray(polygon, dtype=np.int32).reshape(-1, 2)
+    if len(pts) == 0:
+        return
+    h, w = frame.shape[:2]
+    x0, y0 = np.maximum(pts.min(axis=0), 0)
+    x1, y1 = np.minimum(pts.max(axis=0) + 1, (w, h))
+    if x0 >= x1 or y0 >= y1:
+        return
+
+    roi = frame[y0:y1, x0:x1]
+    overlay = roi.copy()
+    cv2.fillPoly(overlay, [pts - np.array([x0, y0], dtype=np.int32)], color=color)
+    cv2.addWeighted(overlay, alpha, roi, 1 - alpha, 0, dst=roi)
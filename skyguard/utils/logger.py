@@ -4,11 +4,153 @@ Logging Configuration for SkyGuard System
 Sets up structured logging for the SkyGuard application.
 """
 
+import atexit
 import logging
 import logging.handlers
+import os
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Any
+from typing import IO, Dict, Any, Optional
+
+
+class FastFormatter(logging.Formatter):
+    """Formatter that renders ``asctime`` at most once per wall-clock second.
+    
+    ``logging.Formatter.formatTime`` calls ``time.strftime`` for every record.
+    The date and time part only has second resolution, so it is cached and
+    reused for all records emitted within the same second. Without a
+    ``datefmt`` the milliseconds suffix is still appended per record, as the
+    standard formatter does.
+    """
+    
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the formatter and its timestamp cache."""
+        super().__init__(*args, **kwargs)
+        # (second, rendered string) swapped as one tuple so threads never
+        # observe a second paired with another second's string
+        self._cached_time = (-1, '')
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format the record creation time exactly as ``logging.Formatter`` would.
+        
+        ``YYYY-MM-DD HH:MM:SS`` is served from the per-second cache, followed
+        by ``,mmm`` when no datefmt is given. Any other format, or a custom
+        ``converter``, uses the standard implementation.
+        
+        Args:
+            record: Log record being formatted
+            datefmt: strftime format, or None for the default format
+            
+        Returns:
+            Formatted timestamp string
+        """
+        time_format = self.default_time_format if datefmt is None else datefmt
+        if time_format != '%Y-%m-%d %H:%M:%S' or self.converter is not time.localtime:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        cached_sec, rendered = self._cached_time
+        if sec != cached_sec:
+            rendered = '%04d-%02d-%02d %02d:%02d:%02d' % time.localtime(sec)[:6]
+            self._cached_time = (sec, rendered)
+        if datefmt is None and self.default_msec_format:
+            return self.default_msec_format % (rendered, record.msecs)
+        return rendered
+
+
+class FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that buffers writes instead of flushing per record.
+    
+    The stock handler flushes after every record and seeks to the end of the
+    file to decide whether to roll over. This handler opens the log with a
+    large write buffer, tracks the file size itself, and flushes on a
+    background timer (plus at exit). Records at ERROR or above are flushed
+    immediately so failures are on disk before a crash.
+    """
+    
+    def __init__(self, filename: str, maxBytes: int = 0, backupCount: int = 0,
+                 encoding: Optional[str] = None, delay: bool = False,
+                 buffer_size: int = 64 * 1024, flush_interval_ms: int = 250) -> None:
+        """Initialize the handler.
+        
+        Args:
+            filename: Log file path
+            maxBytes: Rollover size in bytes (0 disables rotation)
+            backupCount: Number of rotated files to keep
+            encoding: Text encoding for the log file
+            delay: Defer opening the file until the first record
+            buffer_size: Size of the write buffer in bytes
+            flush_interval_ms: Interval between background flushes
+        """
+        self.buffer_size = buffer_size
+        self._size = 0
+        self._rotatable = True
+        super().__init__(filename, mode='a', maxBytes=maxBytes,
+                         backupCount=backupCount, encoding=encoding, delay=delay)
+        self._flush_interval = max(flush_interval_ms, 1) / 1000.0
+        self._flush_stop = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name='skyguard-log-flush', daemon=True
+        )
+        self._flusher.start()
+        atexit.register(self.flush)
+    
+    def _open(self) -> IO[str]:
+        """Open the log file with a large write buffer.
+        
+        Returns:
+            Text stream for the log file
+        """
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=getattr(self, 'errors', None))
+        st = os.fstat(stream.fileno())
+        self._size = st.st_size
+        # See bpo-45401: never roll over anything other than regular files
+        self._rotatable = os.path.isfile(self.baseFilename)
+        return stream
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record to the buffer, rolling over when the size limit is hit.
+        
+        Args:
+            record: Log record to write
+        """
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            # maxBytes is a byte limit; count what the stream will write,
+            # not characters, so non-ASCII records cannot overshoot it
+            size = len(msg.encode(self.stream.encoding, self.stream.errors or 'strict'))
+            if self.maxBytes > 0 and self._rotatable and self._size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def _flush_loop(self) -> None:
+        """Flush buffered records periodically until the handler is closed."""
+        while not self._flush_stop.wait(self._flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                pass
+    
+    def close(self) -> None:
+        """Stop the background flusher, drop the exit hook and close the file."""
+        self._flush_stop.set()
+        # The exit hook holds a reference to this handler; release it so
+        # closed handlers can be collected
+        atexit.unregister(self.flush)
+        super().close()
 
 
 def setup_logging(config: Dict[str, Any]) -> None:
@@ -22,6 +164,7 @@ def setup_logging(config: Dict[str, Any]) -> None:
     log_file = config.get('file', 'logs/skyguard.log')
     max_size_mb = config.get('max_size_mb', 10)
     backup_count = config.get('backup_count', 5)
+    flush_interval_ms = config.get('flush_interval_ms', 250)
     
     # Create logs directory
     log_path = Path(log_file)
@@ -31,7 +174,7 @@ def setup_logging(config: Dict[str, Any]) -> None:
     numeric_level = getattr(logging, log_level, logging.INFO)
     
     # Create formatter
-    formatter = logging.Formatter(
+    formatter = FastFormatter(
         fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
@@ -53,11 +196,12 @@ def setup_logging(config: Dict[str, Any]) -> None:
         console_handler.stream = sys.stdout
         root_logger.addHandler(console_handler)
     
-    # File handler with rotation
-    file_handler = logging.handlers.RotatingFileHandler(
+    # File handler with rotation (buffered, flushed on a timer)
+    file_handler = FastRotatingFileHandler(
         log_file,
         maxBytes=max_size_mb * 1024 * 1024,  # Convert MB to bytes
-        backupCount=backup_count
+        backupCount=backup_count,
+        flush_interval_ms=flush_interval_ms
     )
     file_handler.setLevel(numeric_level)
     file_handler.setFormatter(formatter)
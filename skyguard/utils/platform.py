@@ -8,7 +8,8 @@ platform-specific configuration recommendations.
 import os
 import platform
 import logging
-from typing import Dict, Optional, Tuple
+import types
+from typing import Mapping, Optional, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -19,7 +20,7 @@ class PlatformDetector:
     
     def __init__(self) -> None:
         """Initialize the platform detector."""
-        self._platform_info: Optional[Dict[str, any]] = None
+        self._platform_info: Optional[Mapping[str, any]] = None
         self._detect_platform()
     
     def _detect_platform(self) -> None:
@@ -64,7 +65,8 @@ class PlatformDetector:
         if not is_gpu_available:
             is_gpu_available, gpu_name = self._check_cuda_availability()
         
-        self._platform_info = {
+        # Frozen read-only view: callers share it without a defensive copy
+        self._platform_info = types.MappingProxyType({
             'type': platform_type,
             'name': platform_name,
             'is_gpu_available': is_gpu_available,
@@ -74,7 +76,7 @@ class PlatformDetector:
             'machine': platform.machine(),
             'system': platform.system(),
             'processor': platform.processor(),
-        }
+        })
     
     def _is_jetson(self) -> bool:
         """Check if running on NVIDIA Jetson.
@@ -139,19 +141,12 @@ class PlatformDetector:
         if jetson_version:
             return f"NVIDIA Jetson {jetson_version}"
         
-        # Try to detect from nvidia-smi or other methods
+        # Fall back to whatever the device tree reports, even without 'jetson'
         try:
-            import subprocess
-            result = subprocess.run(
-                ['cat', '/proc/device-tree/model'],
-                capture_output=True,
-                timeout=2
-            )
-            if result.returncode == 0:
-                model = result.stdout.decode().strip()
-                if model:
-                    return model
-        except Exception:
+            model = Path('/proc/device-tree/model').read_text(errors='ignore').strip('\x00').strip()
+            if model:
+                return model
+        except OSError:
             pass
         
         return "NVIDIA Jetson"
@@ -217,13 +212,16 @@ class PlatformDetector:
         
         return False, None
     
-    def get_platform_info(self) -> Dict[str, any]:
+    def get_platform_info(self) -> Mapping[str, any]:
         """Get platform information.
         
+        The returned mapping is a read-only view shared between callers; use
+        ``dict(info)`` if a mutable copy is needed.
+        
         Returns:
-            Dictionary with platform information
+            Read-only mapping with platform information
         """
-        return self._platform_info.copy() if self._platform_info else {}
+        return self._platform_info if self._platform_info else types.MappingProxyType({})
     
     def is_jetson(self) -> bool:
         """Check if running on Jetson.
@@ -290,11 +288,11 @@ def get_platform_detector() -> PlatformDetector:
     return _platform_detector
 
 
-def detect_platform() -> Dict[str, any]:
+def detect_platform() -> Mapping[str, any]:
     """Detect and return platform information.
     
     Returns:
-        Dictionary with platform information
+        Read-only mapping with platform information
     """
     return get_platform_detector().get_platform_info()
 
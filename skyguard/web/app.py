@@ -5,19 +5,48 @@ SkyGuard Web Portal Application
 A Flask-based web interface for managing SkyGuard configuration and monitoring detections.
 """
 
+import bisect
+import logging
+import mmap
 import os
+import platform
+import re
+import sqlite3
+import subprocess
 import sys
-import json
+import threading
 import time
-import yaml
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
 
-from flask import Flask, render_template, request, jsonify, send_file
-from flask_cors import CORS
 import cv2
 import numpy as np
+from flask import Flask, Response, render_template, request, jsonify, send_file
+from flask.json.provider import DefaultJSONProvider
+from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
+
+# orjson is optional: it speeds up every jsonify() call but the portal
+# falls back to Flask's stdlib-based provider when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# waitress is optional: without it run() uses Flask's development server
+try:
+    import waitress
+except ImportError:
+    waitress = None
+
+# psutil is optional: without it host metrics and process checks are skipped.
+# Imported once here rather than inside the status checks that poll it.
+try:
+    import psutil
+except ImportError:
+    psutil = None
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent.parent
@@ -26,10 +55,155 @@ sys.path.insert(0, str(project_root))
 from skyguard.core.config_manager import ConfigManager
 from skyguard.storage.event_logger import EventLogger
 from skyguard.core.detector import RaptorDetector
-from skyguard.core.camera import CameraManager
 from skyguard.core.alert_system import AlertSystem
 
 
+# Written by skyguard.main while the detection loop is running
+PID_FILE = "data/skyguard.pid"
+# Refreshed by skyguard.main's CameraSnapshotService every few seconds
+SNAPSHOT_FILE = "data/camera_snapshot.jpg"
+
+# Sentinel for "key not provided" in config validation
+_MISSING = object()
+
+
+def _is_positive_int(value: Any) -> bool:
+    """Check a count-like config value (pixels, frames per second)."""
+    return isinstance(value, int) and value > 0
+
+
+def _is_fraction(value: Any) -> bool:
+    """Check a threshold config value in the range 0 to 1."""
+    return isinstance(value, (int, float)) and 0 <= value <= 1
+
+
+def _is_number(value: Any) -> bool:
+    """Check a numeric config value."""
+    return isinstance(value, (int, float))
+
+
+def _is_positive_number(value: Any) -> bool:
+    """Check an interval config value in seconds."""
+    return isinstance(value, (int, float)) and value > 0
+
+
+# Checks for config values, per section; only sections and keys a client sends are checked
+_CONFIG_RULES: Dict[str, Tuple[Tuple[str, Callable[[Any], bool]], ...]] = {
+    'camera': (
+        ('width', _is_positive_int),
+        ('height', _is_positive_int),
+        ('fps', _is_positive_int),
+    ),
+    'ai': (
+        ('confidence_threshold', _is_fraction),
+        ('nms_threshold', _is_fraction),
+        ('detection_log_level', lambda value: value in ('minimal', 'standard', 'detailed')),
+    ),
+    'system': (
+        ('detection_interval', _is_number),
+        ('max_detection_history', lambda value: isinstance(value, int)),
+    ),
+    'web': (
+        ('stats_ttl_seconds', _is_positive_number),
+    ),
+}
+
+# Upper bound on rows any list endpoint returns per request
+MAX_PAGE_SIZE = 500
+
+# Upper bound on request bodies; a full config serializes to a few KB
+MAX_REQUEST_BYTES = 64 * 1024
+
+# Detection images are written once before their row exists and ids are
+# never reused (AUTOINCREMENT), so browsers may keep them for a year
+DETECTION_IMAGE_MAX_AGE = 365 * 24 * 3600
+
+# Log line format: YYYY-MM-DD HH:MM:SS - module - LEVEL - message
+LOG_LINE_PATTERN = re.compile(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) - ([^-]+) - (\w+) - (.+)$')
+
+# Web response key, EventLogger record key and default for a stored detection
+_DETECTION_WEB_FIELDS = (
+    ('id', 'id', 0),
+    ('timestamp', 'timestamp', ''),
+    ('confidence', 'confidence', 0.0),
+    ('class', 'class_name', 'bird'),
+    ('bbox', 'bbox', (0, 0, 0, 0)),
+    ('image_path', 'image_path', ''),
+    ('species', 'species_name', None),
+    ('species_confidence', 'species_confidence', None),
+    ('segmented_image_path', 'segmented_image_path', None),
+    ('metadata', 'metadata', {}),
+)
+# Subset reported as the system's last detection
+_LAST_DETECTION_FIELDS = _DETECTION_WEB_FIELDS[:5]
+
+
+@lru_cache(maxsize=4096)
+def _join_project_path(root: str, path: str) -> str:
+    """Join a stored image path onto the absolute project root.
+    
+    Pure string work, so it is safe to memoize: the detections grid asks for
+    the same few hundred paths on every refresh.
+    """
+    if os.path.isabs(path):
+        return path
+    # Joining onto an already-absolute root needs no abspath()/getcwd()
+    return os.path.join(root, path)
+
+
+@lru_cache(maxsize=4096)
+def _parse_log_timestamp(timestamp_str: str) -> float:
+    """Convert a ``YYYY-MM-DD HH:MM:SS`` local time to a Unix timestamp.
+    
+    Slices the fixed-width fields instead of calling ``strptime``. Memoized
+    because a tailed log repeats the same few seconds many times over, both
+    within one read and across re-reads as the log grows.
+    
+    Raises:
+        ValueError: If the string is not in that format or not a valid time
+    """
+    s = timestamp_str
+    digits = s[0:4] + s[5:7] + s[8:10] + s[11:13] + s[14:16] + s[17:19]
+    if (len(s) != 19 or s[4] != '-' or s[7] != '-' or s[10] != ' ' or s[13] != ':' or s[16] != ':'
+            or not (digits.isascii() and digits.isdigit())):
+        raise ValueError(f"Bad log timestamp: {timestamp_str!r}")
+    return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                    int(s[11:13]), int(s[14:16]), int(s[17:19])).timestamp()
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+    
+    Honors Flask's ``sort_keys`` and ``compact`` settings, serializes NumPy
+    arrays/scalars natively, and falls back to Flask's ``default`` hook for
+    types orjson does not know (dates, UUIDs, dataclasses).
+    """
+    
+    def _options(self, indent: bool = False) -> int:
+        """Build the orjson option flags for the current settings."""
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize ``obj`` to a JSON string."""
+        return orjson.dumps(obj, default=self.default, option=self._options(bool(kwargs.get('indent')))).decode()
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Deserialize JSON from ``str`` or ``bytes``."""
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Serialize the arguments straight to a JSON response body."""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(obj, default=self.default, option=self._options(indent)) + b"\n"
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 class SkyGuardWebPortal:
     """SkyGuard Web Portal for configuration and monitoring."""
     
@@ -37,16 +211,20 @@ class SkyGuardWebPortal:
         """Initialize the web portal."""
         self.app = Flask(__name__)
         self.app.secret_key = os.urandom(24)
+        # Oversized bodies are refused with a 413 before they are parsed
+        self.app.config['MAX_CONTENT_LENGTH'] = MAX_REQUEST_BYTES
+        if orjson is not None:
+            self.app.json = OrjsonProvider(self.app)
         CORS(self.app)
         
-        # Initialize components
-        self.config_manager = ConfigManager(config_path)
+        # Initialize components; the JSON parse cache speeds up portal restarts
+        self.config_manager = ConfigManager(config_path, disk_cache=True)
         
         # Load configuration first
         self.config = self.config_manager.get_config()
+        self._refresh_cached_flags()
         
         # Setup logger
-        import logging
         self.logger = logging.getLogger(__name__)
         
         # Initialize event logger with config
@@ -56,13 +234,82 @@ class SkyGuardWebPortal:
             self.event_logger.initialize()
         except Exception:
             pass
-        self.detector = None
+        # Built on first use (see the ``detector`` property): importing torch
+        # and loading weights would otherwise block portal startup
+        self._detector: Optional[RaptorDetector] = None
+        self._detector_lock = threading.Lock()
+        # Bumped by every config change; a build started under an older
+        # generation is stale and is not installed
+        self._detector_generation = 0
         self.camera = None
         self.alert_system = None
         
+        # Fallback camera frame: static background rendered once, JPEG
+        # re-encoded once per second by a background refresher while the
+        # feed is being requested (see _get_fallback_frame)
+        self._fallback_base_bgr = None
+        self._fallback_jpeg: Tuple[int, Optional[bytes]] = (-1, None)
+        self._fallback_lock = threading.Lock()
+        self._fallback_refresher_running = False
+        self._fallback_last_request = float('-inf')
+        self._fallback_idle_timeout = 10.0
+        
+        # Serialized /api/config body and the config object it was built from
+        self._config_json: Tuple[Optional[Dict[str, Any]], bytes] = (None, b'')
+        
+        # Parsed tail of the log file: ((path, inode, size, mtime_ns, lines), entries,
+        # entry timestamps); entries are sorted, so ``since`` is a bisect
+        self._log_tail_cache: Tuple[Optional[tuple], List[Dict[str, Any]], List[float]] = (None, [], [])
+        
+        # Serialized polling payloads: route name -> (expires_at, JSON body)
+        self._response_cache: Dict[str, Tuple[float, bytes]] = {}
+        self._response_cache_ttl = 1.5
+        # One lock per slot: concurrent misses wait for a single rebuild
+        self._response_build_locks: Dict[str, threading.Lock] = {}
+        
+        # /api/events fan-out: one publisher thread rebuilds the status body
+        # and wakes every open stream when it changes
+        self._status_cond = threading.Condition()
+        self._status_event: Tuple[int, bytes] = (0, b'')  # (sequence, body)
+        self._status_subscribers = 0
+        self._status_publisher_running = False
+        self._status_push_interval = 2.0
+        
+        # Every open stream pins a server worker thread; past _max_streams
+        # new ones get a 503 and the page polls instead (run() scales the
+        # cap to the thread pool)
+        self._stream_lock = threading.Lock()
+        self._open_streams = 0
+        self._max_streams = 4
+        
+        # Absolute project root for resolving stored image paths
+        self._project_root_abs = str(project_root.resolve())
+        
+        # Boot time cannot change while we run; read lazily by _get_boot_time
+        self._boot_time: Optional[float] = None
+        
+        # Host metrics refreshed by a background sampler (see _get_system_metrics)
+        self._sys_stats: Optional[Dict[str, Any]] = None
+        self._sys_stats_lock = threading.Lock()
+        self._sampler_stop = threading.Event()
+        
+        # Dashboard range counts: ((window starts, db version), expires_at, counts)
+        self._count_cache: Optional[Tuple[Tuple[Tuple[float, ...], Any], float, Dict[str, int]]] = None
+        self._count_cache_ttl = 60.0
+        self._count_error_logged = False
+        self._day_start: Tuple[float, float] = (0.0, 0.0)  # (local midnight, next local midnight)
+        
+        # Result of the last process-table scan in _is_system_running
+        self._process_scan_cache: Tuple[float, bool] = (float('-inf'), False)
+        self._process_scan_ttl = 5.0
+        # Process the last scan matched; re-checked alone before scanning again
+        self._skyguard_proc: Optional[Any] = None  # psutil.Process
+        
         # Track last reload attempt to prevent excessive reloads
-        self._last_reload_attempt = 0
+        self._last_reload_attempt = float('-inf')  # time.monotonic() of the last attempt
         self._reload_cooldown = 60  # Only attempt reload once per minute
+        # Last usability probe per model slot: (model object, usable)
+        self._model_checks: Dict[str, Tuple[Any, bool]] = {}
         
         # Setup routes
         self._setup_routes()
@@ -80,65 +327,62 @@ class SkyGuardWebPortal:
         
         @self.app.route('/api/status')
         def api_status():
-            """Get system status."""
+            """Get system status.
+            
+            The body is reused for ``_response_cache_ttl`` seconds, and
+            requests arriving while it is rebuilt wait for that rebuild, so
+            several dashboard tabs polling at once share one round of checks.
+            """
             try:
-                status = {
-                    'system': {
-                        'status': 'running' if self._is_system_running() else 'stopped',
-                        'uptime': self._get_uptime(),
-                        'last_detection': self._get_last_detection(),
-                        'total_detections': self._get_total_detections(),
-                        'memory_usage': self._get_memory_usage(),
-                    },
-                    'camera': {
-                        'connected': self._is_camera_connected(),
-                        'source': self.config.get('camera', {}).get('source', 0),
-                        'width': self.config.get('camera', {}).get('width', 640),
-                        'height': self.config.get('camera', {}).get('height', 480),
-                        'fps': self.config.get('camera', {}).get('fps', 30),
-                    },
-                    'ai': {
-                        'loaded': self._is_model_loaded(),
-                        'model_loaded': self._is_model_loaded(),  # Alias for consistency
-                        'model_path': self.config.get('ai', {}).get('model_path', 'models/yolo11n-seg.pt'),
-                        'confidence_threshold': self.config.get('ai', {}).get('confidence_threshold', 0.5),
-                        'detection_log_level': self.config.get('ai', {}).get('detection_log_level', 'standard'),
-                        'classes': self.config.get('ai', {}).get('classes', []),
-                        'species_model_loaded': self._is_species_model_loaded(),
-                    },
-                    'detections': {
-                        'total': self._get_total_detections(),
-                        'recent': len(self._get_recent_detections(limit=5)),
-                    },
-                    'notifications': {
-                        'audio_enabled': self.config.get('notifications', {}).get('audio', {}).get('enabled', False),
-                        'sms_enabled': self.config.get('notifications', {}).get('sms', {}).get('enabled', False),
-                        'email_enabled': self.config.get('notifications', {}).get('email', {}).get('enabled', False),
-                        'discord_enabled': self.config.get('notifications', {}).get('discord', {}).get('enabled', False),
-                    }
-                }
-                return jsonify(status)
+                body = self._cached_body('status', self._build_status_body)
+                return Response(body, mimetype='application/json')
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
         
+        @self.app.route('/api/events')
+        def api_events():
+            """Stream ``/api/status`` bodies as Server-Sent Events.
+            
+            A single publisher thread builds the payload for all open
+            streams and only pushes it when it changed, so an idle tab costs
+            a keepalive comment instead of a full poll.
+            """
+            response = self._stream_response(self._iter_status_events(), 'text/event-stream')
+            if response.status_code == 200:
+                response.headers['Cache-Control'] = 'no-cache'
+                # Stop reverse proxies from buffering the stream
+                response.headers['X-Accel-Buffering'] = 'no'
+            return response
+        
         @self.app.route('/api/detections')
         def api_detections():
-            """Get recent detections."""
+            """Get recent detections.
+            
+            Pages with ``?before_id=<id>&limit=<n>`` and follows the returned
+            ``next_cursor``. The ``offset`` parameter is deprecated; it still
+            works but costs a scan of every skipped row.
+            """
             try:
-                limit = request.args.get('limit', 50, type=int)
+                limit = self._get_limit_arg(50)
                 offset = request.args.get('offset', 0, type=int)
+                before_id = request.args.get('before_id', None, type=int)
                 species = request.args.get('species', None, type=str)
                 class_name = request.args.get('class', None, type=str)
                 
-                detections = self._get_recent_detections(limit, offset, species=species, class_name=class_name)
+                if before_id is not None:
+                    offset = 0
+                detections = self._get_recent_detections(limit, offset, species=species, class_name=class_name,
+                                                          before_id=before_id)
                 total = self._get_total_detections()
                 page = (offset // limit) + 1
+                next_cursor = detections[-1]['id'] if len(detections) == limit else None
                 
                 return jsonify({
                     'detections': detections,
                     'total': total,
                     'page': page,
-                    'limit': limit
+                    'limit': limit,
+                    'next_cursor': next_cursor
                 })
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
@@ -149,19 +393,7 @@ class SkyGuardWebPortal:
             try:
                 detection = self.event_logger.get_detection_by_id(detection_id)
                 if detection:
-                    # Normalize response keys for web consumption
-                    return jsonify({
-                        'id': detection.get('id', 0),
-                        'timestamp': detection.get('timestamp', ''),
-                        'confidence': detection.get('confidence', 0.0),
-                        'class': detection.get('class_name', 'bird'),
-                        'bbox': detection.get('bbox', [0, 0, 0, 0]),
-                        'image_path': detection.get('image_path', ''),
-                        'species': detection.get('species_name'),
-                        'species_confidence': detection.get('species_confidence'),
-                        'segmented_image_path': detection.get('segmented_image_path'),
-                        'metadata': detection.get('metadata', {}),
-                    })
+                    return jsonify(self._web_detection(detection))
                 return jsonify({'error': 'Detection not found'}), 404
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
@@ -171,14 +403,9 @@ class SkyGuardWebPortal:
             """Get detection image."""
             try:
                 record = self.event_logger.get_detection_by_id(detection_id)
-                image_path = (record or {}).get('image_path')
-                if image_path:
-                    # Resolve relative paths to absolute within project root
-                    abs_path = image_path
-                    if not os.path.isabs(abs_path):
-                        abs_path = os.path.abspath(os.path.join(project_root, image_path))
-                    if os.path.exists(abs_path):
-                        return send_file(abs_path, mimetype='image/jpeg')
+                response = self._send_stored_image((record or {}).get('image_path'))
+                if response is not None:
+                    return response
                 return jsonify({'error': 'Image not found'}), 404
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
@@ -187,34 +414,33 @@ class SkyGuardWebPortal:
         def api_detection_segmented_image(detection_id: int):
             """Get segmented detection image with species annotations."""
             try:
-                record = self.event_logger.get_detection_by_id(detection_id)
-                segmented_image_path = (record or {}).get('segmented_image_path')
-                if segmented_image_path:
-                    # Resolve relative paths to absolute within project root
-                    abs_path = segmented_image_path
-                    if not os.path.isabs(abs_path):
-                        abs_path = os.path.abspath(os.path.join(project_root, segmented_image_path))
-                    if os.path.exists(abs_path):
-                        return send_file(abs_path, mimetype='image/jpeg')
-                # Fallback to regular image if segmented not available
-                image_path = (record or {}).get('image_path')
-                if image_path:
-                    abs_path = image_path
-                    if not os.path.isabs(abs_path):
-                        abs_path = os.path.abspath(os.path.join(project_root, image_path))
-                    if os.path.exists(abs_path):
-                        return send_file(abs_path, mimetype='image/jpeg')
+                record = self.event_logger.get_detection_by_id(detection_id) or {}
+                response = self._send_stored_image(record.get('segmented_image_path'))
+                if response is None:
+                    # Fallback to regular image if segmented not available
+                    response = self._send_stored_image(record.get('image_path'))
+                if response is not None:
+                    return response
                 return jsonify({'error': 'Image not found'}), 404
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
         
         @self.app.route('/api/config')
         def api_get_config():
-            """Get current configuration."""
+            """Get current configuration.
+            
+            The merged, redacted JSON body only changes when ``self.config``
+            is replaced, so it is serialized once per config object.
+            """
             try:
                 # Ensure config is loaded and has all required sections
                 if not self.config:
                     self.config = self.config_manager.get_config()
+                    self._refresh_cached_flags()
+                
+                cached_config, cached_body = self._config_json
+                if cached_config is self.config:
+                    return Response(cached_body, mimetype='application/json')
                 
                 # Ensure all required sections exist with defaults
                 default_config = {
@@ -268,9 +494,12 @@ class SkyGuardWebPortal:
                 ]:
                     section_cfg = notif.get(section, {})
                     if section_cfg.get(key):
-                        section_cfg[key] = _REDACTED
+                        # Copy first: the section dict is shared with self.config
+                        notif[section] = {**section_cfg, key: _REDACTED}
 
-                return jsonify(merged_config)
+                response = jsonify(merged_config)
+                self._config_json = (self.config, response.get_data())
+                return response
             except Exception as e:
                 self.logger.error(f"Failed to get config: {e}")
                 return jsonify({'error': str(e)}), 500
@@ -283,9 +512,9 @@ class SkyGuardWebPortal:
                 if not request.is_json:
                     return jsonify({'error': 'Content-Type must be application/json'}), 400
                 
-                try:
-                    new_config = request.get_json()
-                except Exception as e:
+                # silent=True returns None for a malformed body instead of raising
+                new_config = request.get_json(silent=True, cache=False)
+                if new_config is None:
                     return jsonify({'error': 'Invalid JSON data'}), 400
                 
                 if not new_config:
@@ -310,6 +539,9 @@ class SkyGuardWebPortal:
                     # Update configuration
                     self.config_manager.update_config(new_config)
                     self.config = new_config
+                    self._refresh_cached_flags()
+                    # Status and stats echo config values
+                    self._response_cache.clear()
                     
                     # Restart components if camera or AI settings changed
                     if 'camera' in new_config or 'ai' in new_config:
@@ -322,6 +554,8 @@ class SkyGuardWebPortal:
                     return jsonify({'success': True, 'message': 'Configuration updated successfully'})
                 else:
                     return jsonify({'error': 'Invalid configuration'}), 400
+            except RequestEntityTooLarge:
+                return jsonify({'error': 'Configuration too large'}), 413
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
         
@@ -341,21 +575,13 @@ class SkyGuardWebPortal:
             """Get camera status."""
             try:
                 # Check if camera snapshot file exists and is recent
-                snapshot_file = "data/camera_snapshot.jpg"
+                snapshot = self._stat_snapshot()
                 
-                if os.path.exists(snapshot_file):
+                if snapshot is not None:
                     # Check if file is recent (within last 10 seconds)
-                    file_time = os.path.getmtime(snapshot_file)
-                    current_time = time.time()
-                    is_recent = (current_time - file_time) < 10
+                    is_recent = (time.time() - snapshot.st_mtime) < 10
                     
-                    return jsonify({
-                        'connected': is_recent,
-                        'source': self.config.get('camera', {}).get('source', 0),
-                        'width': self.config.get('camera', {}).get('width', 640),
-                        'height': self.config.get('camera', {}).get('height', 480),
-                        'fps': self.config.get('camera', {}).get('fps', 30)
-                    })
+                    return jsonify({'connected': is_recent, **self._camera_defaults})
                 else:
                     return jsonify({'connected': False, 'error': 'No camera snapshot available'})
             except Exception as e:
@@ -365,71 +591,54 @@ class SkyGuardWebPortal:
         def api_camera_feed():
             """Get camera feed frame."""
             try:
-                import os
-                
                 # Read the snapshot file directly
-                snapshot_file = "data/camera_snapshot.jpg"
+                snapshot_file = SNAPSHOT_FILE
                 
                 if os.path.exists(snapshot_file):
-                    with open(snapshot_file, 'rb') as f:
-                        feed_bytes = f.read()
-                    
-                    from flask import Response
-                    return Response(feed_bytes, mimetype='image/jpeg')
+                    # Conditional response: pollers get a 304 until the snapshot changes
+                    return send_file(os.path.abspath(snapshot_file), mimetype='image/jpeg',
+                                     conditional=True, max_age=0)
                 else:
-                    # Create a simple test image if no snapshot available
-                    import cv2
-                    import numpy as np
-                    
-                    # Create a test image
-                    img = np.zeros((480, 640, 3), dtype=np.uint8)
-                    
-                    # Add a gradient background
-                    for y in range(480):
-                        for x in range(640):
-                            img[y, x] = [int(255 * y / 480), int(255 * x / 640), 100]
-                    
-                    # Add text
-                    font = cv2.FONT_HERSHEY_SIMPLEX
-                    cv2.putText(img, 'SkyGuard Camera Feed', (50, 100), font, 1, (255, 255, 255), 2)
-                    cv2.putText(img, 'No camera snapshot available', (50, 150), font, 0.7, (200, 200, 200), 2)
-                    cv2.putText(img, 'Main process not running', (50, 200), font, 0.7, (200, 200, 200), 2)
-                    
-                    # Add timestamp
-                    import time
-                    timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-                    cv2.putText(img, timestamp, (50, 400), font, 0.5, (150, 150, 150), 1)
-                    
-                    # Encode as JPEG
-                    ret, buffer = cv2.imencode('.jpg', img, [cv2.IMWRITE_JPEG_QUALITY, 85])
-                    if ret:
-                        from flask import Response
-                        return Response(buffer.tobytes(), mimetype='image/jpeg')
+                    # Serve a test image if no snapshot available
+                    fallback_bytes = self._get_fallback_frame()
+                    if fallback_bytes is not None:
+                        # The cached frame only changes once a second; repeat
+                        # polls within that second revalidate to a bodiless 304
+                        response = Response(fallback_bytes, mimetype='image/jpeg')
+                        response.add_etag()
+                        response.cache_control.max_age = 0
+                        return response.make_conditional(request)
                     else:
                         return "Failed to create test image", 500
                 
             except Exception as e:
                 return f"Camera feed error: {str(e)}", 500
         
+        @self.app.route('/api/camera/stream')
+        def api_camera_stream():
+            """Push camera snapshots as an MJPEG stream whenever they change.
+            
+            Shares the stream cap with ``/api/events``; a 503 makes the
+            dashboard's ``<img>`` error out and fall back to polling.
+            """
+            return self._stream_response(self._iter_snapshot_stream(SNAPSHOT_FILE),
+                                         'multipart/x-mixed-replace; boundary=frame')
+        
         @self.app.route('/api/camera/capture')
         def api_camera_capture():
             """Capture and download image."""
             try:
-                import os
-                import time
-                
                 # Read the snapshot file directly
-                snapshot_file = "data/camera_snapshot.jpg"
+                snapshot_file = SNAPSHOT_FILE
                 
                 if os.path.exists(snapshot_file):
-                    with open(snapshot_file, 'rb') as f:
-                        image_data = f.read()
-                    
-                    from flask import Response
-                    return Response(
-                        image_data,
+                    return send_file(
+                        os.path.abspath(snapshot_file),
                         mimetype='image/jpeg',
-                        headers={'Content-Disposition': f'attachment; filename=skyguard_capture_{int(time.time())}.jpg'}
+                        as_attachment=True,
+                        download_name=f'skyguard_capture_{int(time.time())}.jpg',
+                        conditional=True,
+                        max_age=0
                     )
                 else:
                     return "No camera snapshot available", 404
@@ -474,59 +683,18 @@ class SkyGuardWebPortal:
                 except Exception:
                     pass
                 
-                # Get recent detections for confidence stats
-                recent_detections = []
+                # Confidence and species stats over the last 100 detections,
+                # aggregated in SQL rather than over fetched rows
                 confidence_stats = {
                     'avg': 0.0,
                     'min': 1.0,
                     'max': 0.0,
                     'count': 0
                 }
-                species_stats = {
-                    'total_classifications': 0,
-                    'successful_identifications': 0,
-                    'species_breakdown': {}
-                }
-                
-                try:
-                    recent_detections = self.event_logger.get_detections(limit=100)
-                    if recent_detections:
-                        confidences = [d.get('confidence', 0.0) for d in recent_detections if d.get('confidence')]
-                        if confidences:
-                            confidence_stats = {
-                                'avg': sum(confidences) / len(confidences),
-                                'min': min(confidences),
-                                'max': max(confidences),
-                                'count': len(confidences)
-                            }
-                        
-                        # Species statistics
-                        species_detections = [d for d in recent_detections if d.get('species')]
-                        species_stats['total_classifications'] = len([d for d in recent_detections if d.get('species_confidence')])
-                        species_stats['successful_identifications'] = len(species_detections)
-                        
-                        # Species breakdown
-                        for det in species_detections:
-                            species = det.get('species', 'Unknown')
-                            if species not in species_stats['species_breakdown']:
-                                species_stats['species_breakdown'][species] = {
-                                    'count': 0,
-                                    'avg_confidence': 0.0,
-                                    'confidences': []
-                                }
-                            species_stats['species_breakdown'][species]['count'] += 1
-                            if det.get('species_confidence'):
-                                species_stats['species_breakdown'][species]['confidences'].append(
-                                    det.get('species_confidence')
-                                )
-                        
-                        # Calculate averages
-                        for species in species_stats['species_breakdown']:
-                            confs = species_stats['species_breakdown'][species]['confidences']
-                            if confs:
-                                species_stats['species_breakdown'][species]['avg_confidence'] = sum(confs) / len(confs)
-                except Exception:
-                    pass
+                aggregates = self.event_logger.get_confidence_aggregates(limit=100)
+                if aggregates['count']:
+                    confidence_stats = {key: aggregates[key] for key in ('avg', 'min', 'max', 'count')}
+                species_stats = self.event_logger.get_species_breakdown(limit=100)
                 
                 # Model information
                 model_info = {
@@ -557,7 +725,6 @@ class SkyGuardWebPortal:
                         if species_model_path and not species_model_loaded:
                             # Check if the model file exists
                             try:
-                                from pathlib import Path
                                 resolved_path = self.detector._resolve_model_path(species_model_path)
                                 if not resolved_path.exists():
                                     species_model_error = f"Model file not found: {resolved_path}"
@@ -586,7 +753,7 @@ class SkyGuardWebPortal:
                     'detection_stats': detection_stats,
                     'confidence_stats': confidence_stats,
                     'species_stats': species_stats,
-                    'recent_detections_count': len(recent_detections)
+                    'recent_detections_count': aggregates['detections']
                 })
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
@@ -596,13 +763,13 @@ class SkyGuardWebPortal:
             """Return paginated alert delivery history from the database.
 
             Query params:
-                limit  (int, default 50): Maximum records to return.
+                limit  (int, default 50): Maximum records to return (1-500).
                 offset (int, default  0): Records to skip.
                 channel (str, optional): Filter by channel name.
                 status  (str, optional): Filter by delivery status.
             """
             try:
-                limit = request.args.get('limit', 50, type=int)
+                limit = self._get_limit_arg(50)
                 offset = request.args.get('offset', 0, type=int)
                 channel = request.args.get('channel', None, type=str)
                 status = request.args.get('status', None, type=str)
@@ -626,10 +793,7 @@ class SkyGuardWebPortal:
                     return jsonify({
                         'success': True,
                         'message': 'Alert system test successful',
-                        'audio_enabled': self.config.get('notifications', {}).get('audio', {}).get('enabled', False),
-                        'sms_enabled': self.config.get('notifications', {}).get('sms', {}).get('enabled', False),
-                        'email_enabled': self.config.get('notifications', {}).get('email', {}).get('enabled', False),
-                        'discord_enabled': self.config.get('notifications', {}).get('discord', {}).get('enabled', False)
+                        **self._notif_flags,
                     })
                 else:
                     return jsonify({'error': 'Alert system test failed'}), 500
@@ -649,7 +813,7 @@ class SkyGuardWebPortal:
         def api_get_logs():
             """Get system logs."""
             try:
-                limit = request.args.get('limit', 500, type=int)
+                limit = self._get_limit_arg(500)
                 since = request.args.get('since', None, type=float)  # Unix timestamp
                 logs = self._get_system_logs(limit, since)
                 return jsonify({
@@ -662,30 +826,19 @@ class SkyGuardWebPortal:
         
         @self.app.route('/api/stats')
         def api_get_stats():
-            """Get system statistics."""
+            """Get system statistics.
+            
+            Like ``/api/status``, the body is reused for a short TTL.
+            """
             try:
-                stats = self._get_system_stats()
-                return jsonify({
-                    'detections': {
-                        'total': self._get_total_detections(),
-                        'today': stats.get('detections_today', 0),
-                        'this_week': stats.get('detections_this_week', 0),
-                        'this_month': stats.get('detections_this_month', 0)
-                    },
-                    'system': {
-                        'uptime': stats.get('uptime', 0),
-                        'memory_usage': stats.get('memory_percent', 0),
-                        'cpu_usage': stats.get('cpu_percent', 0),
-                        'disk_usage': stats.get('disk_percent', 0),
-                        'processes': stats.get('processes', 0)
-                    },
-                    'performance': {
-                        'avg_detection_time': 0.5,  # Placeholder
-                        'fps': self.config.get('camera', {}).get('fps', 30),
-                        'model_accuracy': 0.85,  # Placeholder
-                        'total_detections': self._get_total_detections()
-                    }
-                })
+                body = self._cached_body('stats', self._build_stats_body)
+                response = Response(body, mimetype='application/json')
+                # Make dashboards and proxies revalidate every poll with
+                # If-None-Match, so they get a bodiless 304 while the numbers
+                # are unchanged but never show stale counts
+                response.add_etag()
+                response.cache_control.no_cache = True
+                return response.make_conditional(request)
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
         
@@ -721,43 +874,83 @@ class SkyGuardWebPortal:
                     'timestamp': time.time()
                 }), 500
     
-    def _initialize_components(self):
-        """Initialize SkyGuard components."""
-        try:
-            # Initialize detector with AI config
-            ai_config = self.config.get('ai', {})
-            self.detector = RaptorDetector(ai_config)
-            # Load the model
-            if self.detector.load_model():
-                print("✅ Detector initialized and model loaded successfully")
-                # Check species model status
-                species_path = ai_config.get('species_model_path')
-                if species_path:
-                    if self.detector.species_model is not None:
-                        print(f"✅ Species model loaded: {species_path}")
-                    else:
-                        print(f"⚠️ Species model path configured ({species_path}) but model not loaded")
-                        # Try to diagnose the issue
-                        try:
-                            from pathlib import Path
-                            resolved = self.detector._resolve_model_path(species_path)
-                            if resolved.exists():
-                                print(f"   Model file exists at: {resolved}")
-                                print(f"   Attempting to reload species model...")
-                                self.detector._init_species_backend()
-                                if self.detector.species_model is not None:
-                                    print(f"   ✅ Species model reloaded successfully")
-                                else:
-                                    print(f"   ❌ Species model still not loaded - check logs for errors")
-                            else:
-                                print(f"   ❌ Model file not found at: {resolved}")
-                                print(f"   Please verify the path in config/skyguard.yaml")
-                        except Exception as e:
-                            print(f"   ❌ Error checking species model: {e}")
+    @property
+    def detector(self) -> Optional[RaptorDetector]:
+        """The portal's detector, built and loaded on first access.
+        
+        Concurrent first accesses wait for a single build. Only routes that
+        use the model (``api_test_ai``, ``api_ai_stats``) go through here;
+        status checks read ``self._detector`` so they never trigger a load.
+        A build overtaken by a config change still serves its caller but is
+        not kept, so the next access builds from the new config.
+        """
+        detector = self._detector
+        if detector is not None:
+            return detector
+        with self._detector_lock:
+            detector = self._detector
+            if detector is None:
+                generation = self._detector_generation
+                detector = self._build_detector()
+                self._detector = detector
+                # Checked after installing: _initialize_components bumps the
+                # generation before clearing, so either it clears this
+                # detector or this check sees the new generation
+                if self._detector_generation != generation:
+                    self._detector = None
+            return detector
+    
+    @detector.setter
+    def detector(self, value: Optional[RaptorDetector]) -> None:
+        self._detector = value
+    
+    def _build_detector(self) -> RaptorDetector:
+        """Create the detector from the AI config and load its models."""
+        ai_config = self.config.get('ai', {})
+        detector = RaptorDetector(ai_config)
+        # Load the model
+        if detector.load_model():
+            print("✅ Detector initialized and model loaded successfully")
+            # Check species model status
+            species_path = ai_config.get('species_model_path')
+            if species_path:
+                if detector.species_model is not None:
+                    print(f"✅ Species model loaded: {species_path}")
                 else:
-                    print("ℹ️ Species model not configured (species_model_path not set)")
+                    print(f"⚠️ Species model path configured ({species_path}) but model not loaded")
+                    # Try to diagnose the issue
+                    try:
+                        resolved = detector._resolve_model_path(species_path)
+                        if resolved.exists():
+                            print(f"   Model file exists at: {resolved}")
+                            print(f"   Attempting to reload species model...")
+                            detector._init_species_backend()
+                            if detector.species_model is not None:
+                                print(f"   ✅ Species model reloaded successfully")
+                            else:
+                                print(f"   ❌ Species model still not loaded - check logs for errors")
+                        else:
+                            print(f"   ❌ Model file not found at: {resolved}")
+                            print(f"   Please verify the path in config/skyguard.yaml")
+                    except Exception as e:
+                        print(f"   ❌ Error checking species model: {e}")
             else:
-                print("⚠️ Detector initialized but model loading failed")
+                print("ℹ️ Species model not configured (species_model_path not set)")
+        else:
+            print("⚠️ Detector initialized but model loading failed")
+        return detector
+    
+    def _initialize_components(self):
+        """Initialize SkyGuard components.
+        
+        The detector is only dropped here; it is rebuilt from the current
+        config the next time it is needed. No lock is taken, so a config
+        save never waits for a model load in progress; that build is
+        discarded through the generation counter instead.
+        """
+        try:
+            self._detector_generation += 1
+            self._detector = None
             
             # Web portal does NOT access camera directly - it only reads snapshots
             # The main SkyGuard system handles all camera operations
@@ -775,25 +968,51 @@ class SkyGuardWebPortal:
             
         except Exception as e:
             print(f"❌ Failed to initialize components: {e}")
-            import traceback
-            traceback.print_exc()
+            self.logger.debug("Component initialization traceback", exc_info=True)
     
     def _is_system_running(self) -> bool:
         """Check if SkyGuard system is running.
         
         Uses multiple methods to detect if the main system is running:
-        1. Check for process with 'skyguard.main' in command line
-        2. Check for recent camera snapshot file (indicates active system)
+        1. Check the PID file written by the main process, if that PID is
+           still running SkyGuard
+        2. Check for process with 'skyguard.main' in command line (result
+           cached for a few seconds; the process found last time is checked
+           on its own before the whole process table is read again)
+        3. Check for recent camera snapshot file (indicates active system)
         """
         try:
-            # Method 1: Check for process
             try:
-                import psutil
-                for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                    cmdline = ' '.join(proc.info['cmdline'] or [])
-                    # Check for main system process
-                    if 'skyguard.main' in cmdline or 'skyguard/main.py' in cmdline:
+                if psutil is None:
+                    raise ImportError("psutil is not installed")
+                
+                # Method 1: Check the PID file. The PID's command line must
+                # be SkyGuard's: a file left behind by a crash may name a PID
+                # the OS has since given to another process.
+                try:
+                    pid = int(Path(PID_FILE).read_text().strip())
+                    if self._proc_is_skyguard(psutil.Process(pid)):
                         return True
+                except (OSError, ValueError, psutil.Error):
+                    pass
+                
+                # Method 2: Check for process
+                checked_at, found = self._process_scan_cache
+                now = time.monotonic()
+                if now - checked_at >= self._process_scan_ttl:
+                    found = self._skyguard_proc is not None and self._proc_is_skyguard(self._skyguard_proc)
+                    if not found:
+                        self._skyguard_proc = None
+                        # Only cmdline is prefetched; the Process handle is kept
+                        for proc in psutil.process_iter(['cmdline']):
+                            cmdline = proc.info['cmdline']
+                            if cmdline and self._is_skyguard_cmdline(cmdline):
+                                self._skyguard_proc = proc
+                                found = True
+                                break
+                    self._process_scan_cache = (now, found)
+                if found:
+                    return True
             except ImportError:
                 # psutil not available, fall back to other methods
                 pass
@@ -801,15 +1020,13 @@ class SkyGuardWebPortal:
                 # Process check failed, try other methods
                 pass
             
-            # Method 2: Check for recent camera snapshot (indicates active system)
-            snapshot_file = Path("data/camera_snapshot.jpg")
-            if snapshot_file.exists():
+            # Method 3: Check for recent camera snapshot (indicates active system)
+            snapshot = self._stat_snapshot()
+            if snapshot is not None:
                 # Check if file is recent (within last 30 seconds)
-                file_time = snapshot_file.stat().st_mtime
-                current_time = time.time()
-                if (current_time - file_time) < 30:
+                if (time.time() - snapshot.st_mtime) < 30:
                     # Also check file size - real camera images are typically > 50KB
-                    if snapshot_file.stat().st_size > 50000:
+                    if snapshot.st_size > 50000:
                         return True
             
             return False
@@ -817,27 +1034,125 @@ class SkyGuardWebPortal:
             self.logger.debug(f"Error checking if system is running: {e}")
             return False
     
+    @staticmethod
+    def _is_skyguard_cmdline(cmdline: List[str]) -> bool:
+        """Check whether a command line runs the main SkyGuard system.
+        
+        Called for every process in a scan, so arguments are tested one at a
+        time without joining them: neither pattern contains a space, so it
+        can never span two arguments.
+        """
+        for arg in cmdline:
+            if 'skyguard' in arg:
+                arg = arg.replace('\\', '/')  # Windows script paths
+                if 'skyguard.main' in arg or 'skyguard/main.py' in arg:
+                    return True
+        return False
+    
+    def _find_skyguard_processes(self) -> List[Any]:
+        """Find the running main SkyGuard processes.
+        
+        The process last matched by ``_is_system_running`` is re-checked on
+        its own first; the full process table is only walked when it has
+        exited.
+        
+        Returns:
+            List of ``psutil.Process`` handles, possibly empty
+        """
+        if self._skyguard_proc is not None and self._proc_is_skyguard(self._skyguard_proc):
+            return [self._skyguard_proc]
+        self._skyguard_proc = None
+        procs = []
+        for proc in psutil.process_iter(['cmdline']):
+            cmdline = proc.info['cmdline']
+            if cmdline and self._is_skyguard_cmdline(cmdline):
+                procs.append(proc)
+        if procs:
+            self._skyguard_proc = procs[0]
+        return procs
+    
+    def _proc_is_skyguard(self, proc: Any) -> bool:
+        """Check that a cached ``psutil.Process`` is still the main SkyGuard process.
+        
+        Reads one ``/proc/<pid>/cmdline`` instead of the whole process table;
+        the command line check also rejects a reused PID.
+        """
+        try:
+            return self._is_skyguard_cmdline(proc.cmdline())
+        except psutil.Error:
+            return False
+    
+    def _get_boot_time(self) -> float:
+        """Get the host boot timestamp, read from psutil once per process.
+        
+        Raises:
+            ImportError: If psutil is not installed
+        """
+        if self._boot_time is None:
+            if psutil is None:
+                raise ImportError("psutil is not installed")
+            self._boot_time = psutil.boot_time()
+        return self._boot_time
+    
     def _get_uptime(self) -> float:
         """Get system uptime in seconds."""
         try:
-            import psutil
-            import time
-            boot_time = psutil.boot_time()
-            current_time = time.time()
-            return current_time - boot_time
+            return time.time() - self._get_boot_time()
         except:
             return 0.0
     
+    def _sample_system_metrics(self) -> Dict[str, Any]:
+        """Read host CPU, memory, disk and process metrics from psutil.
+        
+        Raises:
+            ImportError: If psutil is not installed
+        """
+        if psutil is None:
+            raise ImportError("psutil is not installed")
+        return {
+            'cpu_percent': psutil.cpu_percent(interval=None),
+            'memory': psutil.virtual_memory()._asdict(),
+            'disk_percent': psutil.disk_usage('/').percent,
+            'processes': len(psutil.pids()),
+        }
+    
+    def _sample_loop(self) -> None:
+        """Refresh the cached system metrics until the portal is discarded."""
+        while not self._sampler_stop.wait(self._sample_interval):
+            try:
+                metrics = self._sample_system_metrics()
+            except Exception as e:
+                self.logger.debug(f"System metrics sample failed: {e}")
+                continue
+            self._sys_stats = metrics
+    
+    def _get_system_metrics(self) -> Dict[str, Any]:
+        """Get the latest sampled system metrics without touching /proc.
+        
+        The first call samples synchronously and starts a background thread
+        that refreshes the snapshot every ``_sample_interval`` seconds.
+        
+        Raises:
+            ImportError: If psutil is not installed
+        """
+        metrics = self._sys_stats
+        if metrics is not None:
+            return metrics
+        with self._sys_stats_lock:
+            if self._sys_stats is None:
+                self._sys_stats = self._sample_system_metrics()
+                threading.Thread(target=self._sample_loop, name='skyguard-stats-sampler', daemon=True).start()
+            return self._sys_stats
+    
     def _get_memory_usage(self) -> Dict[str, Any]:
         """Get system memory usage."""
         try:
-            import psutil
-            memory = psutil.virtual_memory()
+            memory = self._get_system_metrics()['memory']
             return {
-                'total': memory.total,
-                'available': memory.available,
-                'used': memory.used,
-                'percentage': memory.percent
+                'total': memory['total'],
+                'available': memory['available'],
+                'used': memory['used'],
+                'percentage': memory['percent']
             }
         except:
             return {
@@ -847,24 +1162,56 @@ class SkyGuardWebPortal:
                 'percentage': 0
             }
     
-    def _get_last_detection(self) -> Optional[Dict[str, Any]]:
-        """Get last detection information."""
+    @staticmethod
+    def _web_detection(record: Dict[str, Any],
+                       fields: Tuple[Tuple[str, str, Any], ...] = _DETECTION_WEB_FIELDS) -> Dict[str, Any]:
+        """Rename a stored detection record to the web API keys.
+        
+        Args:
+            record: Record from ``EventLogger.get_detection_by_id`` or
+                ``get_latest_detection``
+            fields: (web key, record key, default) triples to include
+            
+        Returns:
+            New dictionary with web key names and defaults for missing values
+        """
+        get = record.get
+        return {web_key: get(key, default) for web_key, key, default in fields}
+    
+    def _get_last_detection(self, recent: Optional[List[Dict[str, Any]]] = None) -> Optional[Dict[str, Any]]:
+        """Get last detection information.
+        
+        Args:
+            recent: Detections already fetched by ``_get_recent_detections``
+                (newest first); when given, no extra query is made
+        """
         try:
+            if recent is not None:
+                if not recent:
+                    return None
+                detection = recent[0]
+                return {key: detection.get(key) for key, _, _ in _LAST_DETECTION_FIELDS}
+            
             # Query event logger for last detection
-            detections = self.event_logger.get_detections(limit=1)
-            if detections:
-                detection = detections[0]
-                return {
-                    'id': detection.get('id', 0),
-                    'timestamp': detection.get('timestamp', ''),
-                    'confidence': detection.get('confidence', 0.0),
-                    'class': detection.get('class_name', 'bird'),
-                    'bbox': detection.get('bbox', [0, 0, 0, 0])
-                }
+            detection = self.event_logger.get_latest_detection()
+            if detection:
+                return self._web_detection(detection, _LAST_DETECTION_FIELDS)
             return None
         except:
             return None
     
+    def _get_status_summary(self) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Get the detection total and last detection shown by ``/api/status``.
+        
+        Returns:
+            Tuple of (total detections, last detection or None)
+        """
+        try:
+            return self.event_logger.get_status_summary()
+        except Exception as e:
+            self.logger.error(f"Failed to get detection summary: {e}")
+            return 0, None
+    
     def _get_total_detections(self) -> int:
         """Get total number of detections."""
         try:
@@ -874,24 +1221,33 @@ class SkyGuardWebPortal:
             self.logger.error(f"Failed to get total detections: {e}")
             return 0
     
+    def _stat_snapshot(self) -> Optional[os.stat_result]:
+        """Stat the camera snapshot file once for existence, age and size.
+        
+        The snapshot is rewritten in place by the main process, so it is
+        served with ``send_file`` rather than memory-mapped: a mapping of a
+        file truncated underneath it faults on access.
+        
+        Returns:
+            The file's stat result, or None if there is no snapshot
+        """
+        try:
+            return os.stat(SNAPSHOT_FILE)
+        except OSError:
+            return None
+    
     def _is_camera_connected(self) -> bool:
         """Check if camera is connected in the main system."""
         try:
             # Check if the main system is running by looking for recent camera snapshots
-            import os
-            import time
-            
-            snapshot_file = "data/camera_snapshot.jpg"
-            if os.path.exists(snapshot_file):
+            snapshot = self._stat_snapshot()
+            if snapshot is not None:
                 # Check if file is recent (within last 10 seconds)
-                file_time = os.path.getmtime(snapshot_file)
-                current_time = time.time()
-                is_recent = (current_time - file_time) < 10
+                is_recent = (time.time() - snapshot.st_mtime) < 10
                 
                 if is_recent:
                     # Check if the snapshot file is larger than a placeholder (real camera data)
-                    file_size = os.path.getsize(snapshot_file)
-                    return file_size > 50000  # Real camera images are typically > 50KB
+                    return snapshot.st_size > 50000  # Real camera images are typically > 50KB
             
             return False
         except:
@@ -902,55 +1258,27 @@ class SkyGuardWebPortal:
         
         YOLO models from ultralytics are callable directly, not via .predict() method.
         This method checks if the model is callable or has a predict method for compatibility.
+        A detector that has not been built yet reports not-loaded; this check
+        never builds one, so browsing the dashboard does not load the model.
         """
         try:
+            detector = self._detector
             # Directly check if the detector's model is loaded
-            if self.detector:
+            if detector:
                 # Check if the detector has a loaded model
                 # YOLO models are callable directly, not via .predict() method
                 # Check if model is callable OR has predict method (for compatibility)
-                is_loaded = (
-                    self.detector.model is not None 
-                    and self.detector.model != "dummy"
-                    and (callable(self.detector.model) or hasattr(self.detector.model, 'predict'))
-                )
+                is_loaded = self._probe_model('model', detector.model)
                 
                 # If model is not loaded but detector exists, try to reload it (with rate limiting)
-                if not is_loaded:
-                    current_time = time.time()
-                    if current_time - self._last_reload_attempt > self._reload_cooldown:
-                        self._last_reload_attempt = current_time
-                        self.logger.warning("Detection model appears unloaded, attempting to reload...")
-                        if self._reload_detector_models():
-                            is_loaded = (
-                                self.detector.model is not None 
-                                and self.detector.model != "dummy"
-                                and (callable(self.detector.model) or hasattr(self.detector.model, 'predict'))
-                            )
-                            if is_loaded:
-                                self.logger.info("Detection model reloaded successfully")
-                            else:
-                                self.logger.error("Failed to reload detection model")
-                        else:
-                            self.logger.warning("Reload attempt failed, will retry after cooldown")
+                if not is_loaded and self._attempt_model_reload("Detection model"):
+                    is_loaded = self._probe_model('model', detector.model)
+                    if is_loaded:
+                        self.logger.info("Detection model reloaded successfully")
                     else:
-                        # Still in cooldown, just log a debug message
-                        self.logger.debug(
-                            f"Model unloaded but reload cooldown active "
-                            f"({int(self._reload_cooldown - (current_time - self._last_reload_attempt))}s remaining)"
-                        )
+                        self.logger.error("Failed to reload detection model")
                 
                 return is_loaded
-            else:
-                # Detector doesn't exist, try to reinitialize
-                self.logger.warning("Detector instance is None, attempting to reinitialize...")
-                self._initialize_components()
-                if self.detector:
-                    return (
-                        self.detector.model is not None 
-                        and self.detector.model != "dummy"
-                        and (callable(self.detector.model) or hasattr(self.detector.model, 'predict'))
-                    )
             return False
         except Exception as e:
             self.logger.error(f"Error checking if model is loaded: {e}")
@@ -962,53 +1290,28 @@ class SkyGuardWebPortal:
             return False
     
     def _is_species_model_loaded(self) -> bool:
-        """Check if species classification model is loaded in the web portal's detector."""
+        """Check if species classification model is loaded in the web portal's detector.
+        
+        Like ``_is_model_loaded``, never builds a detector that does not exist yet.
+        """
         try:
-            if self.detector:
+            detector = self._detector
+            if detector is None:
+                return False
+            if detector:
                 # Check if species model is loaded and functional
                 # YOLO models are callable directly, not via .predict() method
-                is_loaded = (
-                    self.detector.species_model is not None 
-                    and self.detector.species_model != "dummy"
-                    and (callable(self.detector.species_model) or hasattr(self.detector.species_model, 'predict'))
-                )
+                is_loaded = self._probe_model('species_model', detector.species_model)
                 
                 # If species model is not loaded but detector exists, try to reload it (with rate limiting)
-                if not is_loaded and self.detector.model is not None:
-                    current_time = time.time()
-                    if current_time - self._last_reload_attempt > self._reload_cooldown:
-                        self._last_reload_attempt = current_time
-                        self.logger.warning("Species model appears unloaded, attempting to reload...")
-                        if self._reload_detector_models():
-                            is_loaded = (
-                                self.detector.species_model is not None 
-                                and self.detector.species_model != "dummy"
-                                and (callable(self.detector.species_model) or hasattr(self.detector.species_model, 'predict'))
-                            )
-                            if is_loaded:
-                                self.logger.info("Species model reloaded successfully")
-                            else:
-                                self.logger.error("Failed to reload species model")
-                        else:
-                            self.logger.warning("Reload attempt failed, will retry after cooldown")
+                if not is_loaded and detector.model is not None and self._attempt_model_reload("Species model"):
+                    is_loaded = self._probe_model('species_model', detector.species_model)
+                    if is_loaded:
+                        self.logger.info("Species model reloaded successfully")
                     else:
-                        # Still in cooldown, just log a debug message
-                        self.logger.debug(
-                            f"Species model unloaded but reload cooldown active "
-                            f"({int(self._reload_cooldown - (current_time - self._last_reload_attempt))}s remaining)"
-                        )
+                        self.logger.error("Failed to reload species model")
                 
                 return is_loaded
-            else:
-                # Detector doesn't exist, try to reinitialize
-                self.logger.warning("Detector instance is None, attempting to reinitialize...")
-                self._initialize_components()
-                if self.detector:
-                    return (
-                        self.detector.species_model is not None 
-                        and self.detector.species_model != "dummy"
-                        and (callable(self.detector.species_model) or hasattr(self.detector.species_model, 'predict'))
-                    )
             return False
         except Exception as e:
             self.logger.error(f"Error checking if species model is loaded: {e}")
@@ -1019,6 +1322,58 @@ class SkyGuardWebPortal:
                 self.logger.error(f"Failed to reinitialize detector: {init_error}")
             return False
     
+    def _attempt_model_reload(self, label: str) -> bool:
+        """Reload the detector models unless a reload was tried recently.
+        
+        Both model checks share one cooldown, measured on the monotonic
+        clock so wall-clock adjustments cannot stall or repeat reloads.
+        
+        Args:
+            label: Model name used in log messages
+            
+        Returns:
+            True if a reload ran and succeeded
+        """
+        now = time.monotonic()
+        elapsed = now - self._last_reload_attempt
+        if elapsed <= self._reload_cooldown:
+            self.logger.debug(
+                f"{label} unloaded but reload cooldown active "
+                f"({int(self._reload_cooldown - elapsed)}s remaining)"
+            )
+            return False
+        self._last_reload_attempt = now
+        self.logger.warning(f"{label} appears unloaded, attempting to reload...")
+        if self._reload_detector_models():
+            return True
+        self.logger.warning("Reload attempt failed, will retry after cooldown")
+        return False
+    
+    def _probe_model(self, slot: str, model: Any) -> bool:
+        """Check whether a detector model object is usable for inference.
+        
+        The answer is remembered for the object last seen in each slot and
+        reused while that same object is still installed, so status polls
+        skip the ``callable``/``hasattr`` probe until a model is swapped.
+        
+        Args:
+            slot: Detector attribute the model came from
+            model: The model object, or None / ``"dummy"`` if not loaded
+            
+        Returns:
+            True if the model is callable or has a ``predict`` method
+        """
+        cached = self._model_checks.get(slot)
+        if cached is not None and cached[0] is model:
+            return cached[1]
+        usable = (
+            model is not None
+            and model != "dummy"
+            and (callable(model) or hasattr(model, 'predict'))
+        )
+        self._model_checks[slot] = (model, usable)
+        return usable
+    
     def _reload_detector_models(self) -> bool:
         """Attempt to reload detector models without recreating the detector instance.
         
@@ -1026,17 +1381,20 @@ class SkyGuardWebPortal:
             True if reload was successful, False otherwise
         """
         try:
-            if not self.detector:
+            # Reached from the status checks; never build a detector here
+            detector = self._detector
+            if not detector:
                 return False
+            self._model_checks.clear()
             
             # Reload the main detection model
             ai_config = self.config.get('ai', {})
             model_path_str = ai_config.get('model_path', 'models/yolo11n-seg.pt')
-            model_path = self.detector._resolve_model_path(model_path_str)
+            model_path = detector._resolve_model_path(model_path_str)
             
             if model_path.exists():
                 from ultralytics import YOLO
-                self.detector.model = YOLO(str(model_path))
+                detector.model = YOLO(str(model_path))
                 self.logger.info(f"Reloaded detection model: {model_path}")
             else:
                 self.logger.error(f"Cannot reload detection model: {model_path} not found")
@@ -1044,57 +1402,234 @@ class SkyGuardWebPortal:
             
             # Reload species model if configured
             if ai_config.get('species_model_path'):
-                self.detector._init_species_backend()
+                detector._init_species_backend()
             
             return True
         except Exception as e:
             self.logger.error(f"Failed to reload detector models: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.debug("Detector reload traceback", exc_info=True)
             return False
     
     def _get_recent_detections(self, limit: int = 50, offset: int = 0, 
-                               species: Optional[str] = None, class_name: Optional[str] = None) -> List[Dict[str, Any]]:
+                               species: Optional[str] = None, class_name: Optional[str] = None,
+                               before_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get recent detections.
         
         Args:
             limit: Maximum number of detections to return
-            offset: Number of detections to skip (for pagination)
+            offset: Number of detections to skip (deprecated pagination)
             species: Optional species filter
             class_name: Optional class name filter
+            before_id: Keyset cursor; only detections with a lower id are returned
             
         Returns:
             List of formatted detection dictionaries
         """
         try:
-            detections = self.event_logger.get_detections(
-                limit=limit, 
+            # Rows come back already in the web response shape
+            return self.event_logger.get_detection_summaries(
+                limit=limit,
                 offset=offset,
                 species_name=species,
-                class_name=class_name
+                class_name=class_name,
+                before_id=before_id
             )
-            # Convert to expected format
-            formatted_detections = []
-            for detection in detections:
-                formatted_detection = {
-                    'id': detection.get('id', 0),
-                    'timestamp': detection.get('timestamp', ''),
-                    'confidence': detection.get('confidence', 0.0),
-                    'class': detection.get('class_name', 'bird'),
-                    'bbox': detection.get('bbox', [0, 0, 0, 0]),
-                    'image_path': detection.get('image_path', ''),
-                    'species': detection.get('species_name'),
-                    'species_confidence': detection.get('species_confidence'),
-                    'segmented_image_path': detection.get('segmented_image_path')
-                }
-                formatted_detections.append(formatted_detection)
-            return formatted_detections
         except Exception as e:
             self.logger.error(f"Failed to get recent detections: {e}")
             return []
     
     # Removed placeholder detection detail/image helpers in favor of DB-backed methods
     
+    def _get_limit_arg(self, default: int) -> int:
+        """Read the ``limit`` query parameter, clamped to a sane page size.
+        
+        Args:
+            default: Limit used when the parameter is absent or not an integer
+            
+        Returns:
+            Limit between 1 and ``MAX_PAGE_SIZE``; a zero or negative value
+            would otherwise mean a division by zero or an unbounded SQL LIMIT
+        """
+        limit = request.args.get('limit', default, type=int)
+        return max(1, min(limit, MAX_PAGE_SIZE))
+    
+    def _resolve_project_path(self, path: str) -> str:
+        """Resolve a stored relative path against the project root.
+        
+        Args:
+            path: Absolute path, or path relative to the project root
+            
+        Returns:
+            Absolute path to the file
+        """
+        return _join_project_path(self._project_root_abs, path)
+    
+    def _send_stored_image(self, stored_path: Optional[str]) -> Optional[Response]:
+        """Send a detection image referenced by the database.
+        
+        Existence is not cached: retention cleanup deletes old images. The
+        ``stat`` that ``send_file`` needs anyway doubles as the existence check.
+        The response carries an ETag and a long-lived ``immutable`` cache
+        policy, so refreshing dashboards reuse their copy or get a 304.
+        
+        Args:
+            stored_path: Path as stored in the detections table, or None
+            
+        Returns:
+            The file response, or None if there is no path or no such file
+        """
+        if not stored_path:
+            return None
+        try:
+            response = send_file(
+                self._resolve_project_path(stored_path),
+                mimetype='image/jpeg',
+                conditional=True,
+                max_age=DETECTION_IMAGE_MAX_AGE
+            )
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        return response
+    
+    def _iter_snapshot_stream(self, snapshot_file: str, poll_interval: float = 0.2,
+                              max_duration: float = 300.0, keepalive: float = 10.0) -> Iterator[bytes]:
+        """Yield multipart MJPEG parts for the camera snapshot file.
+        
+        The file is only re-read when its mtime or size changes, so an idle
+        stream costs one ``stat`` per poll interval. While no snapshot exists
+        the fallback test image is sent once per second instead.
+        
+        Each stream ends after ``max_duration`` so a server worker thread is
+        not held forever; the dashboard reopens it. While the image is
+        unchanged the last part is re-sent every ``keepalive`` seconds, so a
+        client that went away surfaces as a failed write and the server
+        closes the generator instead of polling for it until the deadline.
+        
+        Args:
+            snapshot_file: Path of the JPEG written by the snapshot service
+            poll_interval: Seconds between change checks
+            max_duration: Seconds before the stream is closed
+            keepalive: Seconds without a new image before the last one is re-sent
+            
+        Yields:
+            One ``--frame`` multipart part per new image
+        """
+        last_signature = None
+        last_part = None
+        deadline = time.monotonic() + max_duration
+        last_sent = time.monotonic()
+        while True:
+            now = time.monotonic()
+            if now >= deadline:
+                return
+            try:
+                st = os.stat(snapshot_file)
+                signature = (st.st_mtime_ns, st.st_size)
+                if signature != last_signature:
+                    with open(snapshot_file, 'rb') as f:
+                        frame = f.read()
+                    last_signature = signature
+                else:
+                    frame = None
+            except FileNotFoundError:
+                signature = ('fallback', int(time.time()))
+                frame = self._get_fallback_frame() if signature != last_signature else None
+                last_signature = signature
+            except OSError:
+                frame = None
+            
+            if frame:
+                last_part = (b'--frame\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n' % len(frame)
+                             + frame + b'\r\n')
+                last_sent = now
+                yield last_part
+            elif last_part is not None and now - last_sent >= keepalive:
+                last_sent = now
+                yield last_part
+            time.sleep(poll_interval)
+    
+    def _get_fallback_frame(self) -> Optional[bytes]:
+        """Get the JPEG test image shown when no camera snapshot exists.
+        
+        Returns the last frame published by the refresher thread, starting
+        the thread if it is not running, so requests never wait on an encode
+        once a frame exists. The frame kept from an earlier outage is served
+        right away (its timestamp catches up within a second).
+        
+        Returns:
+            JPEG bytes, or None if encoding failed
+        """
+        self._fallback_last_request = time.monotonic()
+        frame = self._fallback_jpeg[1]
+        if frame is None:
+            # Nothing rendered yet: encode this one inline
+            frame = self._render_fallback_frame()
+        with self._fallback_lock:
+            if not self._fallback_refresher_running:
+                self._fallback_refresher_running = True
+                threading.Thread(target=self._fallback_refresh_loop, name='skyguard-fallback-frame',
+                                 daemon=True).start()
+        return frame
+    
+    def _fallback_refresh_loop(self) -> None:
+        """Re-render the fallback frame each second until it stops being requested."""
+        # Wake just after each wall-clock second so the timestamp is current
+        while not self._sampler_stop.wait(1.0 - time.time() % 1.0 + 0.01):
+            with self._fallback_lock:
+                if time.monotonic() - self._fallback_last_request > self._fallback_idle_timeout:
+                    self._fallback_refresher_running = False
+                    return
+            try:
+                self._render_fallback_frame()
+            except Exception as e:
+                self.logger.debug(f"Fallback frame render failed: {e}")
+        with self._fallback_lock:
+            self._fallback_refresher_running = False
+    
+    def _render_fallback_frame(self) -> Optional[bytes]:
+        """Render and publish the fallback JPEG for the current second.
+        
+        The gradient and static captions are drawn once; only the timestamp
+        changes, so the encoded frame is reused for the rest of its second.
+        
+        Returns:
+            JPEG bytes, or None if encoding failed
+        """
+        now = int(time.time())
+        cached_second, cached_bytes = self._fallback_jpeg
+        if cached_second == now and cached_bytes is not None:
+            return cached_bytes
+        
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        if self._fallback_base_bgr is None:
+            # Gradient background (blue follows the row, green the column)
+            base = np.empty((480, 640, 3), dtype=np.uint8)
+            base[..., 0] = (np.arange(480) * 255 // 480).astype(np.uint8)[:, None]
+            base[..., 1] = (np.arange(640) * 255 // 640).astype(np.uint8)[None, :]
+            base[..., 2] = 100
+            
+            # Add text. The captions are constant, so they are rasterized into
+            # the cached base once instead of being blended in per frame.
+            cv2.putText(base, 'SkyGuard Camera Feed', (50, 100), font, 1, (255, 255, 255), 2)
+            cv2.putText(base, 'No camera snapshot available', (50, 150), font, 0.7, (200, 200, 200), 2)
+            cv2.putText(base, 'Main process not running', (50, 200), font, 0.7, (200, 200, 200), 2)
+            self._fallback_base_bgr = base
+        
+        # Add timestamp
+        img = self._fallback_base_bgr.copy()
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+        cv2.putText(img, timestamp, (50, 400), font, 0.5, (150, 150, 150), 1)
+        
+        # Encode as JPEG
+        ret, buffer = cv2.imencode('.jpg', img, [cv2.IMWRITE_JPEG_QUALITY, 85])
+        if not ret:
+            return None
+        jpeg_bytes = buffer.tobytes()
+        self._fallback_jpeg = (now, jpeg_bytes)
+        return jpeg_bytes
+    
     def _validate_config(self, config: Dict[str, Any]) -> bool:
         """Validate configuration."""
         try:
@@ -1102,37 +1637,16 @@ class SkyGuardWebPortal:
             if not config:
                 return False
             
-            # Validate camera settings if provided
-            if 'camera' in config:
-                camera = config['camera']
-                if 'width' in camera and (not isinstance(camera['width'], int) or camera['width'] <= 0):
-                    return False
-                if 'height' in camera and (not isinstance(camera['height'], int) or camera['height'] <= 0):
-                    return False
-                if 'fps' in camera and (not isinstance(camera['fps'], int) or camera['fps'] <= 0):
-                    return False
-            
-            # Validate AI settings if provided
-            if 'ai' in config:
-                ai = config['ai']
-                if 'confidence_threshold' in ai and not isinstance(ai['confidence_threshold'], (int, float)):
-                    return False
-                if 'confidence_threshold' in ai and not (0 <= ai['confidence_threshold'] <= 1):
-                    return False
-                if 'nms_threshold' in ai and not isinstance(ai['nms_threshold'], (int, float)):
-                    return False
-                if 'nms_threshold' in ai and not (0 <= ai['nms_threshold'] <= 1):
-                    return False
-                if 'detection_log_level' in ai and ai['detection_log_level'] not in ['minimal', 'standard', 'detailed']:
-                    return False
-            
-            # Validate system settings if provided
-            if 'system' in config:
-                system = config['system']
-                if 'detection_interval' in system and not isinstance(system['detection_interval'], (int, float)):
-                    return False
-                if 'max_detection_history' in system and not isinstance(system['max_detection_history'], int):
+            for section, rules in _CONFIG_RULES.items():
+                values = config.get(section, _MISSING)
+                if values is _MISSING:
+                    continue
+                if not isinstance(values, dict):
                     return False
+                for key, is_valid in rules:
+                    value = values.get(key, _MISSING)
+                    if value is not _MISSING and not is_valid(value):
+                        return False
             
             return True
         except:
@@ -1191,14 +1705,6 @@ class SkyGuardWebPortal:
     def _restart_system(self):
         """Restart SkyGuard system."""
         try:
-            import subprocess
-            import platform
-            import sys
-            from pathlib import Path
-            
-            # Get project root
-            project_root = Path(__file__).parent.parent.parent
-            
             # Log the restart request - use logger which writes to file
             self.logger.info("=" * 60)
             self.logger.info("🔄 SYSTEM RESTART INITIATED via web portal")
@@ -1220,43 +1726,25 @@ class SkyGuardWebPortal:
             if platform.system() == 'Windows':
                 # Windows: Find processes running skyguard.main
                 try:
-                    result = subprocess.run(
-                        ['tasklist', '/FI', 'IMAGENAME eq python.exe', '/FO', 'CSV'],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-                    
-                    # Also check for pythonw.exe
-                    result2 = subprocess.run(
-                        ['tasklist', '/FI', 'IMAGENAME eq pythonw.exe', '/FO', 'CSV'],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-                    
-                    # Try to find the process by checking command line
-                    # Note: This is a simplified approach - in production you might want
-                    # to use psutil or wmic for more reliable process detection
-                    import psutil
-                    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+                    if psutil is None:
+                        raise ImportError("psutil is not installed")
+                    procs = self._find_skyguard_processes()
+                    for proc in procs:
+                        self.logger.info(f"🛑 Stopping SkyGuard main process (PID: {proc.pid})")
                         try:
-                            cmdline = proc.info.get('cmdline', [])
-                            if cmdline and any('skyguard.main' in str(arg) for arg in cmdline):
-                                # Found the process - terminate it gracefully
-                                pid = proc.info['pid']
-                                self.logger.info(f"🛑 Stopping SkyGuard main process (PID: {pid})")
-                                proc.terminate()
-                                self.logger.info(f"   Sent termination signal to PID {pid}")
-                                # Wait a bit for graceful shutdown
-                                time.sleep(2)
-                                # If still running, force kill
-                                if proc.is_running():
-                                    proc.kill()
-                                    self.logger.info(f"   Force killed process PID {pid}")
-                                else:
-                                    self.logger.info(f"   Process PID {pid} stopped gracefully")
-                        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                            proc.terminate()
+                            self.logger.info(f"   Sent termination signal to PID {proc.pid}")
+                        except psutil.Error:
+                            continue
+                    # Wait for all of them together, then force kill any left
+                    gone, alive = psutil.wait_procs(procs, timeout=2)
+                    for proc in gone:
+                        self.logger.info(f"   Process PID {proc.pid} stopped gracefully")
+                    for proc in alive:
+                        try:
+                            proc.kill()
+                            self.logger.info(f"   Force killed process PID {proc.pid}")
+                        except psutil.Error:
                             continue
                 except ImportError:
                     self.logger.warning("psutil not available, cannot find SkyGuard process")
@@ -1311,14 +1799,16 @@ class SkyGuardWebPortal:
             self.logger.info("=" * 60)
             
         except Exception as e:
-            self.logger.error(f"Failed to restart system: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.error(f"Failed to restart system: {e}", exc_info=True)
             raise
     
     def _get_system_logs(self, limit: int = 500, since: Optional[float] = None) -> List[Dict[str, Any]]:
         """Get system logs from the log file.
         
+        Only the tail of the file is read, and the parsed tail is reused
+        until the file changes, so polling with ``since`` is cheap however
+        large the log grows.
+        
         Args:
             limit: Maximum number of log lines to return
             since: Optional Unix timestamp - only return logs after this time
@@ -1327,169 +1817,489 @@ class SkyGuardWebPortal:
             List of log entry dictionaries
         """
         try:
-            import re
-            from pathlib import Path
+            log_path = self._log_path
+            try:
+                st = os.stat(log_path)
+            except OSError:
+                return []
             
-            # Get log file path from config
-            log_file = self.config.get('logging', {}).get('file', 'logs/skyguard.log')
-            log_path = Path(log_file)
+            max_lines = max(limit, MAX_PAGE_SIZE)
+            key = (log_path, st.st_ino, st.st_size, st.st_mtime_ns, max_lines)
+            cached_key, entries, timestamps = self._log_tail_cache
+            if cached_key != key:
+                try:
+                    entries = self._parse_log_lines(self._read_log_tail(log_path, max_lines))
+                except Exception as e:
+                    self.logger.error(f"Error reading log file: {e}")
+                    return []
+                timestamps = [entry['timestamp'] for entry in entries]
+                self._log_tail_cache = (key, entries, timestamps)
             
-            # Resolve relative paths
-            if not log_path.is_absolute():
-                # Try relative to project root
-                project_root = Path(__file__).parent.parent.parent
-                log_path = project_root / log_file
+            start = max(0, len(entries) - limit)
+            # Filter by 'since' if provided: first entry strictly after it
+            if since:
+                start = max(start, bisect.bisect_right(timestamps, since))
+            return entries[start:]
             
-            if not log_path.exists():
-                return []
+        except Exception as e:
+            self.logger.error(f"Error in _get_system_logs: {e}")
+            self.logger.debug("Log read traceback", exc_info=True)
+            return []
+    
+    @staticmethod
+    def _read_log_tail(log_path: Path, max_lines: int) -> List[str]:
+        """Read the last lines of a file by scanning a memory map backwards.
+        
+        Newlines are found with ``mmap.rfind`` on the page cache, and only
+        the kept lines are copied out and decoded. The log is rotated by
+        renaming, never truncated in place, so the mapping stays valid
+        while it is read.
+        
+        Args:
+            log_path: File to read
+            max_lines: Number of non-empty lines wanted
+            
+        Returns:
+            Up to ``max_lines`` stripped, non-empty lines, oldest first
+        """
+        lines: List[str] = []
+        with open(log_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return lines  # empty files cannot be mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = len(mm)
+                while end > 0 and len(lines) < max_lines:
+                    start = mm.rfind(b'\n', 0, end) + 1
+                    line = mm[start:end].decode('utf-8', errors='ignore').strip()
+                    if line:
+                        lines.append(line)
+                    end = start - 1
+        lines.reverse()
+        return lines
+    
+    @staticmethod
+    def _split_log_line(line: str) -> Optional[Tuple[str, str, str, str]]:
+        """Split a log line into timestamp, module, level and message.
+        
+        ``str.split`` handles well-formed lines; anything it cannot vouch for
+        goes through ``LOG_LINE_PATTERN``, which stays the definition of the
+        format.
+        
+        Returns:
+            The four fields, or None if the line is not in the log format
+        """
+        parts = line.split(' - ', 3)
+        if (len(parts) == 4 and len(parts[0]) == 19 and parts[1] and '-' not in parts[1]
+                and parts[2].isalnum() and parts[3]):
+            return parts[0], parts[1], parts[2], parts[3]
+        match = LOG_LINE_PATTERN.match(line)
+        return match.groups() if match else None
+    
+    @staticmethod
+    def _parse_log_lines(lines: List[str]) -> List[Dict[str, Any]]:
+        """Parse log lines into entry dictionaries.
+        
+        Lines that do not match the log format (e.g. traceback lines) are
+        kept as raw INFO entries carrying the timestamp of the entry they
+        follow, so ``since`` filtering treats them as part of it.
+        
+        Args:
+            lines: Stripped log lines, oldest first
             
-            # Read log file (read last N lines efficiently)
-            logs = []
+        Returns:
+            List of log entry dictionaries, oldest first
+        """
+        logs = []
+        last_timestamp = None
+        for line in lines:
+            match = SkyGuardWebPortal._split_log_line(line)
+            if match:
+                timestamp_str, module, level, message = match
+                try:
+                    timestamp = _parse_log_timestamp(timestamp_str)
+                except ValueError:
+                    match = None
+                else:
+                    last_timestamp = timestamp
+                    logs.append({
+                        'timestamp': timestamp,
+                        'timestamp_str': timestamp_str,
+                        'level': level,
+                        'module': module.strip(),
+                        'message': message,
+                        'raw': line
+                    })
+            if not match:
+                # If pattern doesn't match, include as raw log
+                logs.append({
+                    'timestamp': last_timestamp if last_timestamp is not None else time.time(),
+                    'timestamp_str': '',
+                    'level': 'INFO',
+                    'module': 'unknown',
+                    'message': line,
+                    'raw': line
+                })
+        
+        # Sort by timestamp (oldest first); stable, so continuation lines stay put
+        logs.sort(key=lambda x: x['timestamp'])
+        return logs
+    
+    def _publish_status(self, body: bytes) -> None:
+        """Hand a status body to the open event streams if it changed.
+        
+        Args:
+            body: Serialized ``/api/status`` payload
+        """
+        with self._status_cond:
+            seq, current = self._status_event
+            if body != current:
+                self._status_event = (seq + 1, body)
+                self._status_cond.notify_all()
+    
+    def _status_publish_loop(self) -> None:
+        """Rebuild the status body until the last event stream closes."""
+        while True:
+            with self._status_cond:
+                if self._status_subscribers == 0 or self._sampler_stop.is_set():
+                    self._status_publisher_running = False
+                    return
             try:
-                # Read file in reverse to get last N lines
-                with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    # Read all lines if file is small, otherwise read last portion
-                    lines = f.readlines()
-                    
-                    # Get last N lines
-                    if len(lines) > limit:
-                        lines = lines[-limit:]
-                    
-                    # Parse each line
-                    # Format: YYYY-MM-DD HH:MM:SS - module - LEVEL - message
-                    log_pattern = re.compile(
-                        r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) - ([^-]+) - (\w+) - (.+)$'
-                    )
-                    
-                    for line in lines:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        
-                        match = log_pattern.match(line)
-                        if match:
-                            timestamp_str, module, level, message = match.groups()
-                            
-                            # Parse timestamp
-                            try:
-                                dt = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-                                timestamp = dt.timestamp()
-                                
-                                # Filter by 'since' if provided
-                                if since and timestamp <= since:
-                                    continue
-                                
-                                logs.append({
-                                    'timestamp': timestamp,
-                                    'timestamp_str': timestamp_str,
-                                    'level': level,
-                                    'module': module.strip(),
-                                    'message': message,
-                                    'raw': line
-                                })
-                            except ValueError:
-                                # If timestamp parsing fails, include as-is
-                                logs.append({
-                                    'timestamp': time.time(),
-                                    'timestamp_str': '',
-                                    'level': 'INFO',
-                                    'module': 'unknown',
-                                    'message': line,
-                                    'raw': line
-                                })
-                        else:
-                            # If pattern doesn't match, include as raw log
-                            logs.append({
-                                'timestamp': time.time(),
-                                'timestamp_str': '',
-                                'level': 'INFO',
-                                'module': 'unknown',
-                                'message': line,
-                                'raw': line
-                            })
-                
-                # Sort by timestamp (oldest first)
-                logs.sort(key=lambda x: x['timestamp'])
-                
+                with self.app.app_context():
+                    self._publish_status(self._build_status_body())
             except Exception as e:
-                self.logger.error(f"Error reading log file: {e}")
-                return []
+                self.logger.debug(f"Status publish failed: {e}")
+            self._sampler_stop.wait(self._status_push_interval)
+    
+    def _stream_response(self, stream: Iterator[bytes], mimetype: str) -> Response:
+        """Serve a long-lived stream if a stream slot is free.
+        
+        Streams hold a server worker thread for their whole lifetime, and
+        clients reconnect as soon as one ends, so they are capped at
+        ``_max_streams`` to leave workers for ``/api/*``. Over the cap the
+        client gets a 503; EventSource then closes and the ``<img>`` stream
+        errors, and both pages fall back to polling. The slot is released
+        when the server closes the response, even if the stream never ran.
+        
+        Args:
+            stream: Generator producing the response body
+            mimetype: Response mimetype
             
-            return logs
+        Returns:
+            The streaming response, or a 503 response when every slot is taken
+        """
+        with self._stream_lock:
+            admitted = self._open_streams < self._max_streams
+            if admitted:
+                self._open_streams += 1
+        if not admitted:
+            stream.close()
+            response = Response('Too many open streams', status=503, mimetype='text/plain')
+            response.headers['Retry-After'] = '30'
+            return response
+        
+        released = False
+        
+        def release() -> None:
+            nonlocal released
+            with self._stream_lock:
+                if not released:
+                    released = True
+                    self._open_streams -= 1
+        
+        response = Response(stream, mimetype=mimetype)
+        response.call_on_close(release)
+        return response
+    
+    def _iter_status_events(self, max_duration: float = 300.0, keepalive: float = 15.0) -> Iterator[bytes]:
+        """Yield Server-Sent Events for one ``/api/events`` client.
+        
+        The first subscriber starts the publisher thread; it exits once no
+        stream is left. Each stream ends after ``max_duration`` so a server
+        worker thread is not held forever; ``EventSource`` reconnects on its
+        own after the advertised retry delay.
+        
+        Args:
+            max_duration: Seconds before the stream is closed
+            keepalive: Seconds without a change before a comment line is sent
             
-        except Exception as e:
-            import traceback
-            print(f"Error in _get_system_logs: {e}")
-            traceback.print_exc()
-            return []
+        Yields:
+            Encoded SSE frames
+        """
+        with self._status_cond:
+            self._status_subscribers += 1
+            if not self._status_publisher_running:
+                self._status_publisher_running = True
+                threading.Thread(target=self._status_publish_loop, name='skyguard-status-publisher',
+                                 daemon=True).start()
+        try:
+            yield b'retry: 5000\n\n'
+            last_seq = -1
+            deadline = time.monotonic() + max_duration
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                with self._status_cond:
+                    self._status_cond.wait_for(
+                        lambda: self._status_event[1] and self._status_event[0] != last_seq,
+                        timeout=min(keepalive, remaining),
+                    )
+                    seq, body = self._status_event
+                if body and seq != last_seq:
+                    last_seq = seq
+                    yield b''.join(b'data: ' + line + b'\n' for line in body.splitlines()) + b'\n'
+                else:
+                    yield b': keepalive\n\n'
+        finally:
+            with self._status_cond:
+                self._status_subscribers -= 1
+    
+    def _build_status_body(self) -> bytes:
+        """Serialize the ``/api/status`` payload.
+        
+        Returns:
+            JSON body
+        """
+        # Total and newest detection come from one query; 'recent' is the
+        # size of a 5-row page, which the total already determines
+        total_detections, last_detection = self._get_status_summary()
+        model_loaded = self._is_model_loaded()
+        status = {
+            'system': {
+                'status': 'running' if self._is_system_running() else 'stopped',
+                'uptime': self._get_uptime(),
+                'last_detection': last_detection,
+                'total_detections': total_detections,
+                'memory_usage': self._get_memory_usage(),
+            },
+            'camera': {
+                'connected': self._is_camera_connected(),
+                **self._camera_defaults,
+            },
+            'ai': {
+                'loaded': model_loaded,
+                'model_loaded': model_loaded,  # Alias for consistency
+                **self._ai_defaults,
+                'species_model_loaded': self._is_species_model_loaded(),
+            },
+            'detections': {
+                'total': total_detections,
+                'recent': min(total_detections, 5),
+            },
+            'notifications': self._notif_flags,
+        }
+        return jsonify(status).get_data()
+    
+    def _build_stats_body(self) -> bytes:
+        """Serialize the ``/api/stats`` payload.
+        
+        Returns:
+            JSON body
+        """
+        stats = self._get_system_stats()
+        total_detections = self._get_total_detections()
+        return jsonify({
+            'detections': {
+                'total': total_detections,
+                'today': stats.get('detections_today', 0),
+                'this_week': stats.get('detections_this_week', 0),
+                'this_month': stats.get('detections_this_month', 0)
+            },
+            'system': {
+                'uptime': stats.get('uptime', 0),
+                'memory_usage': stats.get('memory_percent', 0),
+                'cpu_usage': stats.get('cpu_percent', 0),
+                'disk_usage': stats.get('disk_percent', 0),
+                'processes': stats.get('processes', 0)
+            },
+            'performance': {
+                'avg_detection_time': 0.5,  # Placeholder
+                'fps': self.config.get('camera', {}).get('fps', 30),
+                'model_accuracy': 0.85,  # Placeholder
+                'total_detections': total_detections
+            }
+        }).get_data()
+    
+    def _refresh_cached_flags(self) -> None:
+        """Precompute the config-derived fields echoed by the polling routes.
+        
+        Must be called whenever ``self.config`` is replaced so that
+        /api/status, /api/camera/status, /api/alerts/test,
+        /api/system/logs and the metrics sampler stay in sync.
+        """
+        camera_config = self.config.get('camera', {})
+        ai_config = self.config.get('ai', {})
+        notifications_config = self.config.get('notifications', {})
+        
+        self._notif_flags: Dict[str, Any] = {
+            f'{channel}_enabled': notifications_config.get(channel, {}).get('enabled', False)
+            for channel in ('audio', 'sms', 'email', 'discord')
+        }
+        self._camera_defaults: Dict[str, Any] = {
+            'source': camera_config.get('source', 0),
+            'width': camera_config.get('width', 640),
+            'height': camera_config.get('height', 480),
+            'fps': camera_config.get('fps', 30),
+        }
+        self._ai_defaults: Dict[str, Any] = {
+            'model_path': ai_config.get('model_path', 'models/yolo11n-seg.pt'),
+            'confidence_threshold': ai_config.get('confidence_threshold', 0.5),
+            'detection_log_level': ai_config.get('detection_log_level', 'standard'),
+            'classes': ai_config.get('classes', []),
+        }
+        # Seconds between host metric samples; /api/stats never reads psutil directly
+        self._sample_interval = float(self.config.get('web', {}).get('stats_ttl_seconds', 2.0))
+        log_file = Path(self.config.get('logging', {}).get('file', 'logs/skyguard.log'))
+        # Relative log paths are taken from the project root
+        self._log_path = log_file if log_file.is_absolute() else project_root / log_file
+    
+    def _cached_body(self, name: str, build: Callable[[], bytes]) -> bytes:
+        """Get a route's JSON body, rebuilding it at most once per TTL.
+        
+        A fresh body is returned without locking. On a miss the slot's lock
+        is taken and the cache checked again, so requests that arrive while
+        another thread rebuilds wait for and reuse that body instead of
+        repeating the database and psutil work.
+        
+        Args:
+            name: Cache slot name (one per route)
+            build: Builds the serialized JSON body
+            
+        Returns:
+            A body at most ``_response_cache_ttl`` seconds old
+        """
+        cached = self._response_cache.get(name)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        lock = self._response_build_locks.setdefault(name, threading.Lock())
+        with lock:
+            cached = self._response_cache.get(name)
+            if cached is not None and time.monotonic() < cached[0]:
+                return cached[1]
+            body = build()
+            self._response_cache[name] = (time.monotonic() + self._response_cache_ttl, body)
+            return body
     
     def _get_system_stats(self) -> Dict[str, Any]:
         """Get system statistics."""
         try:
-            import psutil
+            metrics = self._get_system_metrics()
+            now = time.time()
             
             return {
-                'cpu_percent': psutil.cpu_percent(),
-                'memory_percent': psutil.virtual_memory().percent,
-                'disk_percent': psutil.disk_usage('/').percent,
-                'uptime': psutil.boot_time(),
-                'processes': len(psutil.pids()),
-                'detections_today': self._get_detections_today(),
-                'detections_this_week': self._get_detections_this_week(),
-                'detections_this_month': self._get_detections_this_month(),
+                'cpu_percent': metrics['cpu_percent'],
+                'memory_percent': metrics['memory']['percent'],
+                'disk_percent': metrics['disk_percent'],
+                'uptime': self._get_boot_time(),
+                'processes': metrics['processes'],
+                **self._get_range_counts(now),
             }
         except:
             return {}
     
-    def _get_detections_today(self) -> int:
-        """Get detections today."""
+    def _get_range_counts(self, now: Optional[float] = None) -> Dict[str, int]:
+        """Count today's, this week's and this month's detections in one query.
+        
+        The rolling week and month starts are truncated to the minute so the
+        result can be cached. A cached result is reused while the window
+        starts and the database's detections version are unchanged, for at
+        most ``_count_cache_ttl`` seconds.
+        
+        Args:
+            now: Current Unix timestamp, defaults to ``time.time()``
+            
+        Returns:
+            Dictionary with ``detections_today``, ``detections_this_week``
+            and ``detections_this_month``
+        """
+        if now is None:
+            now = time.time()
         try:
-            today = datetime.now().date()
-            start_time = datetime.combine(today, datetime.min.time()).timestamp()
-            end_time = datetime.combine(today, datetime.max.time()).timestamp()
+            week_ago = now - 7 * 86400
+            month_ago = now - 30 * 86400
+            starts = (self._start_of_day(now), week_ago - week_ago % 60, month_ago - month_ago % 60)
             
-            detections = self.event_logger.get_detections(
-                start_time=start_time,
-                end_time=end_time
-            )
-            return len(detections)
-        except:
-            return 0
+            key = (starts, self.event_logger.detections_version())
+            clock = time.monotonic()
+            cached = self._count_cache
+            if cached is not None and cached[0] == key and clock < cached[1]:
+                return cached[2]
+            today, week, month = self.event_logger.get_detection_counts(*starts)
+        except (sqlite3.Error, OSError, OverflowError, ValueError) as e:
+            # Log the first failure only; the dashboard polls this every few seconds
+            if not self._count_error_logged:
+                self._count_error_logged = True
+                self.logger.warning(f"Detection count failed: {e}")
+            return {'detections_today': 0, 'detections_this_week': 0, 'detections_this_month': 0}
+        self._count_error_logged = False
+        counts = {
+            'detections_today': today,
+            'detections_this_week': week,
+            'detections_this_month': month,
+        }
+        self._count_cache = (key, clock + self._count_cache_ttl, counts)
+        return counts
     
-    def _get_detections_this_week(self) -> int:
-        """Get detections this week."""
-        try:
-            week_ago = datetime.now() - timedelta(days=7)
-            start_time = week_ago.timestamp()
-            end_time = datetime.now().timestamp()
+    def _start_of_day(self, now: float) -> float:
+        """Get the Unix timestamp of local midnight for the day containing ``now``.
+        
+        The day's bounds are kept, so a ``now`` inside them is answered with
+        two float comparisons. The datetime and timezone work runs once per
+        day instead of once per request. Both bounds are local midnights, so
+        23- and 25-hour DST days are handled.
+        
+        Args:
+            now: Unix timestamp
             
-            detections = self.event_logger.get_detections(
-                start_time=start_time,
-                end_time=end_time
-            )
-            return len(detections)
-        except:
-            return 0
+        Returns:
+            Unix timestamp of the start of that local day
+        """
+        start, end = self._day_start
+        if start <= now < end:
+            return start
+        today = date.fromtimestamp(now)
+        midnight = datetime.min.time()
+        start = datetime.combine(today, midnight).timestamp()
+        end = datetime.combine(today + timedelta(days=1), midnight).timestamp()
+        self._day_start = (start, end)
+        return start
     
-    def _get_detections_this_month(self) -> int:
+    def _get_detections_today(self, now: Optional[float] = None) -> int:
+        """Get detections today."""
+        return self._get_range_counts(now)['detections_today']
+    
+    def _get_detections_this_week(self, now: Optional[float] = None) -> int:
+        """Get detections this week."""
+        return self._get_range_counts(now)['detections_this_week']
+    
+    def _get_detections_this_month(self, now: Optional[float] = None) -> int:
         """Get detections this month."""
-        try:
-            month_ago = datetime.now() - timedelta(days=30)
-            start_time = month_ago.timestamp()
-            end_time = datetime.now().timestamp()
-            
-            detections = self.event_logger.get_detections(
-                start_time=start_time,
-                end_time=end_time
-            )
-            return len(detections)
-        except:
-            return 0
+        return self._get_range_counts(now)['detections_this_month']
     
-    def run(self, host: str = '0.0.0.0', port: int = 8080, debug: bool = False):
-        """Run the web portal."""
+    def run(self, host: str = '0.0.0.0', port: int = 8080, debug: bool = False, threads: int = 8):
+        """Run the web portal.
+        
+        Serves with waitress when it is installed, so concurrent dashboard
+        clients are handled by a pool of worker threads. At most half of
+        them may be held by long-lived streams. Debug mode, or a missing
+        waitress, uses Flask's development server instead.
+        
+        Args:
+            host: Host to bind to
+            port: Port to bind to
+            debug: Use Flask's development server with the debugger
+            threads: Number of waitress worker threads
+        """
         print(f"🌐 Starting SkyGuard Web Portal on http://{host}:{port}")
-        self.app.run(host=host, port=port, debug=debug)
+        if debug or waitress is None:
+            if not debug:
+                self.logger.warning("waitress not installed; using Flask's development server")
+            # The reloader would re-import this module and open a second
+            # EventLogger/database connection in the child process
+            self.app.run(host=host, port=port, debug=debug, use_reloader=False, threaded=True)
+            return
+        self._max_streams = max(1, threads // 2)
+        waitress.serve(self.app, host=host, port=port, threads=threads)
 
 
 def main():
@@ -1500,6 +2310,7 @@ def main():
     parser.add_argument('--host', default='0.0.0.0', help='Host to bind to')
     parser.add_argument('--port', type=int, default=8080, help='Port to bind to')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
+    parser.add_argument('--threads', type=int, default=8, help='Number of server worker threads')
     parser.add_argument('--config', default='config/skyguard.yaml', help='Configuration file path')
     
     args = parser.parse_args()
@@ -1508,7 +2319,7 @@ def main():
     portal = SkyGuardWebPortal(args.config)
     
     # Run the portal
-    portal.run(host=args.host, port=args.port, debug=args.debug)
+    portal.run(host=args.host, port=args.port, debug=args.debug, threads=args.threads)
 
 
 if __name__ == "__main__":
@@ -6,6 +6,8 @@ This conftest.py provides:
     directory so tests never touch the production SQLite database.
   - A minimal ``base_detection`` dict used by multiple test modules.
   - A ``minimal_alert_config`` dict with all five channels disabled.
+  - An autouse fixture that keeps config parse caches out of the repo's
+    ``data/config_cache`` directory.
 """
 
 import time
@@ -14,10 +16,28 @@ from typing import Any, Dict
 
 import pytest
 
+from skyguard.core import config_manager
 from skyguard.storage.event_logger import EventLogger
 from skyguard.core.alert_system import AlertSystem
 
 
+# ---------------------------------------------------------------------------
+# Config fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def isolated_parse_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the JSON config parse cache at a per-test temp directory.
+
+    Portals cache their config's parse, so without this every test that
+    builds one from a temp YAML file would leave a file in the real tree.
+    """
+    cache_dir = tmp_path / "config_cache"
+    monkeypatch.setattr(config_manager, "_PARSE_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
 # ---------------------------------------------------------------------------
 # Storage / database fixtures
 # ---------------------------------------------------------------------------
@@ -64,6 +64,127 @@ class TestConfigManager:
             
         finally:
             Path(temp_path).unlink(missing_ok=True)
+    
+    def test_load_config_reuses_parse_until_file_changes(self, tmp_path: Path) -> None:
+        """Repeated loads of an unchanged file skip YAML parsing; edits are picked up."""
+        config_file = tmp_path / "cached.yaml"
+        config_file.write_text("camera:\n  fps: 15\n")
+        
+        with patch('skyguard.core.config_manager.yaml.load', wraps=yaml.load) as spy:
+            first = ConfigManager(str(config_file)).load_config()
+            second = ConfigManager(str(config_file)).load_config()
+            assert spy.call_count == 1
+            assert first == second == {'camera': {'fps': 15}}
+            
+            # Returned dicts are private copies, so mutating one can't leak
+            first['camera']['fps'] = 99
+            assert ConfigManager(str(config_file)).load_config()['camera']['fps'] == 15
+            
+            # Atomic replace (new inode, new size) invalidates the cache
+            replacement = tmp_path / "replacement.yaml"
+            replacement.write_text("camera:\n  fps: 30\n")
+            replacement.replace(config_file)
+            assert ConfigManager(str(config_file)).load_config()['camera']['fps'] == 30
+            assert spy.call_count == 2
+    
+    def test_restarted_process_loads_json_parse(self, tmp_path: Path) -> None:
+        """A fresh process reuses the JSON parse cache until the YAML changes."""
+        from skyguard.core import config_manager
+        
+        cache_dir = tmp_path / "data" / "config_cache"
+        config_file = tmp_path / "restart.yaml"
+        config_file.write_text("camera:\n  fps: 15\n")
+        with patch.object(config_manager, '_PARSE_CACHE_DIR', cache_dir):
+            ConfigManager(str(config_file), disk_cache=True).load_config()
+            cache_files = list(cache_dir.glob("restart.yaml.*.json"))
+            assert len(cache_files) == 1
+            assert not list(tmp_path.glob("*.pkl"))
+            
+            with patch.dict(config_manager._CACHE, clear=True), \
+                    patch('skyguard.core.config_manager.yaml.load', wraps=yaml.load) as spy:
+                assert ConfigManager(str(config_file), disk_cache=True).load_config() == {'camera': {'fps': 15}}
+                assert spy.call_count == 0
+                
+                config_manager._CACHE.clear()
+                config_file.write_text("camera:\n  fps: 300\n")
+                assert ConfigManager(str(config_file), disk_cache=True).load_config() == {'camera': {'fps': 300}}
+                assert spy.call_count == 1
+            
+            # A corrupt cache is ignored rather than breaking config loading
+            cache_files[0].write_bytes(b"\x80\x04not json")
+            with patch.dict(config_manager._CACHE, clear=True):
+                assert ConfigManager(str(config_file), disk_cache=True).load_config() == {'camera': {'fps': 300}}
+    
+    def test_parse_cache_skips_documents_json_would_change(self, tmp_path: Path) -> None:
+        """YAML values JSON cannot round-trip (int keys, dates) are parsed, never cached."""
+        from skyguard.core import config_manager
+        
+        cache_dir = tmp_path / "cache"
+        config_file = tmp_path / "typed.yaml"
+        config_file.write_text("ports:\n  8080: web\nsince: 2024-03-05\n")
+        with patch.object(config_manager, '_PARSE_CACHE_DIR', cache_dir):
+            config = ConfigManager(str(config_file), disk_cache=True).load_config()
+            assert config['ports'] == {8080: 'web'}
+            assert not cache_dir.exists() or not list(cache_dir.iterdir())
+    
+    def test_saved_config_reloads_without_parsing(self, tmp_path: Path) -> None:
+        """A save seeds the parse caches, so reloading it (here or after a restart) skips YAML."""
+        from skyguard.core import config_manager
+        
+        config_file = tmp_path / "saved.yaml"
+        manager = ConfigManager(str(config_file), disk_cache=True)
+        with patch.object(config_manager, '_PARSE_CACHE_DIR', tmp_path / "cache"):
+            assert manager.save_config({'camera': {'fps': 12}, 'ai': {'classes': ['bird']}})
+            
+            with patch('skyguard.core.config_manager.yaml.load', wraps=yaml.load) as spy:
+                assert ConfigManager(str(config_file), disk_cache=True).load_config() == {'camera': {'fps': 12}, 'ai': {'classes': ['bird']}}
+                with patch.dict(config_manager._CACHE, clear=True):
+                    assert ConfigManager(str(config_file), disk_cache=True).load_config()['camera']['fps'] == 12
+                assert spy.call_count == 0
+        
+        # The cached copy is independent of the dict the caller saved
+        manager.config['camera']['fps'] = 99
+        assert ConfigManager(str(config_file), disk_cache=True).load_config()['camera']['fps'] == 12
+    
+    def test_parse_cache_keeps_yaml_permissions(self, tmp_path: Path) -> None:
+        """The cache copies credentials, so it is no more readable than the YAML."""
+        from skyguard.core import config_manager
+        
+        cache_dir = tmp_path / "cache"
+        config_file = tmp_path / "secret.yaml"
+        config_file.write_text("notifications:\n  email:\n    smtp_password: hunter2\n")
+        config_file.chmod(0o600)
+        with patch.object(config_manager, '_PARSE_CACHE_DIR', cache_dir):
+            manager = ConfigManager(str(config_file), disk_cache=True)
+            manager.load_config()
+            (cache_file,) = cache_dir.glob("secret.yaml.*.json")
+            assert cache_file.stat().st_mode & 0o777 == 0o600
+            
+            manager.save_config()
+            (cache_file,) = cache_dir.glob("secret.yaml.*.json")
+            assert cache_file.stat().st_mode & 0o777 == config_file.stat().st_mode & 0o777
+    
+    def test_disk_cache_is_opt_in(self, tmp_path: Path) -> None:
+        """Managers other than the portal's keep their parse in memory only."""
+        from skyguard.core import config_manager
+        
+        cache_dir = tmp_path / "cache"
+        config_file = tmp_path / "plain.yaml"
+        config_file.write_text("camera:\n  fps: 15\n")
+        with patch.object(config_manager, '_PARSE_CACHE_DIR', cache_dir):
+            manager = ConfigManager(str(config_file))
+            manager.load_config()
+            manager.save_config({'camera': {'fps': 20}})
+            assert not cache_dir.exists()
+    
+    def test_uses_libyaml_when_available(self) -> None:
+        """The C-accelerated loader/dumper are picked whenever PyYAML provides them."""
+        from skyguard.core import config_manager
+        
+        if not getattr(yaml, '__with_libyaml__', False):
+            pytest.skip("PyYAML built without libyaml")
+        assert config_manager.SafeLoader is yaml.CSafeLoader
+        assert config_manager.SafeDumper is yaml.CSafeDumper
 
 
 class TestCameraManager:
@@ -222,6 +343,31 @@ class TestRaptorDetector:
         # Should return a frame (numpy array)
         assert isinstance(result, np.ndarray)
         assert result.shape == frame.shape
+    
+    def test_detect_batch_single_model_call(self):
+        """A batch runs one model call and returns detections per frame, in order."""
+        import numpy as np
+        
+        detector = RaptorDetector({'model_path': 'test.pt'})
+        box = MagicMock()
+        box.xyxy[0].detach().cpu().numpy.return_value = np.array([10.0, 20.0, 50.0, 60.0])
+        box.conf[0].detach().cpu().numpy.return_value = np.float32(0.9)
+        box.cls[0].detach().cpu().numpy.return_value = np.int64(14)
+        boxes = MagicMock(shape=(1,))
+        boxes.__getitem__.return_value = box
+        bird = Mock(boxes=boxes, masks=None, names={14: 'bird'})
+        empty = Mock(boxes=None, masks=None, names={14: 'bird'})
+        detector.model = Mock(return_value=[empty, bird])
+        
+        frames = [np.zeros((100, 100, 3), dtype=np.uint8) for _ in range(2)]
+        batch = detector.detect_batch(frames)
+        
+        assert detector.model.call_count == 1
+        assert len(detector.model.call_args[0][0]) == 2
+        assert batch[0] == []
+        assert [d['bbox'] for d in batch[1]] == [[10, 20, 50, 60]]
+        assert detector.detection_count == 1
+        assert detector.detect_batch([]) == []
 
 
 class TestAlertSystem:
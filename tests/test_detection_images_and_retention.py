@@ -134,5 +134,11 @@ def test_web_api_serves_detection_image(tmp_storage_dir: Path) -> None:
     assert img_resp.status_code == 200
     assert img_resp.mimetype == "image/jpeg"
 
+    # Revalidating with the ETag must not resend the image
+    etag = img_resp.headers.get("ETag")
+    assert etag
+    cached_resp = client.get(f"/api/detections/{detection_id}/image", headers={"If-None-Match": etag})
+    assert cached_resp.status_code == 304
+
 
 
@@ -0,0 +1,65 @@
+"""
+Tests for the SkyGuard frame drawing helpers.
+
+These tests validate that ``blend_polygon`` produces exactly the pixels of a
+full-frame ``fillPoly`` + ``addWeighted`` blend while touching only the
+polygon's bounding box.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
+
+import cv2
+import numpy as np
+import pytest
+
+from skyguard.utils.drawing import blend_polygon
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+def _full_frame_blend(frame: np.ndarray, polygon: List[List[int]], alpha: float) -> np.ndarray:
+    overlay = frame.copy()
+    cv2.fillPoly(overlay, [np.array(polygon, dtype=np.int32)], color=(0, 255, 0))
+    return cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0)
+
+
+@pytest.mark.parametrize(
+    "polygon",
+    [
+        [[20, 30], [90, 25], [70, 80], [25, 70]],
+        [[-15, -10], [40, 5], [10, 60]],  # partly off the top-left edge
+        [[150, 90], [210, 95], [190, 140]],  # partly off the bottom-right edge
+        [[300, 300], [320, 300], [310, 320]],  # entirely off frame
+    ],
+)
+def test_blend_polygon_matches_full_frame_blend(polygon: List[List[int]]) -> None:
+    """ROI blending is pixel-identical to blending the whole frame."""
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, size=(120, 200, 3), dtype=np.uint8)
+    expected = _full_frame_blend(frame, polygon, 0.3)
+
+    blend_polygon(frame, polygon, (0, 255, 0), 0.3)
+
+    np.testing.assert_array_equal(frame, expected)
+
+
+def test_blend_polygon_leaves_pixels_outside_bounding_box_untouched() -> None:
+    """Overlapping masks compound as before, and nothing outside their boxes changes."""
+    frame = np.full((100, 100, 3), 200, dtype=np.uint8)
+    first = [[10, 10], [60, 10], [60, 60], [10, 60]]
+    second = [[40, 40], [80, 40], [80, 80], [40, 80]]
+    expected = _full_frame_blend(_full_frame_blend(frame, first, 0.3), second, 0.3)
+
+    blend_polygon(frame, first, (0, 255, 0), 0.3)
+    blend_polygon(frame, second, (0, 255, 0), 0.3)
+
+    np.testing.assert_array_equal(frame, expected)
+    assert (frame[:10] == 200).all()
+    assert (frame[81:] == 200).all()
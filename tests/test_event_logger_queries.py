@@ -0,0 +1,545 @@
+"""
+Tests for EventLogger read queries.
+
+These tests validate that:
+- Connections are opened in WAL mode with ``synchronous=NORMAL``
+- ``log_detections`` writes a frame's detections in one transaction
+- Keyset pagination with ``before_id`` walks every detection exactly once,
+  newest first, continuing the first page's order when ids and timestamps
+  disagree
+- The unfiltered ``count_detections`` total is reused until a write from
+  this or another connection
+- ``get_status_summary`` returns the total and newest row from one query
+- ``count_detections_since`` counts through the timestamp index and is not
+  capped by the ``get_detections`` page size
+- ``get_detection_counts`` matches separate counts, including when it
+  updates its running counters incrementally, and recounts after any
+  deletion, even of rows in the middle of the id range
+- Recent-window confidence and species aggregates match row-by-row sums
+- ``get_latest_detection`` returns the newest row, or None on an empty table
+- ``get_detection_by_id`` serves repeat lookups from its LRU, without SQL
+  and as copies, until another connection deletes rows
+- ``get_detection_summaries`` returns rows already in the web API shape
+- ``detections_version`` changes on writes from this connection at once and
+  from another connection once its ``data_version`` memo expires
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+import pytest
+
+from skyguard.storage.event_logger import EventLogger
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+def _insert(logger: EventLogger, detection: Dict[str, Any], count: int) -> List[int]:
+    """Insert ``count`` copies of a detection one second apart and return their ids."""
+    ids = []
+    for i in range(count):
+        row_id = logger.log_detection({**detection, "timestamp": detection["timestamp"] + i})
+        assert row_id is not None
+        ids.append(row_id)
+    return ids
+
+
+class TestConnectionPragmas:
+    """Tests for the pragmas applied when the database is opened."""
+
+    def test_wal_and_relaxed_sync(self, initialized_event_logger: EventLogger) -> None:
+        """Connections use WAL journaling, NORMAL sync, in-memory temp storage and a larger page cache."""
+        conn = initialized_event_logger.connection
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -20000
+
+    def test_reconnect_reapplies_pragmas(self, initialized_event_logger: EventLogger) -> None:
+        """A connection reopened by ``_ensure_connection`` is tuned the same way."""
+        initialized_event_logger.connection.close()
+        initialized_event_logger.connection = None
+        assert initialized_event_logger._ensure_connection() is True
+        conn = initialized_event_logger.connection
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+
+    def test_reader_not_blocked_by_open_write(
+        self,
+        initialized_event_logger: EventLogger,
+        tmp_storage_config: Dict[str, Any],
+        base_detection: Dict[str, Any],
+    ) -> None:
+        """A portal-side reader sees the last commit while the detector holds a write transaction."""
+        _insert(initialized_event_logger, base_detection, 2)
+        writer = initialized_event_logger.connection
+        writer.execute("BEGIN EXCLUSIVE")  # blocks readers outright in rollback-journal mode
+        writer.execute("DELETE FROM detections")
+
+        reader = EventLogger(tmp_storage_config)
+        try:
+            assert reader.count_detections() == 2
+        finally:
+            writer.rollback()
+            reader.cleanup()
+
+
+class TestLogDetections:
+    """Tests for ``log_detections``."""
+
+    def test_batch_commits_once_with_consecutive_ids(
+        self, initialized_event_logger: EventLogger, base_detection: Dict[str, Any]
+    ) -> None:
+        """A frame's detections share one commit and get increasing row ids."""
+        statements: List[str] = []
+        initialized_event_logger.connection.set_trace_callback(statements.append)
+        ids = initialized_event_logger.log_detections([base_detection] * 3)
+        initialized_event_logger.connection.set_trace_callback(None)
+
+        assert len(ids) == 3 and ids == sorted(ids) and None not in ids
+        assert sum(sql == "COMMIT" for sql in statements) == 1
+        assert [initialized_event_logger.get_detection_by_id(i)["id"] for i in ids] == ids
+
+    def test_bad_row_rolls_back_whole_batch(
+        self, initialized_event_logger: EventLogger, base_detection: Dict[str, Any]
+    ) -> None:
+        """A detection that cannot be stored leaves no partial batch behind."""
+        bad = {**base_detection, "class_name": None}  # violates NOT NULL on insert
+
+        assert initialized_event_logger.log_detections([base_detection, bad]) == [None, None]
+        assert initialized_event_logger.count_detections() == 0
+        assert initialized_event_logger.log_detections([]) == []
+
+
+class TestKeysetPagination:
+    """Tests for ``get_detections(before_id=...)``."""
+
+    def test_pages_cover_all_rows_newest_first(
+        self, initialized_event_logger: EventLogger, base_detection: Dict[str, Any]
+    ) -> None:
+        """Following the last id of each page visits every row once, descending."""
+        ids = _insert(initialized_event_logger, base_detection, 7)
+
+        seen: List[int] = []
+        cursor = max(ids) + 1
+        while True:
+            page = initialized_event_logger.get_detections(limit=3, before_id=cursor)
+            if not page:
+                break
+            seen.extend(d["id"] for d in page)
+            cursor = page[-1]["id"]
+
+        assert seen == sorted(ids, reverse=True)
+
+    def test_pages_follow_timestamps_out_of_id_order(
+        self, initialized_event_logger: EventLogger, base_detection: Dict[str, Any]
+    ) -> None:
+        """Cursor pages continue the first page's timestamp order, ties broken by id."""
+        start = base_detection["timestamp"]
+        offsets = [5, 1, 9, 3, 3, 7, 0, 8, 3, 2]  # includes a three-way timestamp tie
+        ids = [
+            initialized_event_logger.log_detection({**base_detection, "timestamp": start + off})
+            for off in offsets
+        ]
+        expected = [
+            row_id for _, row_id in sorted(zip(offsets, ids), reverse=True)
+        ]
+
+        page = initialized_event_logger.get_detections(limit=3)
+        seen = [d["id"] for d in page]
+        while len(page) == 3:
+            page = initialized_event_logger.get_detections(limit=3, before_id=seen[-1])
+            seen.extend(d["id"] for d in page)
+
+        assert seen == expected
+
+    def test_before_id_respects_filters(
+        self, initialized_event_logger: EventLogger, base_detection: Dict[str, Any]
+    ) -> None:
+        """The cursor combines with the class filter instead of replacing it."""
+        bird_ids = _insert(initialized_event_logger, base_detection, 2)
+        _insert(initialized_event_logger, {**base_detection, "class_name": "hawk"}, 2)
+
+        page = initialized_event_logger.get_detections(
+            class_name="bird", before_id=max(bird_ids) + 100
+        )
+        assert [d["id"] for d in page] == sorted(bird_ids, reverse=True)
+
+
+class TestCountDetectionsSince:
+    """Tests for ``count_detections_since``."""
+
+    def test_counts_rows_at_or_after_cutoff(
+        self, initialized_event_logger: EventLogger, base_detection: Dict[str, Any]
+    ) -> None:
+        """Only detections at or after the cutoff are counted, without a 100-row cap."""
+        start = base_detection["timestamp"]
+        _insert(initialized_event_logger, base_detection, 150)
+
+        assert initialized_event_logger.count_detections_since(start) == 150
+        assert initialized_event_logger.count_detections_since(start + 100) == 50
+        assert initialized_event_logger.count_detections_since(start + 1000) == 0
+
+    def test_uses_timestamp_index(self, initialized_event_logger: EventLogger) -> None:
+        """The query plan searches the timestamp index instead of scanning the table."""
+        plan = initialized_event_logger.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM detections WHERE 1=1 AND timestamp >= ?",
+            (0.0,),
+        ).fetchall()
+        assert any("idx_detections_timestamp" in row[-1] for row in plan)
+
+    def test_bounded_range_searches_index(
+        self, initialized_event_logger: EventLogger, base_detection: Dict[str, Any]
+    ) -> None:
+        """A window with both bounds is a SEARCH on the index and counts both ends."""
+        start = base_detection["timestamp"]
+        _insert(initialized_event_logger, base_detection, 10)
+
+        plan = initialized_event_logger.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM detections "
+            "WHERE 1=1 AND timestamp >= ? AND timestamp <= ?",
+            (start, start + 5),
+        ).fetchall()
+        details = " ".join(row[-1] for row in plan)
+        assert "SEARCH" in details and "idx_detections_timestamp" in details
+        assert initialized_event_logger.count_detections(start + 2, start + 5) == 4
+
+
+class TestGetDetectionCounts:
+    """Tests for ``get_detection_counts``."""
+
+    def test_matches_individual_counts(
+        self, initialized_event_logger: EventLogger, base_detection: Dict[str, Any]
+    ) -> None:
+        """Each window count equals the separate ``count_detections_since`` result."""
+        start = base_detection["timestamp"]
+        _insert(initialized_event_logger, base_detection, 20)
+        starts = (start + 15, start + 5, start - 100)
+
+        counts = initialized_event_logger.get_detection_counts(*starts)
+        assert counts == tuple(
+            initialized_event_logger.count_detections_since(s) for s in starts
+        )
+        assert counts == (5, 15, 20)
+
+    def test_empty_window_counts_zero(self, initialized_event_logger: EventLogger) -> None:
+        """Windows with no rows count 0 rather than NULL."""
+        assert initialized_event_logger.get_detection_counts(0.0, 1.0) == (0, 0)
+        assert initialized_event_logger.get_detection_counts() == ()
+
+    def test_running_counts_track_writes_and_sliding_windows(
+        self, initialized_event_logger: EventLogger, base_detection: Dict[str, Any]
+    ) -> None:
+        """Incremental updates agree with a fresh count without rescanning the windows."""
+        logger = initialized_event_logger
+        t0 = base_detection["timestamp"]
+        _insert(logger, base_detection, 30)
+        assert logger.get_detection_counts(t0 + 20, t0) == (10, 30)
+
+        statements: List[str] = []
+        logger.connection.set_trace_callback(statements.append)
+        _insert(logger, {**base_detection, "timestamp": t0 + 30}, 5)
+        statements.clear()
+        starts = (t0 + 25, t0 + 3)
+        counts = logger.get_detection_counts(*starts)
+        logger.connection.set_trace_callback(None)
+
+        assert counts == tuple(logger.count_detections_since(s) for s in starts) == (10, 32)
+        scans = [sql for sql in statements if "FROM detections WHERE timestamp" in sql]
+        assert scans and all("AND id <=" in sql for sql in scans)
+
+    def test_unchanged_poll_reads_only_id_bounds(
+        self, initialized_event_logger: EventLogger, base_detection: Dict[str, Any]
+    ) -> None:
+        """With no writes and the same windows, a poll is one MAX rowid lookup."""
+        logger = initialized_event_logger
+        t0 = base_detection["timestamp"]
+        _insert(logger, base_detection, 12)
+        first = logger.get_detection_counts(t0 + 6, t0)
+
+        statements: List[str] = []
+        logger.connection.set_trace_callback(statements.append)
+        assert logger.get_detection_counts(t0 + 6, t0) == first == (6, 12)
+        logger.connection.set_trace_callback(None)
+        assert [sql for sql in statements if "FROM detections" in sql] == [
+            "SELECT MAX(id) FROM detections"
+        ]
+
+    def test_running_counts_recount_after_delete(
+        self,
+        initialized_event_logger: EventLogger,
+        tmp_storage_config: Dict[str, Any],
+        base_detection: Dict[str, Any],
+    ) -> None:
+        """Deleting old rows, or moving a window backwards, forces a full recount."""
+        logger = initialized_event_logger
+        t0 = base_detection["timestamp"]
+        _insert(logger, base_detection, 10)
+        assert logger.get_detection_counts(t0) == (10,)
+
+        writer = EventLogger(tmp_storage_config)
+        assert writer.initialize() is True
+        writer.connection.execute("DELETE FROM detections WHERE timestamp < ?", (t0 + 4,))
+        writer.connection.commit()
+        writer.cleanup()
+
+        logger._data_version = None  # as if the data_version memo expired
+        assert logger.get_detection_counts(t0) == (6,)
+        assert logger.get_detection_counts(t0 - 50) == (6,)
+
+    @pytest.mark.parametrize("unsynced_at", ["middle", "newest"])
+    def test_running_counts_recount_after_retention_of_unsynced_rows(
+        self, initialized_event_logger: EventLogger, base_detection: Dict[str, Any], unsynced_at: str
+    ) -> None:
+        """Retention of rows logged before an NTP sync (old timestamp, high id) is not missed."""
+        logger = initialized_event_logger
+        t0 = base_detection["timestamp"]
+        stale = {**base_detection, "timestamp": t0 - 400 * 86400}
+        _insert(logger, base_detection, 5)
+        _insert(logger, stale, 2)
+        if unsynced_at == "middle":
+            _insert(logger, base_detection, 3)
+        window = t0 - 500 * 86400
+        total = logger.count_detections()
+        assert logger.get_detection_counts(window, t0) == (total, total - 2)
+
+        assert logger.cleanup_old_data() is True
+        assert logger.get_detection_counts(window, t0) == (total - 2, total - 2)
+
+
+class TestRecentAggregates:
+    """Tests for ``get_confidence_aggregates`` and ``get_species_breakdown``."""
+
+    def test_match_python_aggregation_over_recent_rows(
+        self,
+        initialized_event_logger: EventLogger,
+        base_detection: Dict[str, Any],
+        species_detection: Dict[str, Any],
+    ) -> None:
+        """SQL aggregates equal the row-by-row computation over the same window."""
+        logger = initialized_event_logger
+        t0 = base_detection["timestamp"]
+        _insert(logger, {**base_detection, "confidence": 0.3}, 2)  # outside the window
+        _insert(logger, {**base_detection, "confidence": 0.0, "timestamp": t0 + 10}, 1)
+        _insert(logger, {**species_detection, "confidence": 0.9, "species_confidence": 0.8, "timestamp": t0 + 20}, 2)
+        _insert(logger, {**species_detection, "species": "Cooper's Hawk", "species_confidence": 0.5, "timestamp": t0 + 30}, 1)
+        _insert(logger, {**base_detection, "confidence": 0.7, "timestamp": t0 + 40}, 1)
+
+        rows = logger.get_detection_summaries(limit=5)
+        confidences = [d["confidence"] for d in rows if d["confidence"]]
+        aggregates = logger.get_confidence_aggregates(limit=5)
+        assert aggregates["detections"] == 5
+        assert aggregates["count"] == len(confidences) == 4
+        assert aggregates["min"] == min(confidences)
+        assert aggregates["max"] == max(confidences)
+        assert abs(aggregates["avg"] - sum(confidences) / len(confidences)) < 1e-9
+
+        breakdown = logger.get_species_breakdown(limit=5)
+        assert breakdown["total_classifications"] == 3
+        assert breakdown["successful_identifications"] == 3
+        assert breakdown["species_breakdown"]["Sharp-shinned Hawk"]["count"] == 2
+        assert abs(breakdown["species_breakdown"]["Sharp-shinned Hawk"]["avg_confidence"] - 0.8) < 1e-9
+        assert breakdown["species_breakdown"]["Cooper's Hawk"] == {"count": 1, "avg_confidence": 0.5}
+
+    def test_empty_table(self, initialized_event_logger: EventLogger) -> None:
+        """With no detections there is nothing to average."""
+        assert initialized_event_logger.get_confidence_aggregates()["count"] == 0
+        assert initialized_event_logger.get_species_breakdown()["species_breakdown"] == {}
+
+
+class TestGetLatestDetection:
+    """Tests for ``get_latest_detection``."""
+
+    def test_empty_table_returns_none(self, initialized_event_logger: EventLogger) -> None:
+        """No detections means no latest detection."""
+        assert initialized_event_logger.get_latest_detection() is None
+
+    def test_returns_newest_row(
+        self, initialized_event_logger: EventLogger, base_detection: Dict[str, Any]
+    ) -> None:
+        """The latest detection matches the last inserted id and its full record."""
+        ids = _insert(initialized_event_logger, base_detection, 3)
+
+        latest = initialized_event_logger.get_latest_detection()
+        assert latest is not None
+        assert latest["id"] == ids[-1]
+        assert latest == initialized_event_logger.get_detection_by_id(ids[-1])
+
+
+class TestGetDetectionById:
+    """Tests for the ``get_detection_by_id`` record cache."""
+
+    def test_repeat_lookup_skips_query(
+        self, initialized_event_logger: EventLogger, base_detection: Dict[str, Any]
+    ) -> None:
+        """Detail, image and segmented requests for one id cost one SELECT; hits run no SQL."""
+        ids = _insert(initialized_event_logger, base_detection, 2)
+        statements: List[str] = []
+        initialized_event_logger.connection.set_trace_callback(statements.append)
+
+        first = initialized_event_logger.get_detection_by_id(ids[0])
+        assert sum("WHERE id =" in sql for sql in statements) == 1
+        statements.clear()
+
+        second = initialized_event_logger.get_detection_by_id(ids[0])
+        assert second == first and second is not first
+        assert statements == []
+
+    def test_returns_copies(
+        self, initialized_event_logger: EventLogger, base_detection: Dict[str, Any]
+    ) -> None:
+        """Mutating a returned record does not change what later callers get."""
+        ids = _insert(initialized_event_logger, base_detection, 1)
+
+        record = initialized_event_logger.get_detection_by_id(ids[0])
+        record["class_name"] = "mutated"
+        assert initialized_event_logger.get_detection_by_id(ids[0])["class_name"] == "bird"
+
+    def test_foreign_delete_invalidates(
+        self,
+        initialized_event_logger: EventLogger,
+        tmp_storage_config: Dict[str, Any],
+        base_detection: Dict[str, Any],
+    ) -> None:
+        """A row deleted by another connection is not served from the cache."""
+        ids = _insert(initialized_event_logger, base_detection, 1)
+        assert initialized_event_logger.get_detection_by_id(ids[0]) is not None
+
+        writer = EventLogger(tmp_storage_config)
+        assert writer.initialize() is True
+        writer.connection.execute("DELETE FROM detections WHERE id = ?", (ids[0],))
+        writer.connection.commit()
+        writer.cleanup()
+
+        initialized_event_logger._data_version = None  # as if the data_version memo expired
+        assert initialized_event_logger.get_detection_by_id(ids[0]) is None
+
+
+class TestCountDetectionsTotal:
+    """Tests for the cached unfiltered ``count_detections`` total."""
+
+    def test_total_reused_until_write(
+        self,
+        initialized_event_logger: EventLogger,
+        tmp_storage_config: Dict[str, Any],
+        base_detection: Dict[str, Any],
+    ) -> None:
+        """Repeated polls run one COUNT; own and foreign inserts refresh it."""
+        _insert(initialized_event_logger, base_detection, 2)
+        statements: List[str] = []
+        initialized_event_logger.connection.set_trace_callback(statements.append)
+
+        assert initialized_event_logger.count_detections() == 2
+        assert initialized_event_logger.count_detections() == 2
+        assert sum("COUNT(*)" in sql for sql in statements) == 1
+
+        _insert(initialized_event_logger, base_detection, 1)
+        assert initialized_event_logger.count_detections() == 3
+
+        writer = EventLogger(tmp_storage_config)
+        assert writer.initialize() is True
+        writer.log_detection(base_detection)
+        writer.cleanup()
+        initialized_event_logger._data_version = None  # as if the data_version memo expired
+        assert initialized_event_logger.count_detections() == 4
+        assert initialized_event_logger.count_detections(class_name="hawk") == 0
+
+
+class TestGetStatusSummary:
+    """Tests for ``get_status_summary``."""
+
+    def test_total_and_latest_in_one_query(
+        self, initialized_event_logger: EventLogger, base_detection: Dict[str, Any]
+    ) -> None:
+        """Empty and populated tables; repeat polls and count_detections reuse the result."""
+        assert initialized_event_logger.get_status_summary() == (0, None)
+
+        ids = _insert(initialized_event_logger, base_detection, 3)
+        statements: List[str] = []
+        initialized_event_logger.connection.set_trace_callback(statements.append)
+
+        total, latest = initialized_event_logger.get_status_summary()
+        assert initialized_event_logger.get_status_summary() == (total, latest)
+        assert initialized_event_logger.count_detections() == total == 3
+        assert len([sql for sql in statements if "FROM detections" in sql]) == 1
+
+        newest = initialized_event_logger.get_detection_by_id(max(ids))
+        assert latest == {
+            "id": newest["id"],
+            "timestamp": newest["timestamp"],
+            "confidence": newest["confidence"],
+            "class": newest["class_name"],
+            "bbox": newest["bbox"],
+        }
+
+
+class TestGetDetectionSummaries:
+    """Tests for ``get_detection_summaries``."""
+
+    def test_matches_full_records(
+        self, initialized_event_logger: EventLogger, species_detection: Dict[str, Any]
+    ) -> None:
+        """Each summary carries the web key names and the same values as the full record."""
+        _insert(initialized_event_logger, species_detection, 2)
+
+        summaries = initialized_event_logger.get_detection_summaries(limit=10)
+        records = initialized_event_logger.get_detections(limit=10)
+        assert len(summaries) == 2
+        for summary, record in zip(summaries, records):
+            assert summary == {
+                "id": record["id"],
+                "timestamp": record["timestamp"],
+                "confidence": record["confidence"],
+                "class": record["class_name"],
+                "bbox": record["bbox"],
+                "image_path": record["image_path"],
+                "species": record["species_name"],
+                "species_confidence": record["species_confidence"],
+                "segmented_image_path": record["segmented_image_path"],
+            }
+        assert summaries[0]["species"] == "Sharp-shinned Hawk"
+
+    def test_selects_no_json_columns(
+        self, initialized_event_logger: EventLogger, species_detection: Dict[str, Any]
+    ) -> None:
+        """The list query reads bbox from its integer columns and never touches metadata JSON."""
+        _insert(initialized_event_logger, species_detection, 1)
+        statements: List[str] = []
+        initialized_event_logger.connection.set_trace_callback(statements.append)
+
+        summary = initialized_event_logger.get_detection_summaries(limit=10)[0]
+        selects = [sql for sql in statements if "FROM detections" in sql]
+        assert len(selects) == 1 and "metadata" not in selects[0] and "*" not in selects[0]
+        assert all(isinstance(v, (int, float)) for v in summary["bbox"])
+
+
+class TestDetectionsVersion:
+    """Tests for ``detections_version``."""
+
+    def test_changes_on_local_and_foreign_writes(
+        self,
+        initialized_event_logger: EventLogger,
+        tmp_storage_config: Dict[str, Any],
+        base_detection: Dict[str, Any],
+    ) -> None:
+        """Writes through this logger or a second connection both move the token."""
+        reader = initialized_event_logger
+        before = reader.detections_version()
+        assert reader.detections_version() == before
+
+        _insert(reader, base_detection, 1)
+        after_local = reader.detections_version()
+        assert after_local != before
+
+        writer = EventLogger(tmp_storage_config)
+        assert writer.initialize() is True
+        _insert(writer, base_detection, 1)
+        reader._data_version = None  # as if the data_version memo expired
+        assert reader.detections_version() != after_local
+        writer.cleanup()
@@ -8,7 +8,8 @@ Tests the live camera view, camera feed, and related UI components.
 import pytest
 import os
 import time
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
 
 if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
@@ -43,6 +44,193 @@ class TestLiveCameraAPI:
             # Should return 200 if camera is working, or 503/500 if not available
             assert response.status_code in [200, 503, 500]
     
+    def test_fallback_frame_reused_within_second(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """The fallback JPEG is encoded once per second and re-rendered after."""
+        import cv2
+        
+        clock = mocker.patch('skyguard.web.app.time.time', return_value=1_700_000_000.2)
+        encode = mocker.spy(cv2, 'imencode')
+        
+        first = web_portal._render_fallback_frame()
+        clock.return_value = 1_700_000_000.9
+        assert web_portal._render_fallback_frame() is first
+        assert encode.call_count == 1
+        
+        clock.return_value = 1_700_000_001.0
+        assert web_portal._render_fallback_frame() != first
+        assert encode.call_count == 2
+    
+    def test_fallback_frame_draws_only_timestamp_per_frame(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """The three captions are rasterized once into the base; each later frame draws just the timestamp."""
+        import cv2
+        
+        clock = mocker.patch('skyguard.web.app.time.time', return_value=1_700_000_000.2)
+        put_text = mocker.spy(cv2, 'putText')
+        
+        web_portal._render_fallback_frame()
+        assert put_text.call_count == 4  # three captions into the cached base + timestamp
+        
+        clock.return_value = 1_700_000_001.2
+        web_portal._render_fallback_frame()
+        assert put_text.call_count == 5
+        assert put_text.call_args.args[1] == time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(1_700_000_001))
+    
+    def test_fallback_frame_served_without_encoding(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """Only the first request encodes; later ones get the refresher's frame, which stops when idle."""
+        import cv2
+        
+        encode = mocker.spy(cv2, 'imencode')
+        web_portal._fallback_idle_timeout = 0.0
+        
+        first = web_portal._get_fallback_frame()
+        assert first is not None
+        assert web_portal._fallback_refresher_running
+        web_portal._fallback_jpeg = (-1, b'published')
+        assert web_portal._get_fallback_frame() == b'published'
+        assert encode.call_count == 1
+        
+        deadline = time.monotonic() + 3.0
+        while web_portal._fallback_refresher_running and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not web_portal._fallback_refresher_running
+    
+    def test_fallback_feed_revalidates_within_second(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """Without a snapshot, repeat polls in the same second get a 304 for the cached frame."""
+        mocker.patch('skyguard.web.app.os.path.exists', return_value=False)
+        mocker.patch('skyguard.web.app.time.time', return_value=1_700_000_000.2)
+        
+        with web_portal.app.test_client() as client:
+            first = client.get('/api/camera/feed')
+            assert first.status_code == 200
+            assert first.mimetype == 'image/jpeg'
+            
+            repeat = client.get('/api/camera/feed', headers={'If-None-Match': first.headers['ETag']})
+            assert repeat.status_code == 304
+            assert repeat.data == b''
+    
+    def test_camera_connected_from_single_stat(
+        self, web_portal: SkyGuardWebPortal, tmp_path: Path, mocker: "MockerFixture"
+    ) -> None:
+        """Freshness and size come from one stat of the snapshot file."""
+        snapshot_file = tmp_path / "camera_snapshot.jpg"
+        mocker.patch('skyguard.web.app.SNAPSHOT_FILE', str(snapshot_file))
+        assert web_portal._stat_snapshot() is None
+        assert web_portal._is_camera_connected() is False
+        
+        snapshot_file.write_bytes(b'x' * 60000)
+        stat = mocker.spy(os, 'stat')
+        assert web_portal._is_camera_connected() is True
+        assert stat.call_count == 1
+        
+        snapshot_file.write_bytes(b'x' * 100)  # placeholder-sized frame
+        assert web_portal._is_camera_connected() is False
+        with web_portal.app.test_client() as client:
+            assert client.get('/api/camera/status').get_json()['connected'] is True
+    
+    def test_status_polls_share_one_snapshot_stat(
+        self, web_portal: SkyGuardWebPortal, tmp_path: Path, mocker: "MockerFixture"
+    ) -> None:
+        """Heartbeat polls inside the status cache window do not stat the snapshot again."""
+        snapshot_file = tmp_path / "camera_snapshot.jpg"
+        snapshot_file.write_bytes(b'x' * 60000)
+        mocker.patch('skyguard.web.app.SNAPSHOT_FILE', str(snapshot_file))
+        mocker.patch.object(web_portal, '_is_system_running', return_value=False)
+        web_portal._response_cache.clear()
+        stat = mocker.spy(web_portal, '_stat_snapshot')
+        
+        with web_portal.app.test_client() as client:
+            for _ in range(3):
+                assert client.get('/api/status').get_json()['camera']['connected'] is True
+        assert stat.call_count == 1
+    
+    def test_fallback_gradient_matches_per_pixel_formula(self, web_portal: SkyGuardWebPortal) -> None:
+        """The broadcast gradient equals the original per-pixel [255y/480, 255x/640, 100] fill."""
+        assert web_portal._get_fallback_frame() is not None
+        base = web_portal._fallback_base_bgr
+        assert base.shape == (480, 640, 3)
+        
+        # Rows clear of the captions (y 75-205) and the timestamp (y ~390)
+        for y in list(range(0, 60, 7)) + list(range(420, 480, 7)):
+            for x in range(0, 640, 13):
+                assert base[y, x].tolist() == [int(255 * y / 480), int(255 * x / 640), 100]
+    
+    def test_snapshot_stream_yields_only_changed_frames(self, web_portal: SkyGuardWebPortal, tmp_path: Path, mocker: "MockerFixture") -> None:
+        """The MJPEG generator re-sends the snapshot only after it changes."""
+        snapshot_file = tmp_path / "camera_snapshot.jpg"
+        snapshot_file.write_bytes(b'first')
+        
+        def fake_sleep(_: float) -> None:
+            # The camera writes a new snapshot during the third poll interval
+            if sleep.call_count == 3:
+                snapshot_file.write_bytes(b'second frame')
+        
+        sleep = mocker.patch('skyguard.web.app.time.sleep', side_effect=fake_sleep)
+        
+        stream = web_portal._iter_snapshot_stream(str(snapshot_file))
+        part = next(stream)
+        assert part.startswith(b'--frame\r\nContent-Type: image/jpeg\r\n')
+        assert part.endswith(b'\r\n\r\nfirst\r\n')
+        
+        assert next(stream).endswith(b'second frame\r\n')
+        assert sleep.call_count == 3  # two unchanged polls yielded nothing
+    
+    def test_snapshot_stream_ends_after_max_duration(self, web_portal: SkyGuardWebPortal, tmp_path: Path, mocker: "MockerFixture") -> None:
+        """An idle stream re-sends its last frame as a keepalive and stops at the deadline."""
+        snapshot_file = tmp_path / "camera_snapshot.jpg"
+        snapshot_file.write_bytes(b'still')
+        clock = mocker.patch('skyguard.web.app.time.monotonic', return_value=1000.0)
+        
+        def fake_sleep(seconds: float) -> None:
+            clock.return_value += seconds
+        
+        mocker.patch('skyguard.web.app.time.sleep', side_effect=fake_sleep)
+        
+        parts = list(web_portal._iter_snapshot_stream(
+            str(snapshot_file), poll_interval=1.0, max_duration=30.0, keepalive=10.0))
+        
+        # The first frame, then one keepalive re-send every 10 seconds
+        assert len(parts) == 3
+        assert all(part.endswith(b'\r\n\r\nstill\r\n') for part in parts)
+        assert clock.return_value == 1030.0
+    
+    def test_snapshot_stream_closes_on_disconnect(self, web_portal: SkyGuardWebPortal, tmp_path: Path) -> None:
+        """Closing the generator, as the server does after a failed write, ends the stream."""
+        snapshot_file = tmp_path / "camera_snapshot.jpg"
+        snapshot_file.write_bytes(b'frame')
+        
+        stream = web_portal._iter_snapshot_stream(str(snapshot_file), poll_interval=0.0)
+        next(stream)
+        stream.close()
+        with pytest.raises(StopIteration):
+            next(stream)
+    
+    def test_camera_stream_endpoint_mimetype(self, web_portal: SkyGuardWebPortal) -> None:
+        """The stream endpoint advertises a multipart MJPEG body."""
+        with web_portal.app.test_client() as client:
+            response = client.get('/api/camera/stream', buffered=False)
+            assert response.status_code == 200
+            assert response.mimetype == 'multipart/x-mixed-replace'
+            response.close()
+    
+    def test_camera_stream_shares_stream_cap(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """With the slots taken by status streams, the MJPEG stream gets a 503 until one closes."""
+        mocker.patch.object(web_portal, '_status_publish_loop')
+        web_portal._max_streams = 1
+        
+        with web_portal.app.test_client() as client:
+            events = client.get('/api/events', buffered=False)
+            assert events.status_code == 200
+            
+            refused = client.get('/api/camera/stream', buffered=False)
+            assert refused.status_code == 503
+            refused.close()
+            
+            events.close()
+            stream = client.get('/api/camera/stream', buffered=False)
+            assert stream.status_code == 200
+            stream.close()
+        assert web_portal._open_streams == 0
+    
     def test_camera_capture_endpoint_without_camera(self, web_portal: SkyGuardWebPortal) -> None:
         """Test the /api/camera/capture endpoint when no camera is available."""
         with web_portal.app.test_client() as client:
@@ -71,6 +259,25 @@ class TestLiveCameraAPI:
             assert response.status_code == 200
             assert response.content_type == 'image/jpeg'
     
+    def test_camera_feed_conditional_get(self, web_portal: SkyGuardWebPortal) -> None:
+        """An unchanged snapshot is answered with 304 Not Modified."""
+        import cv2
+        import numpy as np
+        
+        snapshot_file = "data/camera_snapshot.jpg"
+        os.makedirs("data", exist_ok=True)
+        cv2.imwrite(snapshot_file, np.zeros((48, 64, 3), dtype=np.uint8))
+        
+        with web_portal.app.test_client() as client:
+            first = client.get('/api/camera/feed')
+            assert first.status_code == 200
+            etag = first.headers.get('ETag')
+            assert etag
+            
+            second = client.get('/api/camera/feed', headers={'If-None-Match': etag})
+            assert second.status_code == 304
+            assert second.data == b''
+    
     def test_camera_capture_with_mock_camera(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
         """Test camera capture with mocked camera."""
         # The web portal reads from snapshot file, not a direct camera object
@@ -90,6 +297,8 @@ class TestLiveCameraAPI:
             # Should return 200 with image data (either from file or generated test image)
             assert response.status_code == 200
             assert response.content_type == 'image/jpeg'
+            assert 'attachment' in response.headers['Content-Disposition']
+            assert 'skyguard_capture_' in response.headers['Content-Disposition']
 
 
 class TestLiveCameraUI:
@@ -244,8 +453,10 @@ class TestLiveCameraIntegration:
 
 
 @pytest.fixture
-def web_portal() -> SkyGuardWebPortal:
+def web_portal() -> Iterator[SkyGuardWebPortal]:
     """Create a web portal instance for testing."""
     # Use real components with test configuration
     portal = SkyGuardWebPortal("test_config.yaml")
-    return portal
+    yield portal
+    # Stop background threads (metrics sampler, fallback frame refresher)
+    portal._sampler_stop.set()
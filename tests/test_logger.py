@@ -0,0 +1,173 @@
+"""
+Tests for the SkyGuard logging utilities.
+
+These tests validate that:
+- FastFormatter renders the same timestamp text as ``time.strftime``, and
+  the same text as ``logging.Formatter`` when no datefmt is given
+- FastRotatingFileHandler buffers records, flushes them on its timer and
+  on ERROR, still rotates at ``maxBytes`` (counted in encoded bytes), and
+  drops its exit hook when closed
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+import pytest
+
+from skyguard.utils.logger import FastFormatter, FastRotatingFileHandler
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+_FMT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_DATEFMT = '%Y-%m-%d %H:%M:%S'
+
+
+def _record(created: float, level: int = logging.INFO, msg: str = "hello") -> logging.LogRecord:
+    """Build a log record with a fixed creation time."""
+    record = logging.LogRecord("skyguard.test", level, __file__, 1, msg, None, None)
+    record.created = created
+    return record
+
+
+@pytest.fixture
+def isolated_logger() -> Iterator[logging.Logger]:
+    """Return a non-propagating logger whose handlers are removed afterwards."""
+    logger = logging.getLogger("skyguard.test.fast_handler")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    yield logger
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
+
+class TestFastFormatter:
+    """Tests for the cached-second timestamp formatter."""
+
+    def test_matches_strftime(self) -> None:
+        """Rendered asctime must equal time.strftime for the record's second."""
+        formatter = FastFormatter(fmt=_FMT, datefmt=_DATEFMT)
+        created = 1_700_000_000.75
+        expected = time.strftime(_DATEFMT, time.localtime(created))
+        assert formatter.format(_record(created)).startswith(expected + " - ")
+
+    def test_cache_refreshes_on_new_second(self) -> None:
+        """A record from a later second must not reuse the cached string."""
+        formatter = FastFormatter(fmt=_FMT, datefmt=_DATEFMT)
+        first = formatter.formatTime(_record(1_700_000_000.1), _DATEFMT)
+        same = formatter.formatTime(_record(1_700_000_000.9), _DATEFMT)
+        later = formatter.formatTime(_record(1_700_000_001.0), _DATEFMT)
+        assert first == same
+        assert later == time.strftime(_DATEFMT, time.localtime(1_700_000_001))
+
+    @pytest.mark.parametrize("created", [1_700_000_000.0, 1_700_000_000.007, 1_700_000_000.999])
+    def test_default_datefmt_matches_stdlib(self, created: float) -> None:
+        """Without a datefmt the output equals logging.Formatter, milliseconds included."""
+        fast = FastFormatter(fmt=_FMT)
+        stock = logging.Formatter(fmt=_FMT)
+        record = _record(created)
+        record.msecs = (created - int(created)) * 1000
+
+        assert fast.format(record) == stock.format(record)
+        assert fast.format(record) == stock.format(record)  # served from the cache
+
+    def test_custom_datefmt_falls_back(self) -> None:
+        """A non-default datefmt is honoured via the standard implementation."""
+        formatter = FastFormatter(fmt='%(asctime)s', datefmt='%H:%M')
+        created = 1_700_000_000.0
+        assert formatter.format(_record(created)) == time.strftime('%H:%M', time.localtime(created))
+
+
+class TestFastRotatingFileHandler:
+    """Tests for the buffered rotating file handler."""
+
+    def test_records_buffered_until_timer_flush(
+        self, tmp_path: Path, isolated_logger: logging.Logger
+    ) -> None:
+        """INFO records stay in the buffer and reach disk after the flush interval."""
+        log_file = tmp_path / "skyguard.log"
+        handler = FastRotatingFileHandler(str(log_file), flush_interval_ms=50)
+        isolated_logger.addHandler(handler)
+
+        isolated_logger.info("buffered line")
+        assert log_file.read_text() == ""
+
+        deadline = time.monotonic() + 2.0
+        while "buffered line" not in log_file.read_text() and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert "buffered line" in log_file.read_text()
+
+    def test_error_flushes_immediately(
+        self, tmp_path: Path, isolated_logger: logging.Logger
+    ) -> None:
+        """ERROR records are written through without waiting for the timer."""
+        log_file = tmp_path / "skyguard.log"
+        handler = FastRotatingFileHandler(str(log_file), flush_interval_ms=60_000)
+        isolated_logger.addHandler(handler)
+
+        isolated_logger.info("before")
+        isolated_logger.error("failure")
+        contents = log_file.read_text()
+        assert "before" in contents
+        assert "failure" in contents
+
+    def test_rotates_at_max_bytes(
+        self, tmp_path: Path, isolated_logger: logging.Logger
+    ) -> None:
+        """The handler keeps every file under maxBytes and honours backupCount."""
+        log_file = tmp_path / "skyguard.log"
+        handler = FastRotatingFileHandler(
+            str(log_file), maxBytes=500, backupCount=2, flush_interval_ms=60_000
+        )
+        isolated_logger.addHandler(handler)
+
+        for i in range(60):
+            isolated_logger.info("line %03d padding-padding-padding", i)
+        handler.flush()
+
+        files = sorted(p.name for p in tmp_path.iterdir())
+        assert files == ["skyguard.log", "skyguard.log.1", "skyguard.log.2"]
+        for name in files:
+            assert (tmp_path / name).stat().st_size < 500
+        assert "line 059" in log_file.read_text()
+
+    def test_max_bytes_counts_encoded_bytes(
+        self, tmp_path: Path, isolated_logger: logging.Logger
+    ) -> None:
+        """Multi-byte records rotate on their encoded size, not their length."""
+        log_file = tmp_path / "skyguard.log"
+        handler = FastRotatingFileHandler(
+            str(log_file), maxBytes=500, backupCount=5, encoding="utf-8",
+            flush_interval_ms=60_000,
+        )
+        isolated_logger.addHandler(handler)
+
+        for i in range(20):
+            isolated_logger.info("Fährte %02d \u9ce5\u9ce5\u9ce5\u9ce5\u9ce5\u9ce5", i)
+        handler.flush()
+
+        files = sorted(p.name for p in tmp_path.iterdir())
+        assert len(files) > 1
+        for name in files:
+            assert (tmp_path / name).stat().st_size < 500
+
+    def test_close_unregisters_exit_flush(
+        self, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """Closing the handler removes the atexit hook registered for it."""
+        atexit_mock = mocker.patch("skyguard.utils.logger.atexit")
+        handler = FastRotatingFileHandler(str(tmp_path / "skyguard.log"))
+        atexit_mock.register.assert_called_once_with(handler.flush)
+
+        handler.close()
+        atexit_mock.unregister.assert_called_once_with(handler.flush)
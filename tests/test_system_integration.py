@@ -506,3 +506,23 @@ class TestSystemIntegration:
             
             # Should not raise exceptions
             assert True
+
+    def test_run_removes_pid_file_when_startup_fails(
+        self, tmp_path: Path, monkeypatch: "MonkeyPatch", mocker: "MockerFixture"
+    ) -> None:
+        """A failure after the PID file is written must not leave it behind."""
+        pid_file = tmp_path / "skyguard.pid"
+        monkeypatch.setattr("skyguard.main.PID_FILE", pid_file)
+        system = SkyGuardSystem("config/skyguard.yaml")
+        mocker.patch.object(system, "initialize", return_value=True)
+        mocker.patch.object(system, "shutdown")
+        written = []
+        mocker.patch.object(
+            system, "_perform_warmup_detections",
+            side_effect=lambda: written.append(pid_file.exists()) or 1 / 0,
+        )
+        
+        system.run()
+        
+        assert written == [True]
+        assert not pid_file.exists()
@@ -5,10 +5,17 @@ This module contains comprehensive tests for all API endpoints
 to ensure proper functionality and error handling.
 """
 
+import os
+import re
+import sqlite3
+import threading
+import time
 import pytest
 import json
-from unittest.mock import Mock, patch, MagicMock
-from typing import TYPE_CHECKING
+from pathlib import Path
+from datetime import date, datetime
+from unittest.mock import Mock, NonCallableMock, patch, MagicMock
+from typing import TYPE_CHECKING, Any, Iterator
 
 if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
@@ -17,18 +24,20 @@ if TYPE_CHECKING:
     from _pytest.monkeypatch import MonkeyPatch
     from pytest_mock.plugin import MockerFixture
 
-from skyguard.web.app import SkyGuardWebPortal
+from skyguard.web.app import DETECTION_IMAGE_MAX_AGE, SkyGuardWebPortal, _parse_log_timestamp
 
 
 class TestSkyGuardWebPortalAPI:
     """Test the SkyGuard Web Portal API endpoints."""
     
     @pytest.fixture
-    def web_portal(self) -> SkyGuardWebPortal:
+    def web_portal(self) -> Iterator[SkyGuardWebPortal]:
         """Create a web portal instance for testing."""
         # Use real components with test configuration
         portal = SkyGuardWebPortal("test_config.yaml")
-        return portal
+        yield portal
+        # Stop the metrics sampler so it cannot call psutil during later tests
+        portal._sampler_stop.set()
     
     def test_index_route(self, web_portal: SkyGuardWebPortal) -> None:
         """Test the main index route returns the dashboard page."""
@@ -60,6 +69,697 @@ class TestSkyGuardWebPortalAPI:
             assert data['camera']['connected'] is True
             assert data['ai']['loaded'] is True
     
+    def test_api_status_counts_detections_once(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """The total and last detection come from one query, reused until the table changes."""
+        mocker.patch.object(web_portal, '_is_system_running', return_value=False)
+        mocker.patch.object(web_portal, '_is_model_loaded', return_value=True)
+        mocker.patch.object(web_portal, '_is_species_model_loaded', return_value=False)
+        web_portal._response_cache_ttl = 0.0  # rebuild the body on every request
+        assert web_portal.event_logger._ensure_connection()
+        statements = []
+        web_portal.event_logger.connection.set_trace_callback(statements.append)
+        
+        with web_portal.app.test_client() as client:
+            first = json.loads(client.get('/api/status').data)
+            second = json.loads(client.get('/api/status').data)
+        web_portal.event_logger.connection.set_trace_callback(None)
+        
+        assert first['system']['total_detections'] == second['detections']['total']
+        assert first['detections']['recent'] == min(first['detections']['total'], 5)
+        assert len([sql for sql in statements if 'FROM detections' in sql]) == 1
+    
+    def test_api_status_last_detection_from_summary(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """The last detection is read with the total instead of fetching a page of rows."""
+        mocker.patch.object(web_portal, '_is_system_running', return_value=False)
+        mocker.patch.object(web_portal, '_is_model_loaded', return_value=True)
+        mocker.patch.object(web_portal, '_is_species_model_loaded', return_value=False)
+        latest = {'id': 7, 'timestamp': 1700000000.0, 'confidence': 0.9, 'class': 'bird', 'bbox': [1, 2, 3, 4]}
+        mocker.patch.object(web_portal.event_logger, 'get_status_summary', return_value=(12, latest))
+        summaries = mocker.spy(web_portal.event_logger, 'get_detection_summaries')
+        
+        with web_portal.app.test_client() as client:
+            data = json.loads(client.get('/api/status').data)
+            assert data['system']['last_detection'] == latest
+            assert data['system']['total_detections'] == data['detections']['total'] == 12
+            assert data['detections']['recent'] == 5
+            summaries.assert_not_called()
+    
+    def test_detection_counters_never_load_rows(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """Total and range counters use COUNT queries, not row lists."""
+        get_detections = mocker.spy(web_portal.event_logger, 'get_detections')
+        summaries = mocker.spy(web_portal.event_logger, 'get_detection_summaries')
+        
+        counts = [
+            web_portal._get_total_detections(),
+            web_portal._get_detections_today(),
+            web_portal._get_detections_this_week(),
+            web_portal._get_detections_this_month(),
+        ]
+        assert all(isinstance(count, int) for count in counts)
+        get_detections.assert_not_called()
+        summaries.assert_not_called()
+    
+    def test_detector_built_on_first_use(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """Startup and status checks skip the detector; the first model route builds it once."""
+        assert web_portal._detector is None
+        
+        detector = Mock(model=None, species_model=None)
+        build = mocker.patch.object(web_portal, '_build_detector', return_value=detector)
+        assert web_portal._is_model_loaded() is False
+        assert web_portal._is_species_model_loaded() is False
+        time.sleep(0.05)  # nothing may be loading in the background either
+        assert build.call_count == 0 and web_portal._detector is None
+        
+        assert web_portal.detector is detector
+        assert web_portal.detector is detector
+        assert build.call_count == 1
+        
+        web_portal._initialize_components()  # config change drops the old detector
+        assert web_portal._detector is None
+    
+    def test_restart_components_does_not_load_models(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """A config save only drops the detector; weights load on the next model route."""
+        web_portal.detector = Mock(model=Mock(), species_model=None)
+        request_thread = threading.current_thread()
+        built_on = []
+        mocker.patch.object(web_portal, '_build_detector',
+                            side_effect=lambda: built_on.append(threading.current_thread()) or Mock())
+        
+        web_portal._restart_components()
+        assert web_portal._detector is None
+        assert built_on == []
+        
+        assert web_portal._is_model_loaded() is False  # status checks never build it
+        assert built_on == []
+        assert web_portal.detector is not None  # the next model route rebuilds it
+        assert built_on == [request_thread]
+    
+    def test_restart_components_does_not_wait_for_model_load(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """A config save during a slow build returns at once, and that stale build is not kept."""
+        started, release = threading.Event(), threading.Event()
+        
+        def slow_build() -> Mock:
+            started.set()
+            release.wait(5.0)
+            return Mock()
+        
+        build = mocker.patch.object(web_portal, '_build_detector', side_effect=slow_build)
+        warmup = threading.Thread(target=lambda: web_portal.detector, daemon=True)
+        warmup.start()
+        assert started.wait(2.0)
+        
+        began = time.monotonic()
+        web_portal._restart_components()
+        assert time.monotonic() - began < 0.5
+        
+        release.set()
+        warmup.join(2.0)
+        assert web_portal._detector is None  # built from the old config, discarded
+        assert web_portal.detector is not None
+        assert build.call_count == 2
+    
+    def test_model_probe_reused_until_model_swapped(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """The usability probe runs once per installed model object."""
+        probe_calls = []
+        
+        class Model:
+            def __getattr__(self, name: str) -> Any:
+                probe_calls.append(name)
+                raise AttributeError(name)
+        
+        web_portal.detector = Mock(model=Model(), species_model=None)
+        mocker.patch.object(web_portal, '_reload_detector_models', return_value=False)
+        web_portal._last_reload_attempt = time.monotonic()  # keep reloads in cooldown
+        
+        assert web_portal._is_model_loaded() is False
+        assert web_portal._is_model_loaded() is False
+        assert probe_calls == ['predict']
+        
+        web_portal.detector.model = Mock()
+        assert web_portal._is_model_loaded() is True
+    
+    def test_model_probe_forgotten_after_reload(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """A reload re-probes models even if the same objects stay installed."""
+        model = NonCallableMock(spec=[])  # neither callable nor has predict
+        web_portal.detector = Mock(model=model, species_model=None)
+        web_portal._last_reload_attempt = time.monotonic()
+        assert web_portal._probe_model('model', model) is False
+        
+        model.predict = Mock()  # e.g. a backend that finishes setting up in place
+        assert web_portal._probe_model('model', model) is False
+        web_portal.detector._resolve_model_path.return_value = Path('missing-model.pt')
+        web_portal._reload_detector_models()
+        assert web_portal._probe_model('model', model) is True
+    
+    def test_model_reload_cooldown_shared_and_monotonic(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """One reload per cooldown across both model checks, timed on the monotonic clock."""
+        web_portal.detector = Mock(model=None, species_model=None)
+        reload = mocker.patch.object(web_portal, '_reload_detector_models', return_value=False)
+        
+        assert web_portal._is_model_loaded() is False
+        assert reload.call_count == 1
+        assert abs(web_portal._last_reload_attempt - time.monotonic()) < 5
+        
+        web_portal.detector.model = Mock()
+        assert web_portal._is_model_loaded() is True
+        assert web_portal._is_species_model_loaded() is False
+        assert reload.call_count == 1  # species check is inside the same cooldown
+        
+        web_portal._last_reload_attempt -= web_portal._reload_cooldown + 1
+        assert web_portal._is_species_model_loaded() is False
+        assert reload.call_count == 2
+    
+    def test_reload_failure_traceback_only_at_debug(
+        self, web_portal: SkyGuardWebPortal, caplog: "LogCaptureFixture"
+    ) -> None:
+        """A failed reload logs one error line; the traceback needs DEBUG."""
+        web_portal.detector = Mock(_resolve_model_path=Mock(side_effect=RuntimeError("boom")))
+        
+        with caplog.at_level('INFO', logger='skyguard.web.app'):
+            assert web_portal._reload_detector_models() is False
+        assert 'Failed to reload detector models: boom' in caplog.text
+        assert 'Traceback' not in caplog.text
+        
+        caplog.clear()
+        with caplog.at_level('DEBUG', logger='skyguard.web.app'):
+            assert web_portal._reload_detector_models() is False
+        assert 'Traceback' in caplog.text
+    
+    def test_is_system_running_uses_pid_file(self, web_portal: SkyGuardWebPortal, tmp_path: Path, monkeypatch: "MonkeyPatch", mocker: "MockerFixture") -> None:
+        """A PID file naming a live SkyGuard process short-circuits the process scan."""
+        import psutil
+        
+        pid_file = tmp_path / "skyguard.pid"
+        pid_file.write_text("4242")
+        monkeypatch.setattr('skyguard.web.app.PID_FILE', str(pid_file))
+        process = mocker.patch.object(psutil, 'Process', return_value=Mock(
+            cmdline=Mock(return_value=['python', '-m', 'skyguard.main'])))
+        process_iter = mocker.patch.object(psutil, 'process_iter', return_value=[])
+        
+        assert web_portal._is_system_running() is True
+        process.assert_called_once_with(4242)
+        process_iter.assert_not_called()
+    
+    @pytest.mark.parametrize("stale_pid", ["own", "gone"])
+    def test_is_system_running_ignores_stale_pid_file(
+        self, web_portal: SkyGuardWebPortal, tmp_path: Path, monkeypatch: "MonkeyPatch",
+        mocker: "MockerFixture", stale_pid: str
+    ) -> None:
+        """A PID file left by a crash, or naming a reused PID, falls through to the scan."""
+        import psutil
+        
+        # "own" is a live PID that is not SkyGuard (this test process)
+        pid = os.getpid() if stale_pid == "own" else 2 ** 22 + 1
+        pid_file = tmp_path / "skyguard.pid"
+        pid_file.write_text(str(pid))
+        monkeypatch.setattr('skyguard.web.app.PID_FILE', str(pid_file))
+        monkeypatch.chdir(tmp_path)  # no camera snapshot here
+        process_iter = mocker.patch.object(psutil, 'process_iter', return_value=[])
+        
+        assert web_portal._is_system_running() is False
+        assert process_iter.call_count == 1
+    
+    def test_is_system_running_caches_process_scan(self, web_portal: SkyGuardWebPortal, tmp_path: Path, monkeypatch: "MonkeyPatch", mocker: "MockerFixture") -> None:
+        """Without a PID file the process table is scanned at most once per TTL."""
+        import psutil
+        
+        monkeypatch.setattr('skyguard.web.app.PID_FILE', str(tmp_path / "missing.pid"))
+        monkeypatch.chdir(tmp_path)  # no camera snapshot here
+        process_iter = mocker.patch.object(psutil, 'process_iter', return_value=[])
+        
+        assert web_portal._is_system_running() is False
+        assert web_portal._is_system_running() is False
+        assert process_iter.call_count == 1
+    
+    def test_is_system_running_rechecks_found_process(self, web_portal: SkyGuardWebPortal, tmp_path: Path, monkeypatch: "MonkeyPatch", mocker: "MockerFixture") -> None:
+        """After a scan finds the main process, later checks reuse its Process handle."""
+        import psutil
+        
+        monkeypatch.setattr('skyguard.web.app.PID_FILE', str(tmp_path / "missing.pid"))
+        monkeypatch.chdir(tmp_path)
+        web_portal._process_scan_ttl = 0.0
+        cmdline = ['python', '-m', 'skyguard.main']
+        main_proc = Mock(info={'cmdline': cmdline}, cmdline=Mock(return_value=cmdline))
+        process_iter = mocker.patch.object(psutil, 'process_iter', return_value=[Mock(info={'cmdline': None}), main_proc])
+        
+        assert web_portal._is_system_running() is True
+        assert web_portal._is_system_running() is True
+        assert process_iter.call_count == 1
+        assert main_proc.cmdline.call_count == 1
+        
+        # The PID was reused by something else: fall back to a full scan
+        main_proc.cmdline.return_value = ['bash']
+        process_iter.return_value = []
+        assert web_portal._is_system_running() is False
+        assert process_iter.call_count == 2
+        assert web_portal._skyguard_proc is None
+    
+    @pytest.mark.parametrize("cmdline, expected", [
+        (['python', '-m', 'skyguard.main'], True),
+        (['/usr/bin/python3', '/opt/SkyGuard/skyguard/main.py', '--config', 'x.yaml'], True),
+        (['pythonw.exe', 'C:\\SkyGuard\\skyguard\\main.py'], True),
+        (['python', '-m', 'skyguard.web.app'], False),
+        (['python', 'skyguard', 'main.py'], False),
+        (['bash'], False),
+        ([], False),
+    ])
+    def test_is_skyguard_cmdline(self, cmdline: list, expected: bool) -> None:
+        """Module and script launches match on any platform; the portal itself does not."""
+        assert SkyGuardWebPortal._is_skyguard_cmdline(cmdline) is expected
+    
+    def test_windows_restart_stops_known_process_without_scan(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """Restart reuses the matched process handle and never shells out to tasklist."""
+        import psutil
+        
+        cmdline = ['pythonw.exe', 'C:\\SkyGuard\\skyguard\\main.py']
+        main_proc = Mock(pid=4321, cmdline=Mock(return_value=cmdline))
+        web_portal._skyguard_proc = main_proc
+        process_iter = mocker.patch.object(psutil, 'process_iter', return_value=[])
+        wait_procs = mocker.patch.object(psutil, 'wait_procs', return_value=([main_proc], []))
+        mocker.patch('platform.system', return_value='Windows')
+        run = mocker.patch('subprocess.run')
+        popen = mocker.patch('subprocess.Popen')
+        mocker.patch.object(web_portal, '_restart_components')
+        
+        web_portal._restart_system()
+        
+        main_proc.terminate.assert_called_once_with()
+        main_proc.kill.assert_not_called()
+        wait_procs.assert_called_once_with([main_proc], timeout=2)
+        assert process_iter.call_count == 0
+        assert run.call_count == 0
+        assert popen.call_count == 1
+    
+    def test_process_scan_prefetches_cmdline_and_stops_at_match(self, web_portal: SkyGuardWebPortal, tmp_path: Path, monkeypatch: "MonkeyPatch", mocker: "MockerFixture") -> None:
+        """The scan asks psutil for cmdline only and does not look past the first match."""
+        import psutil
+        
+        monkeypatch.setattr('skyguard.web.app.PID_FILE', str(tmp_path / "missing.pid"))
+        web_portal._process_scan_ttl = 0.0
+        inspected = []
+        
+        def processes(attrs: list) -> Iterator[Mock]:
+            for cmdline in (['bash'], ['python', '-m', 'skyguard.main'], ['python', 'other.py']):
+                inspected.append(cmdline)
+                yield Mock(info={'cmdline': cmdline})
+        
+        process_iter = mocker.patch.object(psutil, 'process_iter', side_effect=processes)
+        mocker.patch.object(web_portal, '_stat_snapshot', return_value=None)
+        
+        assert web_portal._is_system_running() is True
+        process_iter.assert_called_once_with(['cmdline'])
+        assert len(inspected) == 2
+    
+    def test_system_metrics_sampled_in_background(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """Stats/memory reads share one cached sample instead of calling psutil."""
+        import psutil
+        
+        web_portal._sample_interval = 3600  # keep the sampler thread idle
+        cpu = mocker.spy(psutil, 'cpu_percent')
+        memory = mocker.spy(psutil, 'virtual_memory')
+        
+        stats = web_portal._get_system_stats()
+        usage = web_portal._get_memory_usage()
+        web_portal._get_system_stats()
+        
+        assert cpu.call_count == 1
+        assert memory.call_count == 1
+        assert usage['percentage'] == stats['memory_percent']
+        assert {'cpu_percent', 'disk_percent', 'processes'} <= stats.keys()
+        web_portal._sampler_stop.set()
+    
+    def test_boot_time_read_once(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """Uptime polls reuse the boot timestamp instead of asking psutil each time."""
+        import psutil
+        
+        boot_time = mocker.patch.object(psutil, 'boot_time', return_value=time.time() - 100)
+        web_portal._boot_time = None
+        
+        uptimes = [web_portal._get_uptime() for _ in range(3)]
+        assert boot_time.call_count == 1
+        assert all(99 <= uptime < 200 for uptime in uptimes)
+    
+    def test_system_checks_without_psutil(self, web_portal: SkyGuardWebPortal, monkeypatch: "MonkeyPatch", mocker: "MockerFixture") -> None:
+        """With psutil missing, metrics raise ImportError and the running check falls back to the snapshot."""
+        monkeypatch.setattr('skyguard.web.app.psutil', None)
+        mocker.patch.object(web_portal, '_stat_snapshot', return_value=None)
+        
+        with pytest.raises(ImportError):
+            web_portal._sample_system_metrics()
+        assert web_portal._is_system_running() is False
+    
+    def test_range_counts_cached_until_detections_change(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """Repeated range counts hit memory until a detection is written."""
+        count = mocker.spy(web_portal.event_logger, 'get_detection_counts')
+        
+        first = web_portal._get_detections_this_week()
+        assert web_portal._get_detections_this_week() == first
+        assert web_portal._get_detections_today() >= 0
+        assert count.call_count == 1
+        
+        web_portal.event_logger.log_detection({
+            'timestamp': time.time(), 'class_name': 'bird', 'confidence': 0.9,
+            'bbox': [1, 2, 3, 4], 'center': [2, 3], 'area': 4,
+        })
+        assert web_portal._get_detections_this_week() == first + 1
+        assert count.call_count == 2
+    
+    def test_system_stats_share_one_clock_read(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """Range counts in one stats call come from one query over windows from the same instant."""
+        web_portal._get_system_metrics()
+        web_portal._sampler_stop.set()
+        now = 1_700_000_123.0
+        mocker.patch('skyguard.web.app.time.time', return_value=now)
+        counts = mocker.spy(web_portal.event_logger, 'get_detection_counts')
+        
+        stats = web_portal._get_system_stats()
+        
+        counts.assert_called_once()
+        starts = counts.call_args.args
+        assert starts[0] == web_portal._start_of_day(now)
+        assert starts[1] == (now - 7 * 86400) // 60 * 60
+        assert starts[2] == (now - 30 * 86400) // 60 * 60
+        assert {'detections_today', 'detections_this_week', 'detections_this_month'} <= stats.keys()
+    
+    def test_range_count_db_error_logged_once(
+        self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture", caplog: "LogCaptureFixture"
+    ) -> None:
+        """Database errors zero the counts and warn once; programming errors propagate."""
+        mocker.patch.object(
+            web_portal.event_logger, 'get_detection_counts',
+            side_effect=sqlite3.OperationalError('database is locked'),
+        )
+        
+        with caplog.at_level('WARNING', logger='skyguard.web.app'):
+            assert web_portal._get_detections_today() == 0
+            assert web_portal._get_detections_this_week() == 0
+        assert caplog.text.count('database is locked') == 1
+        
+        web_portal.event_logger.get_detection_counts.side_effect = TypeError('bug')
+        with pytest.raises(TypeError):
+            web_portal._get_detections_today()
+    
+    @pytest.mark.parametrize("query, expected", [("0", 1), ("-1", 1), ("100000", 500), ("abc", 50)])
+    def test_api_detections_limit_clamped(
+        self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture", query: str, expected: int
+    ) -> None:
+        """Out-of-range limits are clamped before they reach the SQL LIMIT."""
+        summaries = mocker.patch.object(web_portal.event_logger, 'get_detection_summaries', return_value=[])
+        
+        with web_portal.app.test_client() as client:
+            response = client.get(f'/api/detections?limit={query}')
+        
+        assert response.status_code == 200
+        assert response.get_json()['limit'] == expected
+        assert summaries.call_args.kwargs['limit'] == expected
+    
+    def test_api_stats_detection_counts_are_integers(self, web_portal: SkyGuardWebPortal) -> None:
+        """The stats payload carries counts only, never detection rows."""
+        with web_portal.app.test_client() as client:
+            detections = client.get('/api/stats').get_json()['detections']
+        
+        assert set(detections) == {'total', 'today', 'this_week', 'this_month'}
+        assert all(isinstance(value, int) for value in detections.values())
+    
+    def test_api_stats_conditional_get(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """Stats carry an ETag and must be revalidated; a matching If-None-Match gets a 304."""
+        mocker.patch.object(web_portal, '_get_system_stats', return_value={'detections_today': 3})
+        mocker.patch.object(web_portal, '_get_total_detections', return_value=7)
+        
+        with web_portal.app.test_client() as client:
+            first = client.get('/api/stats')
+            etag = first.headers['ETag']
+            assert first.headers['Cache-Control'] == 'no-cache'
+            
+            cached = client.get('/api/stats', headers={'If-None-Match': etag})
+            assert cached.status_code == 304
+            assert cached.data == b''
+            
+            web_portal._get_total_detections.return_value = 8
+            web_portal._response_cache.clear()  # as if the short body TTL expired
+            changed = client.get('/api/stats', headers={'If-None-Match': etag})
+            assert changed.status_code == 200
+            assert changed.get_json()['detections']['total'] == 8
+    
+    def test_api_species_stats_route(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """The species report endpoint is registered and passes ``days`` through."""
+        mocker.patch.object(web_portal.event_logger, 'get_species_stats', return_value={'total_detections': 2})
+        
+        with web_portal.app.test_client() as client:
+            response = client.get('/api/species/stats?days=7')
+            assert response.status_code == 200
+            assert response.get_json() == {'total_detections': 2}
+        web_portal.event_logger.get_species_stats.assert_called_once_with(days=7)
+    
+    def test_api_status_body_reused_within_ttl(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """Polls inside the TTL reuse the status body; expiry rebuilds it."""
+        running = mocker.patch.object(web_portal, '_is_system_running', return_value=True)
+        clock = mocker.patch('skyguard.web.app.time.monotonic', return_value=1000.0)
+        
+        with web_portal.app.test_client() as client:
+            first = client.get('/api/status')
+            clock.return_value = 1001.0
+            second = client.get('/api/status')
+            assert running.call_count == 1
+            assert second.data == first.data
+            assert second.mimetype == 'application/json'
+            
+            running.return_value = False
+            clock.return_value = 1000.0 + web_portal._response_cache_ttl
+            assert client.get('/api/status').get_json()['system']['status'] == 'stopped'
+            assert running.call_count == 2
+
+    def test_concurrent_status_misses_share_one_build(self, web_portal: SkyGuardWebPortal) -> None:
+        """Requests arriving during a rebuild wait for it instead of repeating it."""
+        release = threading.Event()
+        builds = []
+
+        def build() -> bytes:
+            builds.append(threading.current_thread())
+            release.wait(2.0)
+            return b'{"x": 1}'
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(web_portal._cached_body('status', build)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 2.0
+        while not builds and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)  # let the other requests queue behind the rebuild
+        release.set()
+        for thread in threads:
+            thread.join(2.0)
+
+        assert len(builds) == 1
+        assert results == [b'{"x": 1}'] * 4
+
+    def test_status_events_push_only_changes(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """Event streams get each distinct status body once and unsubscribe on close."""
+        mocker.patch.object(web_portal, '_status_publish_loop')  # publish by hand below
+        
+        stream = web_portal._iter_status_events(keepalive=0.01)
+        assert next(stream) == b'retry: 5000\n\n'
+        assert web_portal._status_subscribers == 1
+        
+        web_portal._publish_status(b'{"a": 1}\n')
+        assert next(stream) == b'data: {"a": 1}\n\n'
+        web_portal._publish_status(b'{"a": 1}\n')
+        assert next(stream) == b': keepalive\n\n'
+        web_portal._publish_status(b'{\n  "a": 2\n}\n')
+        assert next(stream) == b'data: {\ndata:   "a": 2\ndata: }\n\n'
+        
+        stream.close()
+        assert web_portal._status_subscribers == 0
+    
+    def test_status_publisher_stops_with_last_stream(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """The publisher thread starts with the first stream and exits after the last one closes."""
+        mocker.patch.object(web_portal, '_build_status_body', return_value=b'{"x": 1}')
+        web_portal._status_push_interval = 0.01
+        
+        stream = web_portal._iter_status_events()
+        next(stream)
+        assert next(stream) == b'data: {"x": 1}\n\n'
+        assert web_portal._status_publisher_running
+        stream.close()
+        
+        deadline = time.monotonic() + 2.0
+        while web_portal._status_publisher_running and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not web_portal._status_publisher_running
+    
+    def test_api_events_is_event_stream(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """The route serves an uncached text/event-stream."""
+        mocker.patch.object(web_portal, '_status_publish_loop')
+        
+        with web_portal.app.test_client() as client:
+            response = client.get('/api/events', buffered=False)
+            assert response.mimetype == 'text/event-stream'
+            assert response.headers['Cache-Control'] == 'no-cache'
+            assert next(response.response) == b'retry: 5000\n\n'
+            response.close()
+    
+    def test_api_events_refused_past_stream_cap(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """Streams beyond the cap get a 503 so the page polls; closing one frees its slot."""
+        mocker.patch.object(web_portal, '_status_publish_loop')
+        web_portal._max_streams = 1
+        
+        with web_portal.app.test_client() as client:
+            first = client.get('/api/events', buffered=False)
+            assert first.status_code == 200
+            
+            refused = client.get('/api/events', buffered=False)
+            assert refused.status_code == 503
+            assert 'Retry-After' in refused.headers
+            refused.close()
+            
+            first.close()
+            assert web_portal._open_streams == 0
+            again = client.get('/api/events', buffered=False)
+            assert again.status_code == 200
+            again.close()
+        assert web_portal._open_streams == 0
+    
+    def test_system_logs_read_from_tail(self, web_portal: SkyGuardWebPortal, tmp_path: Path, mocker: "MockerFixture") -> None:
+        """Only the end of a large log is read, and unchanged logs are not reparsed."""
+        log_file = tmp_path / "skyguard.log"
+        lines = [f"2024-01-01 12:{i // 60 % 60:02d}:{i % 60:02d} - skyguard.main - INFO - line {i}" for i in range(3600)]
+        log_file.write_text("\n".join(lines) + "\n")
+        web_portal.config = {**web_portal.config, 'logging': {'file': str(log_file)}}
+        web_portal._refresh_cached_flags()
+        assert web_portal._log_path == log_file
+        parse = mocker.spy(SkyGuardWebPortal, '_parse_log_lines')
+        
+        logs = web_portal._get_system_logs(limit=5)
+        assert [entry['message'] for entry in logs] == [f"line {i}" for i in range(3595, 3600)]
+        assert len(parse.call_args.args[0]) == 500  # MAX_PAGE_SIZE lines, not the whole file
+        
+        since = logs[-2]['timestamp']
+        assert [entry['message'] for entry in web_portal._get_system_logs(limit=5, since=since)] == ["line 3599"]
+        assert len(web_portal._get_system_logs(limit=5, since=1.0)) == 5  # limit still caps an old cursor
+        assert parse.call_count == 1
+        
+        with log_file.open('a') as f:
+            f.write("2024-01-01 13:00:00 - skyguard.main - ERROR - boom\nTraceback (most recent call last):\n")
+        new = web_portal._get_system_logs(limit=5, since=logs[-1]['timestamp'])
+        assert [entry['message'] for entry in new] == ["boom", "Traceback (most recent call last):"]
+        assert new[1]['timestamp'] == new[0]['timestamp']
+        assert parse.call_count == 2
+    
+    def test_read_log_tail_edges(self, tmp_path: Path) -> None:
+        """Empty files, CRLF endings, blank lines and a missing final newline."""
+        log_file = tmp_path / "edge.log"
+        log_file.write_bytes(b"")
+        assert SkyGuardWebPortal._read_log_tail(log_file, 10) == []
+        
+        log_file.write_bytes(b"first\r\n\r\nsecond\n\n  third  ")
+        assert SkyGuardWebPortal._read_log_tail(log_file, 10) == ["first", "second", "third"]
+        assert SkyGuardWebPortal._read_log_tail(log_file, 2) == ["second", "third"]
+    
+    @pytest.mark.parametrize("line", [
+        "2024-03-10 02:30:00 - skyguard.main - INFO - started",
+        "2024-01-01 12:00:00 - skyguard.web.app - WARNING - a - b - c",
+        "2024-01-01 12:00:00 - my-module - INFO - hyphenated logger",
+        "2024-01-01 12:00:00 - mod - LEVEL_2 - underscore level",
+        "2024-01-01 12:00:00 - mod - b-c - d",
+        "2024-13-01 12:00:00 - mod - INFO - bad month",
+        "2024-01-01 12:00:0x - mod - INFO - bad second",
+        "abcdefghijklmnopqrs - mod - INFO - not a time",
+        "Traceback (most recent call last):",
+    ])
+    def test_log_line_fast_path_matches_regex(self, line: str) -> None:
+        """The split/slice parser agrees with the regex and strptime on every line."""
+        match = re.match(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) - ([^-]+) - (\w+) - (.+)$', line)
+        expected = None
+        if match:
+            try:
+                expected = (datetime.strptime(match.group(1), '%Y-%m-%d %H:%M:%S').timestamp(), match.group(2).strip(),
+                            match.group(3), match.group(4))
+            except ValueError:
+                pass
+        
+        entry = SkyGuardWebPortal._parse_log_lines([line])[0]
+        if expected is None:
+            assert (entry['module'], entry['message']) == ('unknown', line)
+        else:
+            assert (entry['timestamp'], entry['module'], entry['level'], entry['message']) == expected
+    
+    def test_log_timestamps_parsed_once_per_second(self) -> None:
+        """Lines sharing a second, in one read or the next, reuse one parse."""
+        _parse_log_timestamp.cache_clear()
+        lines = [f"2024-05-01 08:00:0{i // 4} - skyguard.main - INFO - event {i}" for i in range(12)]
+        
+        first = SkyGuardWebPortal._parse_log_lines(lines)
+        again = SkyGuardWebPortal._parse_log_lines(lines[6:])
+        assert [entry['timestamp'] for entry in again] == [entry['timestamp'] for entry in first[6:]]
+        assert _parse_log_timestamp.cache_info().misses == 3
+    
+    def test_run_serves_with_waitress(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """Outside debug mode the portal is served by waitress, with streams capped to half the pool."""
+        server = mocker.patch('skyguard.web.app.waitress')
+        dev_server = mocker.patch.object(web_portal.app, 'run')
+        
+        web_portal.run(host='127.0.0.1', port=8081, threads=4)
+        
+        server.serve.assert_called_once_with(web_portal.app, host='127.0.0.1', port=8081, threads=4)
+        dev_server.assert_not_called()
+        assert web_portal._max_streams == 2
+    
+    @pytest.mark.parametrize("debug, installed", [(True, True), (False, False)])
+    def test_run_uses_dev_server(
+        self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture", debug: bool, installed: bool
+    ) -> None:
+        """Debug mode, or a missing waitress, falls back to Flask's threaded server without the reloader."""
+        server = mocker.patch('skyguard.web.app.waitress', Mock() if installed else None)
+        dev_server = mocker.patch.object(web_portal.app, 'run')
+        
+        web_portal.run(port=8081, debug=debug)
+        
+        dev_server.assert_called_once_with(
+            host='0.0.0.0', port=8081, debug=debug, use_reloader=False, threaded=True
+        )
+        if server is not None:
+            server.serve.assert_not_called()
+    
+    def test_start_of_day_cached_per_date(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """Local midnight is computed once per date and recomputed when the date changes."""
+        noon = datetime(2024, 3, 5, 12, 0).timestamp()
+        midnight = datetime(2024, 3, 5).timestamp()
+        next_midnight = datetime(2024, 3, 6).timestamp()
+        dates = mocker.patch('skyguard.web.app.date', wraps=date)
+        
+        assert web_portal._start_of_day(noon) == midnight
+        assert web_portal._start_of_day(noon + 3600) == midnight
+        assert web_portal._start_of_day(midnight) == midnight
+        assert web_portal._day_start == (midnight, next_midnight)
+        assert dates.fromtimestamp.call_count == 1
+        
+        assert web_portal._start_of_day(next_midnight) == next_midnight
+        assert web_portal._start_of_day(midnight - 1) == datetime(2024, 3, 4).timestamp()
+        assert dates.fromtimestamp.call_count == 3
+    
+    def test_api_ai_stats_species_breakdown(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """AI stats report the SQL confidence and species aggregates without fetching rows."""
+        mocker.patch.object(web_portal.event_logger, 'get_confidence_aggregates', return_value={
+            'detections': 2, 'avg': 0.7, 'min': 0.6, 'max': 0.8, 'count': 2,
+        })
+        mocker.patch.object(web_portal.event_logger, 'get_species_breakdown', return_value={
+            'total_classifications': 1, 'successful_identifications': 1,
+            'species_breakdown': {'Red-tailed Hawk': {'count': 1, 'avg_confidence': 0.7}},
+        })
+        summaries = mocker.spy(web_portal.event_logger, 'get_detection_summaries')
+        
+        with web_portal.app.test_client() as client:
+            data = json.loads(client.get('/api/ai/stats').data)
+            assert data['recent_detections_count'] == 2
+            assert data['confidence_stats'] == {'avg': 0.7, 'min': 0.6, 'max': 0.8, 'count': 2}
+            assert data['species_stats']['successful_identifications'] == 1
+            assert data['species_stats']['species_breakdown']['Red-tailed Hawk']['count'] == 1
+        summaries.assert_not_called()
+    
     def test_api_status_error_handling(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
         """Test the /api/status endpoint handles errors gracefully."""
         # Mock an exception in status check
@@ -112,6 +812,24 @@ class TestSkyGuardWebPortalAPI:
             assert len(data['detections']) == 5
             assert data['page'] == 3  # offset=10, limit=5, so page = (10/5)+1 = 3
     
+    def test_api_detections_keyset_cursor(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """Test /api/detections forwards before_id and returns the next cursor."""
+        mock_detections = [{'id': i} for i in (9, 8, 7)]
+        recent = mocker.patch.object(web_portal, '_get_recent_detections', return_value=mock_detections)
+        
+        with web_portal.app.test_client() as client:
+            response = client.get('/api/detections?limit=3&before_id=10')
+            assert response.status_code == 200
+            
+            data = json.loads(response.data)
+            assert data['next_cursor'] == 7
+            assert recent.call_args.kwargs['before_id'] == 10
+            
+            # A short page means there is nothing further to fetch
+            recent.return_value = [{'id': 1}]
+            data = json.loads(client.get('/api/detections?limit=3&before_id=7').data)
+            assert data['next_cursor'] is None
+    
     def test_api_detection_detail_success(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
         """Test the /api/detections/<id> endpoint returns specific detection."""
         mock_detection = {
@@ -133,6 +851,24 @@ class TestSkyGuardWebPortalAPI:
             assert data['id'] == 1
             assert data['class'] == 'bird'
     
+    def test_detection_detail_and_last_detection_share_keys(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """Stored records are renamed to web keys the same way in both places."""
+        record = {'id': 3, 'timestamp': 1700000000.0, 'confidence': 0.9, 'class_name': 'hawk',
+                  'species_name': 'Cooper\'s Hawk', 'metadata': {'frame': 12}}
+        mocker.patch.object(web_portal.event_logger, 'get_detection_by_id', return_value=record)
+        mocker.patch.object(web_portal.event_logger, 'get_latest_detection', return_value=record)
+        
+        with web_portal.app.test_client() as client:
+            data = client.get('/api/detections/3').get_json()
+        assert data['class'] == 'hawk'
+        assert data['species'] == "Cooper's Hawk"
+        assert data['bbox'] == [0, 0, 0, 0]
+        assert data['metadata'] == {'frame': 12}
+        
+        last = web_portal._get_last_detection()
+        assert last == {key: data[key] for key in ('id', 'timestamp', 'confidence', 'class')} | {'bbox': (0, 0, 0, 0)}
+        assert web_portal._get_last_detection([{**data, 'extra': 1}]) == {key: data[key] for key in last}
+    
     def test_api_detection_detail_not_found(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
         """Test the /api/detections/<id> endpoint handles missing detection."""
         mocker.patch.object(web_portal.event_logger, 'get_detection_by_id', return_value=None)
@@ -174,6 +910,66 @@ class TestSkyGuardWebPortalAPI:
             response = client.get('/api/detections/1/image')
             assert response.status_code == 404
     
+    def test_api_detection_segmented_falls_back_when_file_missing(
+        self, web_portal: SkyGuardWebPortal, tmp_path: Path, mocker: "MockerFixture"
+    ) -> None:
+        """A segmented path whose file is gone falls back to the plain image, then 404."""
+        image = tmp_path / "plain.jpg"
+        image.write_bytes(b"fake image data")
+        record = {'id': 1, 'image_path': str(image), 'segmented_image_path': str(tmp_path / "gone.jpg")}
+        mocker.patch.object(web_portal.event_logger, 'get_detection_by_id', return_value=record)
+        
+        with web_portal.app.test_client() as client:
+            response = client.get('/api/detections/1/segmented')
+            assert response.status_code == 200
+            assert response.data == b"fake image data"
+            
+            # Deleted by retention cleanup after the path was first resolved
+            image.unlink()
+            assert client.get('/api/detections/1/segmented').status_code == 404
+
+    def test_api_detection_image_skips_separate_existence_check(
+        self, web_portal: SkyGuardWebPortal, tmp_path: Path, mocker: "MockerFixture"
+    ) -> None:
+        """Serving an image relies on send_file's own stat, not an exists/isfile probe."""
+        image = tmp_path / "detection_1.jpg"
+        image.write_bytes(b"fake image data")
+        mocker.patch.object(
+            web_portal.event_logger, 'get_detection_by_id', return_value={'id': 1, 'image_path': str(image)}
+        )
+        exists = mocker.patch('os.path.exists', side_effect=AssertionError('exists probe'))
+        isfile = mocker.patch('os.path.isfile', side_effect=AssertionError('isfile probe'))
+
+        with web_portal.app.test_client() as client:
+            response = client.get('/api/detections/1/image')
+            assert response.status_code == 200
+            assert response.data == b"fake image data"
+
+        exists.assert_not_called()
+        isfile.assert_not_called()
+
+    def test_api_detection_image_cacheable(
+        self, web_portal: SkyGuardWebPortal, tmp_path: Path, mocker: "MockerFixture"
+    ) -> None:
+        """Detection images are immutable: long max-age plus ETag revalidation to a 304."""
+        image = tmp_path / "detection_1.jpg"
+        image.write_bytes(b"fake image data")
+        mocker.patch.object(
+            web_portal.event_logger, 'get_detection_by_id', return_value={'id': 1, 'image_path': str(image)}
+        )
+
+        with web_portal.app.test_client() as client:
+            response = client.get('/api/detections/1/image')
+            assert response.status_code == 200
+            assert response.cache_control.public
+            assert response.cache_control.immutable
+            assert response.cache_control.max_age == DETECTION_IMAGE_MAX_AGE
+            etag = response.headers['ETag']
+
+            revalidated = client.get('/api/detections/1/image', headers={'If-None-Match': etag})
+            assert revalidated.status_code == 304
+            assert revalidated.data == b""
+
     def test_api_config_get(self, web_portal: SkyGuardWebPortal) -> None:
         """Test the /api/config GET endpoint returns configuration."""
         with web_portal.app.test_client() as client:
@@ -183,6 +979,46 @@ class TestSkyGuardWebPortalAPI:
             data = json.loads(response.data)
             assert isinstance(data, dict)
     
+    def test_api_config_get_serializes_once_per_config(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """Repeated GETs reuse the cached body until the config object is replaced."""
+        web_portal.config = {'notifications': {'email': {'password': 'secret'}}}
+        serialize = mocker.spy(web_portal.app.json, 'response')
+        
+        with web_portal.app.test_client() as client:
+            first = client.get('/api/config')
+            second = client.get('/api/config')
+            assert first.data == second.data
+            assert serialize.call_count == 1
+            
+            # Redaction must not leak back into the stored config
+            assert json.loads(first.data)['notifications']['email']['password'] == "••••••••"
+            assert web_portal.config['notifications']['email']['password'] == 'secret'
+            
+            web_portal.config = {'camera': {'fps': 5}}
+            assert json.loads(client.get('/api/config').data)['camera']['fps'] == 5
+            assert serialize.call_count == 2
+    
+    @pytest.mark.parametrize("config, expected", [
+        ({'camera': {'width': 1280, 'fps': 15}}, True),
+        ({'camera': {'fps': 0}}, False),
+        ({'ai': {'confidence_threshold': 0.4, 'detection_log_level': 'detailed'}}, True),
+        ({'ai': {'nms_threshold': 1.5}}, False),
+        ({'ai': {'detection_log_level': 'verbose'}}, False),
+        ({'system': {'max_detection_history': 10.5}}, False),
+        ({'system': {'detection_interval': 'fast'}}, False),
+        ({'web': {'stats_ttl_seconds': 5}}, True),
+        ({'web': {'stats_ttl_seconds': 0}}, False),
+        ({'camera': {'height': -1}}, False),
+        ({'ai': 'yolo'}, False),
+        ({'ai': {'confidence_threshold': None}}, False),
+        ({'camera': ['width']}, False),
+        ({'notifications': {'audio': {'enabled': True}}}, True),
+        ({}, False),
+    ])
+    def test_validate_config(self, web_portal: SkyGuardWebPortal, config: dict, expected: bool) -> None:
+        """Provided fields are range/type checked; absent fields are ignored."""
+        assert web_portal._validate_config(config) is expected
+    
     def test_api_config_post_success(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
         """Test the /api/config POST endpoint updates configuration."""
         test_config = {
@@ -205,6 +1041,48 @@ class TestSkyGuardWebPortalAPI:
             data = json.loads(response.data)
             assert 'message' in data
     
+    def test_validate_config_reads_each_key_once(self, web_portal: SkyGuardWebPortal) -> None:
+        """Every checked field costs one dictionary probe, with no ``in`` pre-check."""
+        probes = []
+        
+        class CountingDict(dict):
+            def get(self, key: Any, default: Any = None) -> Any:
+                probes.append(key)
+                return super().get(key, default)
+            
+            def __contains__(self, key: object) -> bool:
+                probes.append(('in', key))
+                return super().__contains__(key)
+        
+        ai = CountingDict(confidence_threshold=0.5, nms_threshold=0.4)
+        assert web_portal._validate_config({'ai': ai}) is True
+        assert probes == ['confidence_threshold', 'nms_threshold', 'detection_log_level']
+    
+    def test_api_config_post_refreshes_cached_flags(self, web_portal: SkyGuardWebPortal, tmp_path: Path, mocker: "MockerFixture") -> None:
+        """Status payload fields derived from config follow a config update."""
+        mocker.patch.object(web_portal, '_validate_config', return_value=True)
+        mocker.patch.object(web_portal.config_manager, 'update_config')
+        mocker.patch.object(web_portal, '_restart_components')
+        
+        with web_portal.app.test_client() as client:
+            client.post('/api/config',
+                        data=json.dumps({'camera': {'fps': 12}, 'notifications': {'sms': {'enabled': True}},
+                                         'logging': {'file': str(tmp_path / 'portal.log')}}),
+                        content_type='application/json')
+            data = json.loads(client.get('/api/status').data)
+        
+        assert data['camera']['fps'] == 12
+        assert data['camera']['width'] == 640
+        assert data['notifications'] == {
+            'audio_enabled': False, 'sms_enabled': True, 'email_enabled': False, 'discord_enabled': False,
+        }
+        assert web_portal._log_path == tmp_path / 'portal.log'
+        assert web_portal._sample_interval == 2.0
+        
+        web_portal.config = {**web_portal.config, 'web': {'stats_ttl_seconds': 5}}
+        web_portal._refresh_cached_flags()
+        assert web_portal._sample_interval == 5.0
+    
     def test_api_config_post_invalid_config(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
         """Test the /api/config POST endpoint handles invalid configuration."""
         invalid_config = {'invalid': 'config'}
@@ -226,6 +1104,20 @@ class TestSkyGuardWebPortalAPI:
             response = client.post('/api/config')
             assert response.status_code == 400
     
+    def test_api_config_post_too_large(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """Bodies over the request size limit get a 413 without being parsed."""
+        from skyguard.web.app import MAX_REQUEST_BYTES
+        
+        update = mocker.patch.object(web_portal.config_manager, 'update_config')
+        body = json.dumps({'system': {'padding': 'x' * MAX_REQUEST_BYTES}})
+        
+        with web_portal.app.test_client() as client:
+            response = client.post('/api/config', data=body, content_type='application/json')
+        
+        assert response.status_code == 413
+        assert response.get_json() == {'error': 'Configuration too large'}
+        update.assert_not_called()
+    
     def test_api_camera_test_success(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
         """Test the /api/camera/test endpoint."""
         mocker.patch.object(web_portal, '_test_camera', return_value=True)
@@ -327,6 +1219,39 @@ class TestSkyGuardWebPortalAPI:
             assert data['system']['memory_usage'] == 60.2
             assert data['system']['disk_usage'] == 45.8
 
+    def test_json_provider_serializes_numpy_values(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """NumPy scalars/arrays from detector code serialize without manual conversion."""
+        import numpy as np
+        
+        pytest.importorskip("orjson")
+        mock_detections = [{
+            'id': np.int64(7),
+            'confidence': np.float32(0.5),
+            'bbox': np.array([1, 2, 3, 4]),
+        }]
+        mocker.patch.object(web_portal, '_get_recent_detections', return_value=mock_detections)
+        
+        with web_portal.app.test_client() as client:
+            response = client.get('/api/detections?limit=10')
+            assert response.status_code == 200
+            assert response.content_type == 'application/json'
+            
+            data = json.loads(response.data)
+            assert data['detections'][0] == {'id': 7, 'confidence': 0.5, 'bbox': [1, 2, 3, 4]}
+
+    
+    def test_json_provider_parses_request_bodies(self, web_portal: SkyGuardWebPortal, mocker: "MockerFixture") -> None:
+        """Request JSON is parsed by the orjson provider, and malformed bodies are a 400."""
+        orjson = pytest.importorskip("orjson")
+        loads = mocker.spy(orjson, 'loads')
+        
+        with web_portal.app.test_client() as client:
+            response = client.post('/api/config', data='{"system": ', content_type='application/json')
+        
+        assert response.status_code == 400
+        assert json.loads(response.data) == {'error': 'Invalid JSON data'}
+        assert loads.call_count == 1
+
 
 if __name__ == "__main__":
     pytest.main([__file__])